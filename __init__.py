@@ -5,6 +5,14 @@ Le meta-package libhydro est constitue des packages:
     # core qui contient les classes permettant de manipuler les objets
         hydrometriques
     # conv qui propose des convertisseurs de et vers differents formats
+    # calc qui contient des outils de calcul sur les objets hydrometriques
+
+Les packages et leurs modules sont importes a leur premier acces:
+    import libhydro
+    libhydro.core.sitehydro.Sitehydro(...)  # importe libhydro.core.sitehydro
 
 """
-__all__ = ['core', 'conv']
+__all__ = ['core', 'conv', 'calc']
+# the sub-packages are imported on first access
+from ._lazyimport import install as _install
+_install(__name__, dict((name, '.' + name) for name in __all__))
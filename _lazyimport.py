@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Module _lazyimport.
+
+Ce module prive contient la fonction:
+    # install(name, attributes) = rend paresseux les attributs d'un package
+
+Les attributs d'un package rendu paresseux (sous-modules, classes de ses
+sous-modules...) ne sont importes qu'a leur premier acces:
+    import libhydro.conv  # n'importe ni pandas ni lxml
+    libhydro.conv.xml  # importe le convertisseur xml et ses dependances
+
+Le package est remplace dans sys.modules par une instance de LazyPackage, qui
+partage les attributs du package d'origine. Les instructions
+'from package import attribut' et 'from package import *' fonctionnent
+comme pour un package ordinaire.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import types as _types
+import importlib as _importlib
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- functions -----------------------------------------------------------------
+def install(name, attributes):
+    """Make the attributes of the package name lazy.
+
+    Must be called at the end of the package __init__, as:
+        install(__name__, {'sub': '.sub', 'Class': '.module:Class'})
+
+    Arguments:
+        name (string) = le nom du package
+        attributes (dict) = {attribut: 'module' ou 'module:objet'}, les noms
+            de modules relatifs le sont au package
+
+    """
+    package = _sys.modules[name]
+    lazy = LazyPackage(name, package.__doc__)
+    lazy.__dict__.update(package.__dict__)
+    lazy._LAZY_ATTRIBUTES = dict(attributes)
+    _sys.modules[name] = lazy
+    return lazy
+
+
+#-- class LazyPackage ---------------------------------------------------------
+class LazyPackage(_types.ModuleType):
+    """Classe LazyPackage.
+
+    Package dont les attributs sont importes a leur premier acces, puis
+    conserves comme des attributs ordinaires.
+
+    """
+
+    def __getattr__(self, name):
+        # only called when the attribute is not yet loaded
+        attributes = self.__dict__.get('_LAZY_ATTRIBUTES', {})
+        if name not in attributes:
+            raise AttributeError(
+                "'module' object has no attribute '%s'" % name
+            )
+        module, _, attribute = attributes[name].partition(':')
+        value = _importlib.import_module(str(module), self.__name__)
+        if attribute:
+            value = getattr(value, attribute)
+        # the import of a sub-package sets its own attribute on the package
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(
+            set(self.__dict__) | set(self.__dict__.get('_LAZY_ATTRIBUTES', {}))
+        )
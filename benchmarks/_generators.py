@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Synthetic data generators for the benchmarks.
+
+The files are written as plain text, without libhydro, so that the
+generators do not depend on the code under measure:
+    # xml_series(dst, nseries, nobs) = a Xml Hydrometrie message with nseries
+        series of nobs observations
+    # xml_simulations(dst, nsimuls, ndates, nprobs) = a Xml Hydrometrie
+        message with nsimuls ensemble simulations of ndates dates and nprobs
+        probabilities by date
+    # hfs(dst, nobs) = a SHOM HFS file with nobs values
+
+The in memory generators return the arguments of the core constructors:
+    # observations(nobs) = a list of obshydro.Observation arguments
+    # previsions(ndates, nprobs) = a list of simulation.Prevision arguments
+
+All the generators are deterministic.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import io
+import math
+import datetime
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- config --------------------------------------------------------------------
+START = datetime.datetime(2010, 1, 1)
+STEP = datetime.timedelta(minutes=5)
+# valid codes of the nomenclatures 507 (mth) and 515 (qal)
+MTH = (0, 4, 12)
+QAL = (16, 16, 16, 20, 12)
+
+SCENARIO = """<?xml version="1.0" encoding="UTF-8"?>
+<hydrometrie>
+  <Scenario>
+    <CodeScenario>hydrometrie</CodeScenario>
+    <VersionScenario>1.1</VersionScenario>
+    <NomScenario>Echange de donnees hydrometriques</NomScenario>
+    <DateHeureCreationFichier>2010-02-26T09:30:00</DateHeureCreationFichier>
+    <Emetteur>
+      <CdIntervenant schemeAgencyID="SANDRE">1537</CdIntervenant>
+      <CdContact schemeAgencyID="SANDRE">41</CdContact>
+    </Emetteur>
+    <Destinataire>
+      <CdIntervenant schemeAgencyID="SANDRE">14</CdIntervenant>
+    </Destinataire>
+  </Scenario>
+  <Donnees>
+"""
+FOOTER = """  </Donnees>
+</hydrometrie>
+"""
+
+
+#-- functions -----------------------------------------------------------------
+def dates(n, start=START, step=STEP):
+    """Return a list of n iso formatted dates."""
+    return [(start + i * step).isoformat() for i in range(n)]
+
+
+def values(n, offset=0):
+    """Return a list of n smooth float values."""
+    return [
+        round(100 + 50 * math.sin((i + offset) / 50.0), 3) for i in range(n)
+    ]
+
+
+def observations(nobs):
+    """Return a list of nobs (dte, res, mth, qal, cnt) tuples."""
+    return [
+        (dte, res, MTH[i % len(MTH)], QAL[i % len(QAL)], i % 7 != 0)
+        for i, (dte, res) in enumerate(zip(dates(nobs), values(nobs)))
+    ]
+
+
+def previsions(ndates, nprobs):
+    """Return a list of ndates * nprobs (dte, res, prb) tuples."""
+    probs = _probs(nprobs)
+    return [
+        (dte, res + prb, prb)
+        for dte, res in zip(dates(ndates), values(ndates))
+        for prb in probs
+    ]
+
+
+def xml_series(dst, nseries, nobs):
+    """Write a Xml Hydrometrie message with nseries series of nobs obs."""
+    with io.open(dst, 'w', encoding='utf-8') as f:
+        f.write(SCENARIO)
+        f.write('    <Series>\n')
+        rows = observations(nobs)
+        for s in range(nseries):
+            f.write(
+                '      <Serie>\n'
+                '        <CdStationHydro>A%07i01</CdStationHydro>\n'
+                '        <GrdSerie>Q</GrdSerie>\n'
+                '        <StatutSerie>4</StatutSerie>\n'
+                '        <ObssHydro>\n' % s
+            )
+            f.writelines(
+                '          <ObsHydro>'
+                '<DtObsHydro>%s</DtObsHydro>'
+                '<ResObsHydro>%s</ResObsHydro>'
+                '<MethObsHydro>%i</MethObsHydro>'
+                '<QualifObsHydro>%i</QualifObsHydro>'
+                '<ContObsHydro>%s</ContObsHydro>'
+                '</ObsHydro>\n' % row
+                for row in rows
+            )
+            f.write('        </ObssHydro>\n      </Serie>\n')
+        f.write('    </Series>\n')
+        f.write(FOOTER)
+
+
+def xml_simulations(dst, nsimuls, ndates, nprobs):
+    """Write a Xml Hydrometrie message with nsimuls ensemble simulations.
+
+    Each simulation has ndates dates with a ResMoyPrev, a ResMinPrev, a
+    ResMaxPrev and nprobs ProbPrev.
+
+    """
+    probs = _probs(nprobs)
+    with io.open(dst, 'w', encoding='utf-8') as f:
+        f.write(SCENARIO)
+        f.write('    <Simuls>\n')
+        for s in range(nsimuls):
+            f.write(
+                '      <Simul>\n'
+                '        <GrdSimul>Q</GrdSimul>\n'
+                '        <DtProdSimul>2010-01-01T00:00:00</DtProdSimul>\n'
+                '        <IndiceQualiteSimul>36</IndiceQualiteSimul>\n'
+                '        <StatutSimul>4</StatutSimul>\n'
+                '        <CdSiteHydro>A%07i</CdSiteHydro>\n'
+                '        <CdModelePrevision>model_%i</CdModelePrevision>\n'
+                '        <Prevs>\n' % (s, s % 10)
+            )
+            for dte, res in zip(dates(ndates), values(ndates, s)):
+                f.write(
+                    '          <Prev><DtPrev>%s</DtPrev>'
+                    '<ResMoyPrev>%s</ResMoyPrev>'
+                    '<ResMinPrev>%s</ResMinPrev>'
+                    '<ResMaxPrev>%s</ResMaxPrev><ProbsPrev>' % (
+                        dte, res, res - 10, res + 10
+                    )
+                )
+                f.writelines(
+                    '<ProbPrev><PProbPrev>%i</PProbPrev>'
+                    '<ResProbPrev>%s</ResProbPrev>'
+                    '</ProbPrev>' % (prb, res + prb)
+                    for prb in probs
+                )
+                f.write('</ProbsPrev></Prev>\n')
+            f.write('        </Prevs>\n      </Simul>\n')
+        f.write('    </Simuls>\n')
+        f.write(FOOTER)
+
+
+def hfs(dst, nobs):
+    """Write a HFS file with nobs values."""
+    with io.open(dst, 'w', encoding='utf-8') as f:
+        f.writelines(
+            '%s  %.2f\n' % (dte.replace('T', ' '), res / 100)
+            for dte, res in zip(dates(nobs), values(nobs))
+        )
+
+
+#-- private functions ---------------------------------------------------------
+def _probs(nprobs):
+    """Return nprobs (<= 98) distinct probabilities in ]0, 100[ but 50.
+
+    0, 50 and 100 are the ResMinPrev, ResMoyPrev and ResMaxPrev ones.
+
+    """
+    candidates = [p for p in range(1, 100) if p != 50]
+    return [
+        candidates[int(i * len(candidates) / nprobs)] for i in range(nprobs)
+    ]
@@ -0,0 +1,784 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite for the libhydro hot paths.
+
+The suite times, on synthetic data of several sizes:
+    # xml_read_series = xml.Message.from_file of a message of series
+    # xml_read_series_lazy = the same with lazy decoding
+    # xml_read_series_trusted = the same with validation and trusted decoding
+    # xml_write_series = xml.Message.write of a message of series
+    # xml_read_simulations = xml.Message.from_file of a message of ensemble
+        simulations
+    # xml_read_simulations_trusted = the same with validation and trusted
+        decoding
+    # xml_write_simulations = xml.Message.write of a message of simulations
+    # xml_read_files = xml.Message.from_file of nfiles small messages, to
+        follow the per file overhead
+    # xml_peek = xml.peek of the scenario of nfiles messages of series
+    # archive_write = archive.serie_to_archive of the series of a message
+    # archive_read = archive.serie_from_archive of these series
+    # archive_window = archive.serie_from_archive of one day of each serie
+    # npy_read = numpy.load of the same observations as raw numpy arrays,
+        the reference of the archive cases
+    # hfs_read = shom.serie_from_hfs
+    # observations = obshydro.Observations(...) with its Observation
+    # previsions = simulation.Previsions(...) with its Prevision
+    # core_entities = a referential of sites, stations and capteurs
+    # regular_window = windows of a regular serie built by
+        obshydro.Serie.from_regular, without its DataFrame
+    # downsample = the lttb and minmax downsampling of a serie of nobs
+        observations to 2000 points, then 10 zooms with a pyramid
+    # panel = a SeriesPanel of the series of a message
+    # ensemble = the quantiles, exceedance probabilities and envelope of a
+        Previsions
+    # verification = the scores of the simulations of a message against
+        their observations
+    # crues = the flood events of the series of a message
+    # maree = the harmonic analysis of nobs 10 minutes tide observations,
+        then the simulation of a year of 10 minutes predictions
+    # propagation = the fit and the previsions of a lag and route model for
+        each pair of consecutive series of a message
+    # surcote = the residuals of nobs 5 minutes tide observations against
+        a simulation of 10 minutes predictions
+    # statistiques = the duration curves, annual maxima, GEV fits and
+        return levels of the series of a message
+    # import_core, import_conv = the import of libhydro.core.sitehydro and
+        of libhydro.conv in a new python process, start-up included
+
+Each case runs in a fresh python process which reports the best time of
+its runs and its peak memory (max resident set size), and for some cases
+other figures, like the files sizes of the archive_write case. The results are
+written in a json file, and can be compared to a baseline one, the
+command exiting with status 1 if a case is slower than the baseline more
+than the tolerance.
+
+The data files are generated once in the working directory, which is a
+temporary one unless the --workdir option is given.
+
+To run the benchmark:
+    python bench.py [-s SIZE] [-c CASE [CASE ...]] [-o results.json]
+                    [-b baseline.json] [-t TOLERANCE]
+
+Exemple:
+    python bench.py -s small -o baseline.json
+    ... some changes ...
+    python bench.py -s small -b baseline.json
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import argparse
+import glob
+import collections
+import datetime
+import json
+import platform
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy
+
+import _generators
+import bench_core_entities
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- config --------------------------------------------------------------------
+# nobs is the total number of observations, shared by nseries series
+SIZES = collections.OrderedDict((
+    ('tiny', {
+        'nobs': 1000, 'nseries': 1,
+        'nsimuls': 1, 'ndates': 100, 'nprobs': 9, 'nfiles': 100
+    }),
+    ('small', {
+        'nobs': 100000, 'nseries': 10,
+        'nsimuls': 10, 'ndates': 500, 'nprobs': 19, 'nfiles': 1000
+    }),
+    ('medium', {
+        'nobs': 1000000, 'nseries': 1000,
+        'nsimuls': 100, 'ndates': 1000, 'nprobs': 49, 'nfiles': 10000
+    }),
+    ('large', {
+        'nobs': 10000000, 'nseries': 10000,
+        'nsimuls': 1000, 'ndates': 1000, 'nprobs': 98, 'nfiles': 100000
+    })
+))
+SIZE = 'small'
+REPEAT = 3
+TOLERANCE = 0.1
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+#-- data files ----------------------------------------------------------------
+def series_file(workdir, size):
+    """Return the path of the series message, generated if needed."""
+    path = os.path.join(
+        workdir, 'series_{nseries}_{nobs}.xml'.format(**size)
+    )
+    if not os.path.isfile(path):
+        _generators.xml_series(
+            path, size['nseries'], size['nobs'] // size['nseries']
+        )
+    return path
+
+
+def simulations_file(workdir, size):
+    """Return the path of the simulations message, generated if needed."""
+    path = os.path.join(
+        workdir, 'simulations_{nsimuls}_{ndates}_{nprobs}.xml'.format(**size)
+    )
+    if not os.path.isfile(path):
+        _generators.xml_simulations(
+            path, size['nsimuls'], size['ndates'], size['nprobs']
+        )
+    return path
+
+
+def small_file(workdir, size):
+    """Return the path of a small simulations message, generated if needed.
+
+    The message has 1 simulation of 24 dates with 3 probabilities by date.
+
+    """
+    path = os.path.join(workdir, 'simulation_small.xml')
+    if not os.path.isfile(path):
+        _generators.xml_simulations(path, 1, 24, 3)
+    return path
+
+
+def archive_files(workdir, size):
+    """Return the directory of the archives of the series message and of
+    their observations as raw .npy files, generated if needed."""
+    from libhydro.conv import archive
+    from libhydro.conv.xml import Message
+    from libhydro.core.obshydro import Observation
+    path = os.path.join(
+        workdir, 'archives_{nseries}_{nobs}'.format(**size)
+    )
+    if not os.path.isdir(path):
+        os.mkdir(path)
+        series = Message.from_file(series_file(workdir, size)).series
+        for i, serie in enumerate(series):
+            archive.serie_to_archive(
+                serie, os.path.join(path, '{}.lha'.format(i))
+            )
+            observations = serie.observations
+            array = numpy.empty(len(observations), dtype=Observation.DTYPE)
+            array['dte'] = observations.index.values
+            for name in Observation.DTYPE.names[1:]:
+                array[name] = observations[name].values
+            numpy.save(os.path.join(path, '{}.npy'.format(i)), array)
+    return path
+
+
+def hfs_file(workdir, size):
+    """Return the path of the HFS file, generated if needed."""
+    path = os.path.join(workdir, 'MAREGRAPHE_{nobs}.hfs'.format(**size))
+    if not os.path.isfile(path):
+        _generators.hfs(path, size['nobs'])
+    return path
+
+
+#-- cases ---------------------------------------------------------------------
+# every case is a function (workdir, size) -> (callable to time, items
+# count[, dict of other figures]), with the data files generated before by
+# the parent process
+
+def case_xml_read_series(workdir, size, lazy=False, trusted=False):
+    """Read a message of series."""
+    from libhydro.conv.xml import Message
+    src = series_file(workdir, size)
+    return (
+        (lambda: Message.from_file(src, lazy=lazy, trusted=trusted)),
+        size['nobs']
+    )
+
+
+def case_xml_read_series_lazy(workdir, size):
+    """Read a message of series with lazy decoding."""
+    return case_xml_read_series(workdir, size, lazy=True)
+
+
+def case_xml_read_series_trusted(workdir, size):
+    """Read a message of series with validation and trusted decoding."""
+    return case_xml_read_series(workdir, size, trusted=True)
+
+
+def case_xml_write_series(workdir, size):
+    """Write a message of series."""
+    from libhydro.conv.xml import Message
+    msg = Message.from_file(series_file(workdir, size))
+    dst = os.path.join(workdir, 'write_series.xml')
+    return (lambda: msg.write(dst, force=True)), size['nobs']
+
+
+def case_xml_read_simulations(workdir, size, trusted=False):
+    """Read a message of ensemble simulations."""
+    from libhydro.conv.xml import Message
+    src = simulations_file(workdir, size)
+    return (
+        (lambda: Message.from_file(src, trusted=trusted)),
+        size['nsimuls'] * size['ndates'] * (size['nprobs'] + 3)
+    )
+
+
+def case_xml_read_simulations_trusted(workdir, size):
+    """Read a message of ensemble simulations with trusted decoding."""
+    return case_xml_read_simulations(workdir, size, trusted=True)
+
+
+def case_xml_write_simulations(workdir, size):
+    """Write a message of ensemble simulations."""
+    from libhydro.conv.xml import Message
+    msg = Message.from_file(simulations_file(workdir, size))
+    dst = os.path.join(workdir, 'write_simulations.xml')
+    return (
+        (lambda: msg.write(dst, force=True)),
+        size['nsimuls'] * size['ndates'] * (size['nprobs'] + 3)
+    )
+
+
+def case_xml_read_files(workdir, size):
+    """Read nfiles small messages."""
+    from libhydro.conv.xml import Message
+    src = small_file(workdir, size)
+
+    def func():
+        for _ in range(size['nfiles']):
+            Message.from_file(src)
+
+    return func, size['nfiles']
+
+
+def case_xml_peek(workdir, size):
+    """Peek the scenario of nfiles messages of series."""
+    from libhydro.conv.xml import peek
+    src = series_file(workdir, size)
+
+    def func():
+        for _ in range(size['nfiles']):
+            peek(src)
+
+    return func, size['nfiles']
+
+
+def case_archive_write(workdir, size):
+    """Write the series of a message in archives."""
+    import io
+    from libhydro.conv import archive
+    from libhydro.conv.xml import Message
+    src = series_file(workdir, size)
+    series = Message.from_file(src).series
+    sizes = {'archive': 0}
+
+    def func():
+        sizes['archive'] = 0
+        for serie in series:
+            f = io.BytesIO()
+            archive.serie_to_archive(serie, f)
+            sizes['archive'] += len(f.getvalue())
+
+    func()
+    npy = sum(
+        os.path.getsize(path) for path in
+        glob.glob(os.path.join(archive_files(workdir, size), '*.npy'))
+    )
+    return func, size['nobs'], {
+        'archive_bytes': sizes['archive'],
+        'xml_ratio': os.path.getsize(src) / sizes['archive'],
+        'npy_ratio': npy / sizes['archive']
+    }
+
+
+def case_archive_read(workdir, size):
+    """Read the archives of the series of a message."""
+    from libhydro.conv import archive
+    paths = glob.glob(os.path.join(archive_files(workdir, size), '*.lha'))
+
+    def func():
+        for path in paths:
+            archive.serie_from_archive(path).observations
+
+    return func, size['nobs']
+
+
+def case_archive_window(workdir, size):
+    """Read one day of the archives of the series of a message."""
+    from libhydro.conv import archive
+    paths = glob.glob(os.path.join(archive_files(workdir, size), '*.lha'))
+    begin = _generators.START + datetime.timedelta(days=1)
+    end = begin + datetime.timedelta(days=1)
+    begin, end = begin.isoformat(), end.isoformat()
+
+    def func():
+        for path in paths:
+            archive.serie_from_archive(path, begin, end).observations
+
+    return func, len(paths)
+
+
+def case_npy_read(workdir, size):
+    """Load the observations of the series of a message from .npy files."""
+    paths = glob.glob(os.path.join(archive_files(workdir, size), '*.npy'))
+
+    def func():
+        for path in paths:
+            numpy.load(path)
+
+    return func, size['nobs']
+
+
+def case_hfs_read(workdir, size):
+    """Read a HFS file."""
+    from libhydro.conv import shom
+    src = hfs_file(workdir, size)
+    return (lambda: shom.serie_from_hfs(src)), size['nobs']
+
+
+def case_observations(workdir, size):
+    """Build an Observations with its Observation."""
+    from libhydro.core import obshydro
+    rows = _generators.observations(size['nobs'])
+    return (
+        (
+            lambda: obshydro.Observations(
+                *[obshydro.Observation(*row) for row in rows]
+            )
+        ),
+        size['nobs']
+    )
+
+
+def case_previsions(workdir, size):
+    """Build a Previsions with its Prevision."""
+    from libhydro.core import simulation
+    rows = _generators.previsions(size['ndates'], size['nprobs'])
+    return (
+        (
+            lambda: simulation.Previsions(
+                *[simulation.Prevision(*row) for row in rows]
+            )
+        ),
+        len(rows)
+    )
+
+
+def case_panel(workdir, size):
+    """Align the series of a message in a SeriesPanel."""
+    from libhydro.conv.xml import Message
+    from libhydro.core.panel import SeriesPanel
+    series = Message.from_file(series_file(workdir, size)).series
+    return (lambda: SeriesPanel(series)), size['nobs']
+
+
+def case_regular_window(workdir, size):
+    """Slice windows of a regular serie."""
+    import numpy
+    from libhydro.core import obshydro, regularindex
+    regular = regularindex.RegularIndex(
+        '2013-01-01T00:00Z', numpy.timedelta64(5, 'm'), size['nobs'],
+        numpy.arange(100, size['nobs'] - 1, 100)
+    )
+    serie = obshydro.Serie.from_regular(
+        None, 'H', regular, numpy.arange(len(regular), dtype=float)
+    )
+    dates = regular.values[::max(len(regular) // 100, 1)]
+
+    def func():
+        for dte in dates:
+            serie.window(dte, dte + numpy.timedelta64(1, 'D'))
+
+    return func, len(dates)
+
+
+def case_downsample(workdir, size):
+    """Downsample a serie, then zoom in with a pyramid."""
+    from libhydro.core import obshydro
+    rows = _generators.observations(size['nobs'])
+    serie = obshydro.Serie.from_trusted(
+        None, 'H', 0, obshydro.Observations.from_arrays(*zip(*rows))
+    )
+    dates = serie.observations.index.values
+
+    def func():
+        serie.downsample(2000, 'lttb')
+        serie.downsample(2000, 'minmax')
+        serie._pyramid_of = None
+        for zoom in range(1, 11):
+            serie.downsample(
+                2000, begin=dates[0], end=dates[len(dates) // zoom - 1],
+                pyramid=True
+            )
+
+    return func, size['nobs']
+
+
+def case_ensemble(workdir, size):
+    """Compute the statistics of a Previsions."""
+    from libhydro.core import simulation
+    rows = _generators.previsions(size['ndates'], size['nprobs'])
+    previsions = simulation.Previsions(
+        *[simulation.Prevision(*row) for row in rows]
+    )
+
+    def func():
+        ensemble = simulation.Ensemble(previsions)
+        ensemble.quantile([10, 25, 50, 75, 90])
+        ensemble.prob_exceed(ensemble.res[0, 0])
+        ensemble.envelope()
+
+    return func, len(rows)
+
+
+def case_verification(workdir, size):
+    """Score the simulations of a message against their observations."""
+    from libhydro.conv.xml import Message
+    from libhydro.core import (sitehydro, obshydro)
+    from libhydro.calc.verification import Verification
+    message = Message.from_file(simulations_file(workdir, size))
+    nobs = 2 * size['ndates']
+    series = [
+        obshydro.Serie(
+            entite=sitehydro.Sitehydro(code='A%07i' % s),
+            grandeur='Q',
+            observations=obshydro.Observations.from_arrays(
+                _generators.dates(nobs), _generators.values(nobs)
+            )
+        )
+        for s in range(size['nsimuls'])
+    ]
+
+    def func():
+        Verification(message.simulations, series).scores(threshold=100)
+
+    return func, size['nsimuls'] * size['ndates']
+
+
+def case_crues(workdir, size):
+    """Extract the flood events of the series of a message."""
+    from libhydro.conv.xml import Message
+    from libhydro.calc import crues
+    series = Message.from_file(series_file(workdir, size)).series
+    separation = datetime.timedelta(hours=12)
+    return (
+        (lambda: crues.events(series, 140, separation=separation)),
+        size['nobs']
+    )
+
+
+def case_maree(workdir, size):
+    """Analyse a tide serie, then predict a year."""
+    from libhydro.core import obshydro, regularindex
+    from libhydro.calc import maree
+    harmonics = maree.Harmonics(
+        z0=4.5, names=['M2', 'S2', 'N2', 'K1', 'O1'],
+        amplitudes=[2.1, 0.7, 0.4, 0.1, 0.07], phases=[120, 160, 100, 80, 300]
+    )
+    regular = regularindex.RegularIndex(
+        '2013-01-01T00:00Z', numpy.timedelta64(10, 'm'), size['nobs']
+    )
+    serie = obshydro.Serie.from_regular(
+        None, 'H', regular, harmonics.predict(regular.values)
+    )
+
+    def func():
+        maree.analyse(serie).simulation(
+            '2014-01-01T00:00Z', '2014-12-31T23:50Z', strict=False
+        )
+
+    return func, size['nobs'] + 365 * 144
+
+
+def case_propagation(workdir, size):
+    """Fit and run a lag and route model for each pair of series."""
+    from libhydro.conv.xml import Message
+    from libhydro.calc import propagation
+    series = Message.from_file(series_file(workdir, size)).series
+    step = datetime.timedelta(minutes=5)
+    # a single serie is routed to itself
+    pairs = list(zip(series[:-1], series[1:])) or [(series[0], series[0])]
+
+    def run():
+        for upstream, downstream in pairs:
+            model = propagation.fit([upstream], downstream, step=step)
+            model.predict([upstream], strict=False)
+
+    return run, len(pairs)
+
+
+def case_surcote(workdir, size):
+    """Compute the residuals of a tide serie against predictions."""
+    from libhydro.core import obshydro, regularindex
+    from libhydro.calc import maree, surcote
+    harmonics = maree.Harmonics(
+        z0=4.5, names=['M2', 'S2'], amplitudes=[2.1, 0.7], phases=[120, 160]
+    )
+    regular = regularindex.RegularIndex(
+        '2013-01-01T00:00Z', numpy.timedelta64(5, 'm'), size['nobs']
+    )
+    serie = obshydro.Serie.from_regular(
+        None, 'H', regular, harmonics.predict(regular.values) + 0.1
+    )
+    simulation = harmonics.simulation(
+        regular.start, regular.date(-1), strict=False
+    )
+    # the time of an update of the last 12 observations
+    suivi = surcote.Surcote(simulation)
+    suivi.update(obshydro.Serie.from_regular(
+        None, 'H', regular[:-12], serie.observations['res'].values[:-12]
+    ))
+    start = time.time()
+    suivi.update(serie)
+    update = (time.time() - start) * 1000
+    return (
+        (lambda: surcote.residuals(serie, simulation)), size['nobs'],
+        {'update_ms': update}
+    )
+
+
+def case_statistiques(workdir, size):
+    """Compute the annual statistics of the series of a message."""
+    from libhydro.conv.xml import Message
+    from libhydro.calc import statistiques
+    series = Message.from_file(series_file(workdir, size)).series
+    # the time of a second report with all the series cached
+    report = statistiques.Report(law='gev')
+    report.compute(series)
+    start = time.time()
+    report.compute(series)
+    cached = (time.time() - start) * 1000
+    return (
+        (lambda: statistiques.Report(law='gev').compute(series)),
+        size['nobs'], {'cached_ms': cached}
+    )
+
+
+def case_import_core(workdir, size):
+    """Import libhydro.core.sitehydro in a new process."""
+    return _importer('from libhydro.core import sitehydro'), 1
+
+
+def case_import_conv(workdir, size):
+    """Import libhydro.conv in a new process."""
+    return _importer('import libhydro.conv'), 1
+
+
+def case_core_entities(workdir, size):
+    """Build a referential of nseries sites."""
+    codes = bench_core_entities.codes(size['nseries'])
+    return (lambda: bench_core_entities.build(codes)), 7 * size['nseries']
+
+
+CASES = collections.OrderedDict(
+    (name[5:], func) for name, func in sorted(globals().items())
+    if name.startswith('case_')
+)
+
+# the data files of each case, generated by the parent process
+FILES = {
+    'xml_read_series': series_file,
+    'xml_read_series_lazy': series_file,
+    'panel': series_file,
+    'xml_read_series_trusted': series_file,
+    'xml_write_series': series_file,
+    'xml_read_simulations': simulations_file,
+    'xml_read_simulations_trusted': simulations_file,
+    'verification': simulations_file,
+    'crues': series_file,
+    'statistiques': series_file,
+    'propagation': series_file,
+    'xml_write_simulations': simulations_file,
+    'xml_read_files': small_file,
+    'xml_peek': series_file,
+    'archive_write': archive_files,
+    'archive_read': archive_files,
+    'archive_window': archive_files,
+    'npy_read': archive_files,
+    'hfs_read': hfs_file
+}
+
+
+#-- functions -----------------------------------------------------------------
+def _importer(statement):
+    """Return a function running statement in a new python process."""
+    code = 'import sys; sys.path.append("../.."); {}'.format(statement)
+    return lambda: subprocess.check_call(
+        [sys.executable, '-c', code], cwd=HERE
+    )
+
+
+def maxrss():
+    """Return the peak memory of the process in MB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on Mac OS, kilobytes elsewhere
+    return rss / 2 ** (20 if sys.platform == 'darwin' else 10)
+
+
+def measure(case, workdir, size, repeat=REPEAT):
+    """Run a case in the current process and return its result dict."""
+    prepared = CASES[case](workdir, SIZES[size])
+    func, items = prepared[:2]
+    setup = maxrss()
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    result = {
+        'time': min(times),
+        'times': times,
+        'items': items,
+        'peak_mb': maxrss(),
+        'setup_mb': setup
+    }
+    if len(prepared) > 2:
+        result['info'] = prepared[2]
+    return result
+
+
+def run(case, workdir, size, repeat=REPEAT):
+    """Run a case in a child process and return its result dict."""
+    if case in FILES:
+        FILES[case](workdir, SIZES[size])
+    output = subprocess.check_output(
+        [
+            sys.executable, os.path.join(HERE, 'bench.py'), '--child', case,
+            '-s', size, '-r', str(repeat), '-d', workdir
+        ],
+        cwd=HERE
+    )
+    return json.loads(output.decode('utf-8'))
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Print the comparison of results to baseline.
+
+    Return the list of the cases slower than the baseline more than the
+    tolerance.
+
+    """
+    slower = []
+    for case, result in results['results'].items():
+        base = baseline['results'].get(case)
+        if base is None:
+            continue
+        ratio = result['time'] / base['time'] if base['time'] else 1
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  <- SLOWER'
+            slower.append(case)
+        elif ratio < 1 - tolerance:
+            flag = '  <- faster'
+        print('{0:<30} {1:>8.3f} s {2:>8.3f} s {3:>6.2f}x {4:>8.1f} MB '
+              '{5:>8.1f} MB{6}'.format(
+                  case, base['time'], result['time'], ratio,
+                  base['peak_mb'], result['peak_mb'], flag))
+    return slower
+
+
+#-- main ----------------------------------------------------------------------
+def main(argv=None):
+    """Run the benchmark and return the exit status."""
+    parser = argparse.ArgumentParser(
+        description='libhydro benchmark suite'
+    )
+    parser.add_argument(
+        '-s', '--size', choices=list(SIZES), default=SIZE,
+        help='data size (default %(default)s)'
+    )
+    parser.add_argument(
+        '-c', '--cases', nargs='+', choices=list(CASES),
+        default=list(CASES), help='cases to run (default all)'
+    )
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=REPEAT,
+        help='runs by case (default %(default)s)'
+    )
+    parser.add_argument('-o', '--output', help='json file of the results')
+    parser.add_argument('-b', '--baseline', help='json file to compare to')
+    parser.add_argument(
+        '-t', '--tolerance', type=float, default=TOLERANCE,
+        help='allowed slowdown ratio (default %(default)s)'
+    )
+    parser.add_argument('-d', '--workdir', help='data files directory')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # child process
+    if args.child:
+        print(json.dumps(
+            measure(args.child, args.workdir, args.size, args.repeat)
+        ))
+        return 0
+
+    # parent process
+    workdir = args.workdir or tempfile.mkdtemp(prefix='libhydro_bench_')
+    results = {
+        'meta': {
+            'date': datetime.datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size': args.size,
+            'sizes': SIZES[args.size],
+            'repeat': args.repeat
+        },
+        'results': collections.OrderedDict()
+    }
+    try:
+        print('size {0}: {1}'.format(args.size, SIZES[args.size]))
+        for case in args.cases:
+            result = run(case, workdir, args.size, args.repeat)
+            results['results'][case] = result
+            rate = result['items'] / result['time'] if result['time'] \
+                else float('inf')
+            print('{0:<30} {1:>8.3f} s {2:>12.0f} items/s {3:>8.1f} MB'.format(
+                case, result['time'], rate, result['peak_mb']
+            ))
+            for key, value in sorted(result.get('info', {}).items()):
+                print('    {0:<26} {1:>12.1f}'.format(key, value))
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['meta'].get('size') != args.size:
+            print('warning: baseline size is {0}'.format(
+                baseline['meta'].get('size')
+            ))
+        print('\n{0:<30} {1:>10} {2:>10} {3:>7} {4:>11} {5:>11}'.format(
+            'case', 'baseline', 'time', 'ratio', 'base mem', 'peak mem'
+        ))
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Benchmark for the hydro entities of the core package.
+
+Compare, for a referential of n sites (each with 2 stations of 2 capteurs):
+    # the memory used by the __slots__ instances and the one an instance
+        __dict__ would need for the same attributes
+    # the build time with the strict constructors, the fuzzy constructors
+        and the from_trusted constructors
+
+To run the benchmark:
+    python bench_core_entities.py [n]
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import timeit
+
+from libhydro.core import sitehydro
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- config --------------------------------------------------------------------
+N = 10000
+
+
+#-- functions -----------------------------------------------------------------
+def codes(n):
+    """Return a list of n (site, [(station, [capteur, ...]), ...]) codes."""
+    return [
+        (
+            'A%07i' % i,
+            [
+                (
+                    'A%07i%02i' % (i, j),
+                    ['A%07i%02i%02i' % (i, j, k) for k in (1, 2)]
+                )
+                for j in (1, 2)
+            ]
+        )
+        for i in range(n)
+    ]
+
+
+def build(codes, **kargs):
+    """Build the referential with the standard constructors."""
+    return [
+        sitehydro.Sitehydro(
+            code=site,
+            stations=[
+                sitehydro.Stationhydro(
+                    code=station,
+                    capteurs=[
+                        sitehydro.Capteur(code=capteur, **kargs)
+                        for capteur in capteurs
+                    ],
+                    **kargs
+                )
+                for station, capteurs in stations
+            ],
+            **kargs
+        )
+        for site, stations in codes
+    ]
+
+
+def build_trusted(codes):
+    """Build the referential with the from_trusted constructors."""
+    return [
+        sitehydro.Sitehydro.from_trusted(
+            code=site,
+            stations=[
+                sitehydro.Stationhydro.from_trusted(
+                    code=station,
+                    capteurs=[
+                        sitehydro.Capteur.from_trusted(code=capteur)
+                        for capteur in capteurs
+                    ]
+                )
+                for station, capteurs in stations
+            ]
+        )
+        for site, stations in codes
+    ]
+
+
+def sizeof(entity):
+    """Return (slots size, dict-based size) of an entity, in bytes.
+
+    The dict-based size is the instance size plus the size of a __dict__
+    holding the same attributes.
+
+    """
+    slots = [
+        slot for cls in type(entity).__mro__
+        for slot in getattr(cls, '__slots__', ())
+    ]
+    size = sys.getsizeof(entity)
+    return (
+        size,
+        size + sys.getsizeof(dict((s, getattr(entity, s)) for s in slots))
+    )
+
+
+#-- main ----------------------------------------------------------------------
+def main(n=N):
+    """Run the benchmark and print the results."""
+    data = codes(n)
+    print('Referential of {0} sites, {1} stations, {2} capteurs'.format(
+        n, 2 * n, 4 * n
+    ))
+
+    # memory
+    sites = build_trusted(data)
+    entities = []
+    for site in sites:
+        entities.append(site)
+        for station in site.stations:
+            entities.append(station)
+            entities.extend(station.capteurs)
+    slots, dicts = (sum(x) for x in zip(*(sizeof(e) for e in entities)))
+    print('memory: {0:.1f} MB with __slots__, {1:.1f} MB with __dict__ '
+          '({2:.0%} saved)'.format(
+              slots / 2 ** 20, dicts / 2 ** 20, 1 - slots / dicts))
+
+    # time
+    results = {}
+    for name, func in (
+        ('strict', lambda: build(data)),
+        ('fuzzy', lambda: build(data, strict=False)),
+        ('trusted', lambda: build_trusted(data))
+    ):
+        results[name] = min(timeit.repeat(func, number=1, repeat=3))
+        print('time: {0:>8} constructors {1:.3f} s'.format(
+            name, results[name]
+        ))
+    print('trusted constructors are {0:.1f}x faster than strict ones'.format(
+        results['strict'] / results['trusted']
+    ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
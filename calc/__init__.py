@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Package libhydro.calc.
+
+Ce package contient des outils de calcul sur les objets hydrometriques du
+package core, vectorises avec numpy.
+
+Il contient les modules:
+    # crues
+    # maree
+    # propagation
+    # statistiques
+    # surcote
+    # verification
+
+"""
+__all__ = [
+    'crues', 'maree', 'propagation', 'statistiques', 'surcote',
+    'verification'
+]
+# the modules are imported on first access
+from .._lazyimport import install as _install
+_install(__name__, dict((name, '.' + name) for name in __all__))
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Module calc._align.
+
+Ce module contient les outils d'alignement temporel des observations sur
+d'autres dates (les dates de previsions...):
+    # timeline(series, after) = les dates et les resultats d'une ou
+        plusieurs series, tries et sans doublon
+    # align(dte, res, dates) = les resultats aux dates demandees, par
+        interpolation lineaire ou a la date la plus proche
+    # nanoseconds(delta) = une duree en nanosecondes
+
+Les dates sont manipulees en nanosecondes (numpy.int64), le format interne de
+pandas.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import numpy as _numpy
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+METHODS = ('interpolation', 'nearest')
+
+
+#-- functions -----------------------------------------------------------------
+def timeline(series, after=None):
+    """Return the (dte, res) numpy.arrays of series.
+
+    The dates are int64 nanoseconds, sorted and unique, the last observation
+    of a duplicated date is kept. The NaN results are dropped.
+
+    When after (int64 nanoseconds) is given, only the observations after
+    this date are kept, found by a binary search in a sorted index.
+
+    """
+    dte, res = [], []
+    for serie in series:
+        index = serie.observations.index
+        values = index.values.astype('datetime64[ns]').view(_numpy.int64)
+        rows = slice(None)
+        if after is not None:
+            if index.is_monotonic:
+                rows = slice(values.searchsorted(after, 'right'), None)
+            else:
+                rows = values > after
+        dte.append(values[rows])
+        res.append(serie.observations['res'].values[rows])
+    if not dte:
+        return _numpy.array([], _numpy.int64), _numpy.array([], _numpy.float64)
+    dte = _numpy.concatenate(dte)
+    res = _numpy.concatenate(res).astype(_numpy.float64)
+    if not (dte[1:] > dte[:-1]).all():
+        order = dte.argsort(kind='mergesort')
+        dte, res = dte[order], res[order]
+    keep = ~_numpy.isnan(res)
+    keep[:-1] &= dte[:-1] != dte[1:]
+    return dte[keep], res[keep]
+
+
+def align(dte, res, dates, method='interpolation', tolerance=None):
+    """Return the results of the timeline (dte, res) at dates.
+
+    Arguments:
+        dte, res (numpy.array) = la timeline, voir timeline()
+        dates (numpy.array de int64) = les dates en nanosecondes
+        method (string, defaut interpolation) =
+            interpolation = interpolation lineaire entre les 2 observations
+                qui encadrent la date
+            nearest = observation la plus proche
+        tolerance (int, defaut None) = ecart maximum en nanosecondes entre
+            une date et les observations utilisees
+
+    Le resultat vaut NaN pour une date hors de la timeline ou trop eloignee
+    des observations.
+
+    """
+    if method not in METHODS:
+        raise ValueError('method must be in %s' % ', '.join(METHODS))
+    dates = _numpy.asarray(dates, dtype=_numpy.int64)
+    values = _numpy.empty(len(dates))
+    values.fill(_numpy.nan)
+    if not len(dte):
+        return values
+    last = len(dte) - 1
+    index = dte.searchsorted(dates)
+    nxt = index.clip(0, last)
+    prv = (index - 1).clip(0, last)
+    # the gaps to the bracketing observations, negative when missing
+    after = dte[nxt] - dates
+    before = dates - dte[prv]
+    before[dte[prv] > dates] = -1
+    exact = after == 0
+
+    if method == 'nearest':
+        nearest = _numpy.where(
+            (after < 0) | ((before >= 0) & (before < after)), prv, nxt
+        )
+        gap = _numpy.abs(dte[nearest] - dates)
+        values = res[nearest].copy()
+        if tolerance is not None:
+            values[gap > tolerance] = _numpy.nan
+        return values
+
+    inside = (before > 0) & (after > 0)
+    if tolerance is not None:
+        inside &= (before <= tolerance) & (after <= tolerance)
+    weight = before[inside] / (dte[nxt] - dte[prv])[inside]
+    values[inside] = res[prv][inside] + weight * (
+        res[nxt][inside] - res[prv][inside]
+    )
+    values[exact] = res[nxt][exact]
+    return values
+
+
+def nanoseconds(delta):
+    """Return the datetime.timedelta or numpy.timedelta64 delta in ns."""
+    if delta is None:
+        return None
+    return int(
+        _numpy.timedelta64(delta).astype('timedelta64[ns]').astype(
+            _numpy.int64
+        )
+    )
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""Module crues.
+
+Ce module contient la fonction:
+    # events(series, threshold, separation=None)
+
+La fonction events extrait les crues (les evenements de depassement d'un
+seuil) des obshydro.Serie d'un reseau de stations, et retourne un tableau
+des evenements indexe par le code des entites:
+    table = crues.events(series, threshold={'A1234567': 250, ...},
+                         separation=timedelta(hours=48))
+    table.ix['A1234567']  # les crues d'une entite
+
+Un evenement commence a la premiere observation superieure ou egale au seuil
+et se termine a la derniere. Deux depassements separes de moins de
+separation (de la fin de l'un au debut de l'autre) forment un seul
+evenement, pour ne retenir que des pics independants.
+
+Les colonnes du tableau sont:
+    # grandeur
+    # debut, fin = les dates de la premiere et de la derniere observation
+        au-dessus du seuil
+    # dtmax, max = la date et la valeur du pic, la premiere en cas d'egalite
+    # montee = la duree de montee, du debut de l'evenement au pic
+    # duree = la duree de l'evenement
+    # volume = le volume au-dessus du seuil, l'integrale du depassement par
+        rapport au temps en secondes, interpole lineairement entre les
+        observations et aux franchissements du seuil (m3 pour des debits en
+        m3/s)
+
+Chaque serie est traitee en une passe vectorisee, les series d'une meme
+entite et d'une meme grandeur sont fusionnees.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import numpy as _numpy
+import pandas as _pandas
+
+from . import _align
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+COLUMNS = (
+    'grandeur', 'debut', 'fin', 'dtmax', 'max', 'montee', 'duree', 'volume'
+)
+
+
+#-- functions -----------------------------------------------------------------
+def events(series, threshold, separation=None):
+    """Retourne le pandas.DataFrame des crues des series.
+
+    Le tableau est indexe par le code des entites et trie par entite,
+    grandeur et date de debut.
+
+    Arguments:
+        series (iterable de obshydro.Serie)
+        threshold (nombre ou dict) = le seuil de toutes les series, ou un
+            dict de seuils par code d'entite ou par tuple (code, grandeur).
+            Les series sans seuil sont ignorees
+        separation (datetime.timedelta, defaut None) = duree minimum entre
+            deux evenements independants, None pour ne fusionner aucun
+            depassement
+
+    """
+    separation = _align.nanoseconds(separation)
+
+    # the series by (entite, grandeur)
+    grouped = {}
+    for serie in series:
+        if (serie.entite is None) or (serie.observations is None):
+            continue
+        grouped.setdefault(
+            (serie.entite.code, serie.grandeur), []
+        ).append(serie)
+
+    # the events, series by series
+    columns = dict((key, []) for key in ('entite', ) + COLUMNS)
+    for (code, grandeur), group in sorted(grouped.items()):
+        seuil = _threshold(threshold, code, grandeur)
+        if seuil is None:
+            continue
+        found = _events(
+            *_align.timeline(group), threshold=seuil, separation=separation
+        )
+        size = len(found['debut'])
+        columns['entite'].append(_numpy.repeat(
+            _numpy.array([code], dtype=object), size
+        ))
+        columns['grandeur'].append(_numpy.repeat(
+            _numpy.array([grandeur], dtype=object), size
+        ))
+        for key, value in found.items():
+            columns[key].append(value)
+
+    # concatenate the columns
+    for key in columns:
+        if columns[key]:
+            columns[key] = _numpy.concatenate(columns[key])
+        else:
+            columns[key] = _numpy.array(
+                [], dtype=object if key in ('entite', 'grandeur') else
+                _numpy.float64 if key in ('max', 'volume') else _numpy.int64
+            )
+    for key in ('debut', 'fin', 'dtmax'):
+        columns[key] = columns[key].view('datetime64[ns]')
+    for key in ('montee', 'duree'):
+        columns[key] = columns[key].view('timedelta64[ns]')
+    return _pandas.DataFrame(
+        dict((key, columns[key]) for key in COLUMNS),
+        index=_pandas.Index(columns['entite'], name='entite'),
+        columns=list(COLUMNS)
+    )
+
+
+#-- private functions ---------------------------------------------------------
+def _threshold(threshold, code, grandeur):
+    """Return the threshold of (code, grandeur) or None."""
+    if not isinstance(threshold, dict):
+        return threshold
+    if (code, grandeur) in threshold:
+        return threshold[(code, grandeur)]
+    return threshold.get(code)
+
+
+def _events(dte, res, threshold, separation=None):
+    """Return the dict of the events columns of a timeline.
+
+    dte are sorted int64 nanoseconds and res the results without NaN, see
+    _align.timeline. The dates and durations columns are int64 nanoseconds.
+
+    """
+    size = len(res)
+    above = res >= threshold
+    # the exceedances, first and last positions
+    edges = _numpy.diff(
+        _numpy.concatenate(([0], above.view(_numpy.int8), [0]))
+    )
+    starts = _numpy.flatnonzero(edges == 1)
+    ends = _numpy.flatnonzero(edges == -1) - 1
+
+    # merge the exceedances closer than separation
+    if (separation is not None) and len(starts):
+        new = _numpy.concatenate((
+            [True], dte[starts[1:]] - dte[ends[:-1]] >= separation
+        ))
+        starts = starts[new]
+        ends = ends[_numpy.append(new[1:], True)]
+
+    nevents = len(starts)
+    if not nevents:
+        empty = _numpy.array([], dtype=_numpy.int64)
+        return {
+            'debut': empty, 'fin': empty, 'dtmax': empty,
+            'max': _numpy.array([], dtype=_numpy.float64), 'montee': empty,
+            'duree': empty, 'volume': _numpy.array([], dtype=_numpy.float64)
+        }
+
+    # the event of each observation, -1 outside the events
+    marks = _numpy.zeros(size + 1, dtype=_numpy.int64)
+    marks[starts] += 1
+    marks[ends + 1] -= 1
+    inside = marks.cumsum()[:-1] > 0
+    number = _numpy.zeros(size, dtype=_numpy.int64)
+    number[starts] = 1
+    group = _numpy.where(inside, number.cumsum() - 1, -1)
+
+    # the peaks, the first maximum of each event
+    maxs = _numpy.maximum.reduceat(res, starts)
+    candidates = _numpy.flatnonzero(
+        inside & (res == maxs[_numpy.maximum(group, 0)])
+    )
+    _, first = _numpy.unique(group[candidates], return_index=True)
+    peaks = candidates[first]
+
+    # the volumes above threshold, interval by interval
+    excess = res - threshold
+    e0, e1 = excess[:-1], excess[1:]
+    dt = _numpy.diff(dte) / 10 ** 9
+    with _numpy.errstate(divide='ignore', invalid='ignore'):
+        areas = _numpy.where(
+            (e0 >= 0) & (e1 >= 0), (e0 + e1) / 2 * dt,
+            _numpy.where(
+                (e0 < 0) & (e1 < 0), 0,
+                _numpy.maximum(e0, e1) ** 2 / _numpy.abs(e1 - e0) * dt / 2
+            )
+        )
+    owner = _numpy.where(group[:-1] >= 0, group[:-1], group[1:])
+    kept = owner >= 0
+    volumes = _numpy.bincount(
+        owner[kept], weights=areas[kept], minlength=nevents
+    )[:nevents]
+
+    return {
+        'debut': dte[starts],
+        'fin': dte[ends],
+        'dtmax': dte[peaks],
+        'max': maxs,
+        'montee': dte[peaks] - dte[starts],
+        'duree': dte[ends] - dte[starts],
+        'volume': volumes
+    }
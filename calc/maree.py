@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""Module maree.
+
+Ce module contient la classe:
+    # Harmonics
+
+et la fonction:
+    # analyse(serie, constituents, begin, end, rayleigh)
+
+Ces outils calculent localement les predictions de maree d'un maregraphe
+(Sitehydro de type MAREGRAPHE), a partir de ses observations de hauteur,
+sans passer par les fichiers HFS du SHOM:
+    harmonics = maree.analyse(serie)  # une serie H d'un an au moins
+    harmonics.predict(dates)  # les hauteurs aux dates
+    simulation = harmonics.simulation(
+        begin='2014-01-01', end='2014-12-31 23:50',
+        step=timedelta(minutes=10))
+
+L'analyse harmonique ajuste par moindres carres la hauteur moyenne z0 et
+l'amplitude et la phase de chaque composante de CONSTITUENTS:
+    h(t) = z0 + somme des amplitude x cos(vitesse x t - phase)
+avec t le temps en heures depuis EPOCH. La synthese evalue cette somme pour
+toutes les dates a la fois.
+
+Les composantes trop proches pour etre separees sur la duree des
+observations sont ignorees (critere de Rayleigh): il faut au moins 15 jours
+pour separer M2 et S2, 6 mois pour S2 et K2 et un an pour SA.
+
+Les corrections nodales (le cycle lunaire de 18,6 ans) ne sont pas
+appliquees, les predictions sont valables quelques annees autour de la
+periode analysee.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import collections as _collections
+import datetime as _datetime
+
+import numpy as _numpy
+
+from ..core import (
+    modeleprevision as _modeleprevision, simulation as _simulation
+)
+from . import _align
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the tidal constituents and their speeds in degrees per hour, by decreasing
+# importance, the order used by the Rayleigh criterion
+CONSTITUENTS = _collections.OrderedDict((
+    ('M2', 28.9841042), ('S2', 30.0), ('N2', 28.4397295),
+    ('K1', 15.0410686), ('O1', 13.9430356), ('K2', 30.0821373),
+    ('P1', 14.9589314), ('Q1', 13.3986609), ('M4', 57.9682084),
+    ('MS4', 58.9841042), ('MN4', 57.4238337), ('NU2', 28.5125831),
+    ('MU2', 27.9682084), ('2N2', 27.8953548), ('L2', 29.5284789),
+    ('T2', 29.9589333), ('J1', 15.5854433), ('OO1', 16.1391017),
+    ('M6', 86.9523127), ('M8', 115.9364166), ('MF', 1.0980331),
+    ('MM', 0.5443747), ('MSF', 1.0158958), ('SSA', 0.0821373),
+    ('SA', 0.0410686)
+))
+
+# the origin of the phases
+EPOCH = _numpy.datetime64('2000-01-01T00:00Z', 'ns')
+
+# the default Rayleigh criterion, the minimum number of cycles between two
+# constituents over the analysed period
+RAYLEIGH = 1
+
+# the default time step of the simulations
+STEP = _datetime.timedelta(minutes=10)
+
+# the code of the modeleprevision of the simulations
+MODELE = 'SCnMERharm'
+
+
+#-- class Harmonics -----------------------------------------------------------
+class Harmonics(object):
+    """Classe Harmonics.
+
+    Classe pour representer les constantes harmoniques d'un maregraphe.
+
+    Proprietes:
+        z0 (float) = hauteur moyenne
+        names (tuple de string) = les composantes, voir CONSTITUENTS
+        amplitudes (numpy.array de float) = amplitudes des composantes
+        phases (numpy.array de float) = phases des composantes en degres,
+            par rapport a EPOCH
+        entite (Stationhydro) = l'entite des simulations
+
+    """
+
+    def __init__(self, z0, names, amplitudes, phases, entite=None):
+        """Initialisation.
+
+        Arguments:
+            z0 (float)
+            names (sequence de string in CONSTITUENTS)
+            amplitudes (sequence de float)
+            phases (sequence de float) = en degres
+            entite (Stationhydro, defaut None)
+
+        """
+        self.z0 = float(z0)
+        self.names = tuple(names)
+        for name in self.names:
+            if name not in CONSTITUENTS:
+                raise ValueError('unknown constituent %s' % name)
+        self.amplitudes = _numpy.asarray(amplitudes, dtype=_numpy.float64)
+        self.phases = _numpy.asarray(phases, dtype=_numpy.float64)
+        if not (
+            len(self.names) == len(self.amplitudes) == len(self.phases)
+        ):
+            raise ValueError(
+                'names, amplitudes and phases must have the same size'
+            )
+        self.entite = entite
+
+    def predict(self, dates):
+        """Retourne le numpy.array des hauteurs aux dates.
+
+        Arguments:
+            dates (sequence de numpy.datetime64, de datetime ou de string au
+                format ISO 8601)
+
+        """
+        hours = _hours(dates)
+        speeds = _speeds(self.names)
+        heights = _numpy.repeat(self.z0, len(hours))
+        for speed, amplitude, phase in zip(
+            speeds, self.amplitudes, _numpy.radians(self.phases)
+        ):
+            heights += amplitude * _numpy.cos(speed * hours - phase)
+        return heights
+
+    def simulation(
+        self, begin, end, step=STEP, modeleprevision=None, dtprod=None,
+        strict=True
+    ):
+        """Retourne la simulation.Simulation des predictions de begin a end.
+
+        Arguments:
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601) = bornes incluses
+            step (datetime.timedelta, defaut STEP) = pas de temps
+            modeleprevision (Modeleprevision, defaut None) = par defaut le
+                modele de code MODELE
+            dtprod (string ou datetime.datetime, defaut None) = date de
+                production
+            strict (bool, defaut True) = voir simulation.Simulation
+
+        """
+        begin = _numpy.datetime64(begin).astype('datetime64[ns]').view(
+            _numpy.int64
+        )
+        end = _numpy.datetime64(end).astype('datetime64[ns]').view(
+            _numpy.int64
+        )
+        step = _align.nanoseconds(step)
+        if step <= 0:
+            raise ValueError('step must be positive')
+        dates = (begin + step * _numpy.arange(
+            max((end - begin) // step + 1, 0), dtype=_numpy.int64
+        )).view('datetime64[ns]')
+        if modeleprevision is None:
+            modeleprevision = _modeleprevision.Modeleprevision(
+                code=MODELE, libelle='Analyse harmonique', typemodele=5
+            )
+        return _simulation.Simulation(
+            entite=self.entite,
+            modeleprevision=modeleprevision,
+            grandeur='H',
+            statut=16,
+            commentaire='analyse harmonique',
+            dtprod=dtprod,
+            previsions=_simulation.Previsions.from_arrays(
+                dte=dates, res=self.predict(dates), prb=50
+            ),
+            strict=strict
+        )
+
+    def __unicode__(self):
+        """Unicode representation."""
+        return 'Constantes harmoniques de {} composantes, z0 {:.3f}, ' \
+               'principales {}'.format(
+                   len(self.names), self.z0,
+                   ', '.join(
+                       '{} {:.3f}'.format(self.names[i], self.amplitudes[i])
+                       for i in self.amplitudes.argsort()[::-1][:3]
+                   ) or '<aucune>'
+               )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- functions -----------------------------------------------------------------
+def analyse(serie, constituents=None, begin=None, end=None, rayleigh=RAYLEIGH):
+    """Retourne les Harmonics ajustees sur les observations de la serie.
+
+    Arguments:
+        serie (obshydro.Serie) = une serie de hauteurs
+        constituents (sequence de string in CONSTITUENTS, defaut None) = les
+            composantes a ajuster, par defaut toutes celles separables
+        begin, end (datetime, numpy.datetime64 ou string au format ISO 8601,
+            defaut None) = bornes incluses de la periode analysee
+        rayleigh (float, defaut RAYLEIGH) = nombre minimum de cycles entre
+            deux composantes sur la periode, 0 pour garder toutes les
+            composantes demandees
+
+    """
+    dte, res = _align.timeline([serie])
+    if begin is not None:
+        start = dte.searchsorted(_nanoseconds(begin))
+        dte, res = dte[start:], res[start:]
+    if end is not None:
+        stop = dte.searchsorted(_nanoseconds(end), 'right')
+        dte, res = dte[:stop], res[:stop]
+    if len(dte) < 2:
+        raise ValueError('not enough observations')
+    hours = (dte - EPOCH.view(_numpy.int64)) / 3.6e12
+    names = _separable(
+        CONSTITUENTS.keys() if constituents is None else constituents,
+        hours[-1] - hours[0], rayleigh
+    )
+
+    # the design matrix, a constant then a cosine and a sine by constituent
+    angles = hours[:, _numpy.newaxis] * _speeds(names)
+    matrix = _numpy.empty((len(hours), 1 + 2 * len(names)))
+    matrix[:, 0] = 1
+    matrix[:, 1::2] = _numpy.cos(angles)
+    matrix[:, 2::2] = _numpy.sin(angles)
+    if len(hours) < matrix.shape[1]:
+        raise ValueError('not enough observations')
+    coefs = _numpy.linalg.lstsq(matrix, res)[0]
+    cosines, sines = coefs[1::2], coefs[2::2]
+    return Harmonics(
+        z0=coefs[0], names=names,
+        amplitudes=_numpy.hypot(cosines, sines),
+        phases=_numpy.degrees(_numpy.arctan2(sines, cosines)) % 360,
+        entite=serie.entite
+    )
+
+
+#-- private functions ---------------------------------------------------------
+def _speeds(names):
+    """Return the speeds of the constituents in radians per hour."""
+    return _numpy.radians([CONSTITUENTS[name] for name in names])
+
+
+def _nanoseconds(dte):
+    """Return a date as int64 nanoseconds."""
+    return _numpy.datetime64(dte).astype('datetime64[ns]').view(_numpy.int64)
+
+
+def _hours(dates):
+    """Return the hours of the dates since EPOCH."""
+    dates = _numpy.asarray(dates)
+    if dates.dtype.kind != 'M':
+        dates = _numpy.asarray(dates, dtype='datetime64[ns]')
+    return (
+        dates.astype('datetime64[ns]').view(_numpy.int64) -
+        EPOCH.view(_numpy.int64)
+    ) / 3.6e12
+
+
+def _separable(names, duration, rayleigh):
+    """Return the constituents separable over duration hours.
+
+    A constituent is kept when it makes at least rayleigh cycles more or
+    less than the constant z0 and than each constituent already kept, in the
+    order of CONSTITUENTS.
+
+    """
+    for name in names:
+        if name not in CONSTITUENTS:
+            raise ValueError('unknown constituent %s' % name)
+    kept = []
+    for name in CONSTITUENTS:
+        if name not in names:
+            continue
+        speeds = [0] + [CONSTITUENTS[other] for other in kept]
+        if all(
+            abs(CONSTITUENTS[name] - speed) * duration >= 360 * rayleigh
+            for speed in speeds
+        ):
+            kept.append(name)
+    return tuple(kept)
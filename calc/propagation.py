@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+"""Module propagation.
+
+Ce module contient la classe:
+    # LagRoute
+
+et la fonction:
+    # fit(upstream, downstream, step, max_lag, widths, begin, end, tolerance,
+          probabilities)
+
+Un LagRoute est un modele a propagation empirique (type 7 de la
+NOMENCLATURE[525]): la serie d'une station aval est calculee a partir des
+series de stations amont, chacune decalee de son temps de propagation (lag)
+et amortie par une moyenne glissante (route):
+    aval(t) = intercept + somme des gain(i) x moyenne de amont(i) sur les
+              pas de temps de t - lag(i) - width(i) + 1 a t - lag(i)
+
+Le modele est ajuste sur l'historique puis produit des simulations:
+    model = propagation.fit([amont1, amont2], aval,
+                            step=timedelta(minutes=15))
+    simulation = model.predict([amont1, amont2],
+                               modeleprevision=modeleprevision)
+
+Pour chaque station amont, le lag et la largeur de la moyenne glissante sont
+ceux qui maximisent la correlation avec la station aval, calculee par FFT
+pour tous les decalages et toutes les largeurs a la fois. Les gains et
+l'intercept sont ensuite ajustes par moindres carres.
+
+L'horizon des previsions est le plus petit lag, les previsions sont faites a
+pas de temps fixe a partir de la derniere observation commune des series
+amont. Les quantiles des residus de l'ajustement donnent les previsions de
+probabilites differentes de 50.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import datetime as _datetime
+
+import numpy as _numpy
+
+from ..core import simulation as _simulation
+from . import _align
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the default time step of the models
+STEP = _datetime.timedelta(hours=1)
+
+# the default maximum lag, in time steps
+MAX_LAG = 48
+
+# the default widths of the routing windows, in time steps
+WIDTHS = (1, 2, 3, 4, 6, 8, 12)
+
+# the probabilities of the previsions
+PROBABILITIES = (10, 50, 90)
+
+
+#-- class LagRoute ------------------------------------------------------------
+class LagRoute(object):
+    """Classe LagRoute.
+
+    Classe pour representer un modele a propagation empirique.
+
+    Proprietes:
+        step (int) = pas de temps en nanosecondes
+        lags (numpy.array de int) = les temps de propagation de chaque
+            station amont, en pas de temps
+        widths (numpy.array de int) = les largeurs des moyennes glissantes,
+            en pas de temps
+        gains (numpy.array de float) = les coefficients de chaque station
+        intercept (float)
+        errors (dict) = {probabilite: quantile des residus}, pour ajouter
+            des previsions de probabilites differentes de 50
+        score (float) = le coefficient de Nash de l'ajustement
+        entite, grandeur = l'entite et la grandeur des simulations
+
+    """
+
+    def __init__(
+        self, step, lags, widths, gains, intercept=0, errors=None,
+        score=None, entite=None, grandeur=None
+    ):
+        """Initialisation.
+
+        Arguments:
+            step (datetime.timedelta ou numpy.timedelta64)
+            lags (sequence de int >= 1)
+            widths (sequence de int >= 1)
+            gains (sequence de float)
+            intercept (float, defaut 0)
+            errors (dict, defaut None) = {probabilite: erreur}
+            score (float, defaut None)
+            entite (Sitehydro ou Stationhydro, defaut None)
+            grandeur (char in NOMENCLATURE[509], defaut None)
+
+        """
+        self.step = _align.nanoseconds(step)
+        if self.step <= 0:
+            raise ValueError('step must be positive')
+        self.lags = _numpy.asarray(lags, dtype=_numpy.int64)
+        self.widths = _numpy.asarray(widths, dtype=_numpy.int64)
+        self.gains = _numpy.asarray(gains, dtype=_numpy.float64)
+        if not (len(self.lags) == len(self.widths) == len(self.gains)):
+            raise ValueError('lags, widths and gains must have the same size')
+        if (self.lags < 1).any() or (self.widths < 1).any():
+            raise ValueError('lags and widths must be at least 1')
+        self.intercept = float(intercept)
+        self.errors = dict(errors) if errors else {50: 0}
+        self.score = score
+        self.entite = entite
+        self.grandeur = grandeur
+
+    @property
+    def horizon(self):
+        """L'horizon des previsions, en pas de temps."""
+        return int(self.lags.min()) if len(self.lags) else 0
+
+    def simulate(self, upstream, begin=None, end=None, tolerance=None):
+        """Retourne les dates et les resultats du modele de begin a end.
+
+        Retourne les numpy.array (dates en datetime64[ns], resultats), a pas
+        de temps fixe, NaN quand une station amont manque.
+
+        Arguments:
+            upstream (sequence de obshydro.Serie) = une serie par station
+                amont, dans l'ordre du modele
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601, defaut None) = bornes de la periode, par defaut celle
+                des series amont prolongee de l'horizon
+            tolerance (datetime.timedelta, defaut None) = ecart maximum entre
+                un pas de temps et les observations interpolees
+
+        """
+        timelines = self._timelines(upstream)
+        begin = max(dte[0] for dte, _ in timelines) if begin is None \
+            else _bound(begin)
+        end = min(dte[-1] for dte, _ in timelines) + \
+            self.horizon * self.step if end is None else _bound(end)
+        grid = _grid(begin, end, self.step)
+        values = self._values(
+            timelines, grid, _align.nanoseconds(tolerance)
+        )
+        return grid.view('datetime64[ns]'), values
+
+    def predict(
+        self, upstream, modeleprevision=None, dtprod=None, tolerance=None,
+        strict=True
+    ):
+        """Retourne la simulation.Simulation des previsions.
+
+        Les previsions commencent apres la derniere observation commune des
+        series amont, une par pas de temps jusqu'a l'horizon, pour chaque
+        probabilite de errors.
+
+        Arguments:
+            upstream (sequence de obshydro.Serie) = une serie par station
+                amont, dans l'ordre du modele
+            modeleprevision (Modeleprevision, defaut None)
+            dtprod (string ou datetime.datetime, defaut None) = date de
+                production
+            tolerance (datetime.timedelta, defaut None) = voir simulate
+            strict (bool, defaut True) = voir simulation.Simulation
+
+        """
+        timelines = self._timelines(upstream)
+        last = min(dte[-1] for dte, _ in timelines)
+        grid = last + self.step * _numpy.arange(1, self.horizon + 1)
+        values = self._values(
+            timelines, grid, _align.nanoseconds(tolerance)
+        )
+        keep = ~_numpy.isnan(values)
+        grid, values = grid[keep], values[keep]
+        prbs = sorted(self.errors)
+        previsions = _simulation.Previsions.from_arrays(
+            dte=_numpy.repeat(grid, len(prbs)).view('datetime64[ns]'),
+            res=(values[:, _numpy.newaxis] + _numpy.array(
+                [self.errors[prb] for prb in prbs]
+            )).ravel(),
+            prb=_numpy.tile(prbs, len(grid))
+        )
+        return _simulation.Simulation(
+            entite=self.entite, modeleprevision=modeleprevision,
+            grandeur=self.grandeur, dtprod=dtprod, previsions=previsions,
+            strict=strict
+        )
+
+    def _timelines(self, upstream):
+        """Return the (dte, res) timelines of the upstream series."""
+        upstream = list(upstream)
+        if len(upstream) != len(self.lags):
+            raise ValueError(
+                'the model has %i upstream series' % len(self.lags)
+            )
+        timelines = [_align.timeline([serie]) for serie in upstream]
+        if not all(len(dte) for dte, _ in timelines):
+            raise ValueError('upstream serie without observations')
+        return timelines
+
+    def _values(self, timelines, grid, tolerance):
+        """Return the model results at the grid dates."""
+        # the upstream results are read from the first routed date on
+        first = grid[0] - (self.lags + self.widths - 1).max() * self.step
+        dates = _grid(first, grid[-1], self.step)
+        offset = len(dates) - len(grid)
+        values = _numpy.repeat(self.intercept, len(grid))
+        for (dte, res), lag, width, gain in zip(
+            timelines, self.lags, self.widths, self.gains
+        ):
+            routed = _route(
+                _align.align(dte, res, dates, tolerance=tolerance), width
+            )
+            values += gain * routed[offset - lag:len(routed) - lag]
+        return values
+
+    def __unicode__(self):
+        """Unicode representation."""
+        return 'Modele de propagation de {} stations amont au pas de {}, ' \
+               'lags {}, largeurs {}, score {}'.format(
+                   len(self.lags),
+                   _datetime.timedelta(microseconds=self.step // 1000),
+                   self.lags.tolist(), self.widths.tolist(),
+                   '<sans>' if self.score is None else
+                   '{:.3f}'.format(self.score)
+               )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- functions -----------------------------------------------------------------
+def fit(
+    upstream, downstream, step=STEP, max_lag=MAX_LAG, widths=WIDTHS,
+    begin=None, end=None, tolerance=None, probabilities=PROBABILITIES
+):
+    """Retourne le LagRoute ajuste sur l'historique.
+
+    Arguments:
+        upstream (sequence de obshydro.Serie) = une serie par station amont
+        downstream (obshydro.Serie) = la serie de la station aval
+        step (datetime.timedelta, defaut STEP) = pas de temps du modele
+        max_lag (int, defaut MAX_LAG) = plus grand lag teste, en pas de
+            temps
+        widths (sequence de int >= 1, defaut WIDTHS) = largeurs testees
+        begin, end (datetime, numpy.datetime64 ou string au format ISO 8601,
+            defaut None) = bornes de la periode d'ajustement, par defaut
+            celle de la serie aval
+        tolerance (datetime.timedelta, defaut None) = ecart maximum entre un
+            pas de temps et les observations interpolees
+        probabilities (sequence de int entre 0 et 100, defaut
+            PROBABILITIES) = probabilites des previsions
+
+    """
+    step = _align.nanoseconds(step)
+    tolerance = _align.nanoseconds(tolerance)
+    widths = _numpy.unique(_numpy.asarray(widths, dtype=_numpy.int64))
+    if (max_lag < 1) or (widths < 1).any():
+        raise ValueError('max_lag and widths must be at least 1')
+    dte, res = _align.timeline([downstream])
+    if not len(dte):
+        raise ValueError('downstream serie without observations')
+    grid = _grid(
+        dte[0] if begin is None else _bound(begin),
+        dte[-1] if end is None else _bound(end), step
+    )
+    target = _align.align(dte, res, grid, tolerance=tolerance)
+    # the upstream results, read from the first routed date on
+    margin = max_lag + widths[-1] - 1
+    dates = _grid(grid[0] - margin * step, grid[-1], step)
+    sources = [
+        _align.align(*_align.timeline([serie]), dates=dates,
+                     tolerance=tolerance)
+        for serie in upstream
+    ]
+    if not sources:
+        raise ValueError('no upstream serie')
+
+    # the lag and width of each upstream serie
+    lags = _numpy.empty(len(sources), dtype=_numpy.int64)
+    best = _numpy.empty(len(sources), dtype=_numpy.int64)
+    for i, source in enumerate(sources):
+        lags[i], best[i] = _correlate(
+            target, _numpy.column_stack(
+                [
+                    _route(source, width)[margin - max_lag:]
+                    for width in widths
+                ]
+            ), max_lag
+        )
+    best = widths[best]
+
+    # the gains and the intercept by least squares
+    columns = _numpy.column_stack(
+        [
+            _route(source, width)[margin - lag:len(source) - lag]
+            for source, lag, width in zip(sources, lags, best)
+        ] + [_numpy.ones(len(grid))]
+    )
+    valid = ~(_numpy.isnan(target) | _numpy.isnan(columns).any(axis=1))
+    if valid.sum() < columns.shape[1]:
+        raise ValueError('not enough common observations')
+    coefs = _numpy.linalg.lstsq(columns[valid], target[valid])[0]
+    residuals = target[valid] - columns[valid].dot(coefs)
+    total = ((target[valid] - target[valid].mean()) ** 2).sum()
+    score = 1 - (residuals ** 2).sum() / total if total else None
+    errors = dict(
+        (int(prb), 0 if prb == 50 else
+         float(_numpy.percentile(residuals, prb)))
+        for prb in probabilities
+    )
+    return LagRoute(
+        step=_numpy.timedelta64(step, 'ns'), lags=lags, widths=best,
+        gains=coefs[:-1], intercept=coefs[-1], errors=errors, score=score,
+        entite=downstream.entite, grandeur=downstream.grandeur
+    )
+
+
+#-- private functions ---------------------------------------------------------
+def _bound(dte):
+    """Return a date as int64 nanoseconds."""
+    return int(
+        _numpy.datetime64(dte).astype('datetime64[ns]').view(_numpy.int64)
+    )
+
+
+def _grid(begin, end, step):
+    """Return the int64 dates from begin to end by step."""
+    return begin + step * _numpy.arange(
+        max((end - begin) // step + 1, 0), dtype=_numpy.int64
+    )
+
+
+def _route(values, width):
+    """Return the trailing moving averages of values over width steps.
+
+    The first width - 1 averages and those of a window with a NaN are NaN.
+
+    """
+    missing = _numpy.isnan(values)
+    cumsum = _numpy.concatenate(
+        ([0], _numpy.where(missing, 0, values).cumsum())
+    )
+    nans = _numpy.concatenate(([0], missing.cumsum()))
+    routed = _numpy.empty(len(values))
+    routed.fill(_numpy.nan)
+    routed[width - 1:] = (cumsum[width:] - cumsum[:len(cumsum) - width]) / \
+        width
+    routed[width - 1:][nans[width:] > nans[:len(nans) - width]] = _numpy.nan
+    return routed
+
+
+def _correlate(target, sources, max_lag):
+    """Return the (lag, column) of sources most correlated with target.
+
+    target is an array of n values and sources an array of (n + max_lag)
+    rows, the row max_lag + t of sources being at the date t of target. The
+    correlations of all the lags from 1 to max_lag and all the columns are
+    computed by FFT, over the standardized values, NaN set to 0.
+
+    """
+    x = _standardize(sources)
+    y = _standardize(target[:, _numpy.newaxis])
+    size = 1
+    while size < len(x) + len(y):
+        size *= 2
+    # the sum over t of y[t] x[t + max_lag - lag] at the index max_lag - lag
+    products = _numpy.fft.irfft(
+        _numpy.fft.rfft(x, size, axis=0) *
+        _numpy.conj(_numpy.fft.rfft(y, size, axis=0)),
+        size, axis=0
+    )[:max_lag]
+    lag, column = _numpy.unravel_index(
+        products.argmax(), products.shape
+    )
+    return max_lag - lag, column
+
+
+def _standardize(values):
+    """Return the columns of values centered and reduced, NaN set to 0."""
+    with _numpy.errstate(invalid='ignore', divide='ignore'):
+        values = values - _nanmean(values)
+        values = values / _numpy.sqrt(_nanmean(values ** 2))
+    values[_numpy.isnan(values)] = 0
+    return values
+
+
+def _nanmean(values):
+    """Return the means of the columns of values, the NaN being ignored."""
+    valid = ~_numpy.isnan(values)
+    return _numpy.where(valid, values, 0).sum(axis=0) / valid.sum(axis=0)
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+"""Module statistiques.
+
+Ce module contient la classe:
+    # Report
+
+et les fonctions:
+    # duration_curves(source, probabilities)
+    # annual_maxima(source, start_month, min_count)
+    # fit(maxima, law)
+    # return_levels(parameters, periods)
+
+Ces fonctions calculent les statistiques annuelles des series d'un reseau de
+stations, une obshydro.Serie par entite ou un panel.SeriesPanel:
+    curves = statistiques.duration_curves(series)  # les debits classes
+    maxima = statistiques.annual_maxima(series, start_month=9)
+    parameters = statistiques.fit(maxima, law='gev')
+    statistiques.return_levels(parameters, periods=[10, 100])
+
+Les resultats sont des pandas.DataFrame avec une colonne par entite (les
+codes des entites des series ou les cles du panel). Les series d'une meme
+entite sont fusionnees, elles doivent etre d'une meme grandeur.
+
+Les courbes des debits classes sont les quantiles de la periode, calcules
+apres un seul tri des resultats de chaque serie. Chaque observation a le
+meme poids, les series doivent etre a pas de temps fixe.
+
+Les lois de Gumbel et GEV (Generalized Extreme Value) sont ajustees par la
+methode des L-moments (Hosking, 1990) pour toutes les entites a la fois:
+    # gumbel = F(x) = exp(-exp(-(x - loc) / scale))
+    # gev = F(x) = exp(-(1 - shape * (x - loc) / scale) ** (1 / shape)),
+        la convention de signe de Hosking, shape < 0 pour une queue lourde
+
+Un Report conserve les calculs couteux (tri, maximums annuels) par entite et
+periode, et ne recalcule que les series modifiees:
+    report = statistiques.Report(law='gev')
+    report.compute(series, begin='1970-01-01', end='2013-12-31')
+    ...
+    report.compute(series, begin='1970-01-01', end='2013-12-31')
+    report.computed  # les entites recalculees
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import math as _math
+import zlib as _zlib
+
+import numpy as _numpy
+import pandas as _pandas
+
+from ..core import panel as _panel
+from . import _align
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the default probabilities of exceedance of the duration curves, in percent
+DURATION = (1, 5, 10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 99)
+
+# the default return periods, in years
+PERIODS = (2, 5, 10, 20, 50, 100)
+
+LAWS = ('gumbel', 'gev')
+
+# the Euler-Mascheroni constant
+EULER = 0.5772156649015329
+
+# the minimum number of maxima of the fits
+MIN_MAXIMA = {'gumbel': 2, 'gev': 3}
+
+
+#-- class Report --------------------------------------------------------------
+class Report(object):
+    """Classe Report.
+
+    Classe pour calculer les statistiques annuelles d'un reseau, avec un
+    cache par entite et periode.
+
+    Proprietes:
+        probabilities (sequence de nombres) = voir duration_curves
+        periods (sequence de nombres) = voir return_levels
+        law (string in LAWS) = voir fit
+        start_month, min_count (int) = voir annual_maxima
+        cache (dict) = {(entite, debut, fin): (empreinte, courbe, maximums)}
+        computed (liste) = les entites recalculees au dernier appel de
+            compute
+
+    Une serie est recalculee quand ses observations de la periode ont
+    change, d'apres une empreinte de leurs dates et resultats.
+
+    """
+
+    def __init__(
+        self, probabilities=DURATION, periods=PERIODS, law='gev',
+        start_month=1, min_count=1
+    ):
+        """Initialisation.
+
+        Arguments:
+            probabilities (sequence de nombres, defaut DURATION)
+            periods (sequence de nombres, defaut PERIODS)
+            law (string in LAWS, defaut gev)
+            start_month (int, defaut 1)
+            min_count (int, defaut 1)
+
+        """
+        _check(law)
+        self.probabilities = tuple(probabilities)
+        self.periods = tuple(periods)
+        self.law = law
+        self.start_month = start_month
+        self.min_count = min_count
+        self.cache = {}
+        self.computed = []
+
+    def compute(self, source, begin=None, end=None):
+        """Retourne les statistiques de la periode de begin a end.
+
+        Retourne un dict de pandas.DataFrame, voir les fonctions du module:
+            duration = les courbes des debits classes
+            maxima = les maximums annuels
+            parameters = les parametres des lois ajustees
+            levels = les valeurs de retour
+
+        Arguments:
+            source (iterable de obshydro.Serie ou panel.SeriesPanel)
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601, defaut None) = bornes incluses de la periode, None pour
+                ne pas borner
+
+        """
+        begin, end = _bound(begin), _bound(end)
+        self.computed = []
+        keys, curves, maxima = [], [], []
+        for key, dte, res in _timelines(source, begin, end):
+            digest = _digest(dte, res)
+            cached = self.cache.get((key, begin, end))
+            if (cached is None) or (cached[0] != digest):
+                cached = self.cache[(key, begin, end)] = (
+                    digest,
+                    _quantiles(_numpy.sort(res), self.probabilities),
+                    _annual_maxima(
+                        dte, res, self.start_month, self.min_count
+                    )
+                )
+                self.computed.append(key)
+            keys.append(key)
+            curves.append(cached[1])
+            maxima.append(cached[2])
+
+        duration = _duration_frame(keys, curves, self.probabilities)
+        maxima = _maxima_frame(keys, maxima)
+        parameters = fit(maxima, self.law)
+        return {
+            'duration': duration,
+            'maxima': maxima,
+            'parameters': parameters,
+            'levels': return_levels(parameters, self.periods)
+        }
+
+
+#-- functions -----------------------------------------------------------------
+def duration_curves(source, probabilities=DURATION):
+    """Retourne les courbes des debits classes.
+
+    Retourne un pandas.DataFrame indexe par les probabilites, avec une
+    colonne par entite: la valeur depassee pendant probabilite % du temps,
+    interpolee lineairement entre les observations triees. Une entite sans
+    observation vaut NaN.
+
+    Arguments:
+        source (iterable de obshydro.Serie ou panel.SeriesPanel)
+        probabilities (sequence de nombres entre 0 et 100, defaut
+            DURATION) = les probabilites de depassement
+
+    """
+    keys, curves = [], []
+    for key, _, res in _timelines(source):
+        keys.append(key)
+        curves.append(_quantiles(_numpy.sort(res), probabilities))
+    return _duration_frame(keys, curves, probabilities)
+
+
+def annual_maxima(source, start_month=1, min_count=1):
+    """Retourne les maximums annuels.
+
+    Retourne un pandas.DataFrame indexe par les annees, avec une colonne par
+    entite, NaN pour une annee sans assez d'observations.
+
+    Arguments:
+        source (iterable de obshydro.Serie ou panel.SeriesPanel)
+        start_month (int, defaut 1) = le premier mois de l'annee
+            hydrologique, une annee est designee par l'annee de son debut
+        min_count (int, defaut 1) = nombre minimum d'observations d'une
+            annee
+
+    """
+    keys, maxima = [], []
+    for key, dte, res in _timelines(source):
+        keys.append(key)
+        maxima.append(_annual_maxima(dte, res, start_month, min_count))
+    return _maxima_frame(keys, maxima)
+
+
+def fit(maxima, law='gumbel'):
+    """Retourne les parametres des lois ajustees aux maximums annuels.
+
+    Retourne un pandas.DataFrame indexe par les entites, avec les colonnes
+    n (le nombre de maximums), loc, scale et pour la loi gev shape. Les
+    parametres valent NaN pour une entite avec trop peu de maximums.
+
+    Arguments:
+        maxima (pandas.DataFrame) = une colonne de maximums par entite, les
+            NaN sont ignores, voir annual_maxima
+        law (string in LAWS, defaut gumbel)
+
+    """
+    _check(law)
+    values = _numpy.asarray(maxima.values, dtype=_numpy.float64).reshape(
+        len(maxima.index), len(maxima.columns)
+    )
+    n, l1, l2, l3 = _lmoments(values)
+    with _numpy.errstate(divide='ignore', invalid='ignore'):
+        if law == 'gumbel':
+            scale = l2 / _math.log(2)
+            loc = l1 - EULER * scale
+            data = {'n': n, 'loc': loc, 'scale': scale}
+        else:
+            t3 = l3 / l2
+            c = 2 / (3 + t3) - _math.log(2) / _math.log(3)
+            shape = 7.8590 * c + 2.9554 * c ** 2
+            gamma = _gamma(1 + shape)
+            scale = l2 * shape / ((1 - 2 ** -shape) * gamma)
+            loc = l1 - scale * (1 - gamma) / shape
+            data = {'n': n, 'loc': loc, 'scale': scale, 'shape': shape}
+    invalid = n < MIN_MAXIMA[law]
+    for key in data:
+        if key != 'n':
+            data[key][invalid] = _numpy.nan
+    data['n'] = n.astype(_numpy.int64)
+    columns = ['n', 'loc', 'scale'] + (['shape'] if law == 'gev' else [])
+    return _pandas.DataFrame(
+        data, index=_pandas.Index(list(maxima.columns), name='entite'),
+        columns=columns
+    )
+
+
+def return_levels(parameters, periods=PERIODS):
+    """Retourne les valeurs de retour.
+
+    Retourne un pandas.DataFrame indexe par les periodes de retour, avec une
+    colonne par entite: la valeur depassee en moyenne une annee sur periode.
+
+    Arguments:
+        parameters (pandas.DataFrame) = les parametres d'une loi, voir fit,
+            la loi est gev si la colonne shape est presente, sinon gumbel
+        periods (sequence de nombres > 1, defaut PERIODS) = periodes de
+            retour en annees
+
+    """
+    periods = _numpy.asarray(periods, dtype=_numpy.float64)
+    if (periods <= 1).any():
+        raise ValueError('periods must be greater than 1')
+    # the reduced Gumbel variable of the periods
+    y = -_numpy.log(-_numpy.log(1 - 1 / periods))[:, _numpy.newaxis]
+    loc = parameters['loc'].values[_numpy.newaxis, :]
+    scale = parameters['scale'].values[_numpy.newaxis, :]
+    levels = loc + scale * y
+    if 'shape' in parameters:
+        shape = parameters['shape'].values[_numpy.newaxis, :]
+        with _numpy.errstate(divide='ignore', invalid='ignore'):
+            gev = loc + scale / shape * (1 - _numpy.exp(-shape * y))
+        # the Gumbel limit for a null shape
+        levels = _numpy.where(_numpy.abs(shape) < 1e-9, levels, gev)
+    return _pandas.DataFrame(
+        levels, index=_pandas.Index(periods, name='periode'),
+        columns=list(parameters.index)
+    )
+
+
+#-- private functions ---------------------------------------------------------
+def _check(law):
+    """Raise a ValueError for an unknown law."""
+    if law not in LAWS:
+        raise ValueError('law must be in %s' % ', '.join(LAWS))
+
+
+def _bound(dte):
+    """Return a bound as int64 nanoseconds or None."""
+    if dte is None:
+        return None
+    return int(
+        _numpy.datetime64(dte).astype('datetime64[ns]').view(_numpy.int64)
+    )
+
+
+def _timelines(source, begin=None, end=None):
+    """Yield the (key, dte, res) of the series or the panel source.
+
+    dte are sorted int64 nanoseconds and res the results without NaN, from
+    begin to end (int64 nanoseconds or None).
+
+    """
+    if isinstance(source, _panel.SeriesPanel):
+        dte = source.index.astype('datetime64[ns]').view(_numpy.int64)
+        columns = [
+            (key, dte, source.res[:, j]) for j, key in enumerate(source.keys)
+        ]
+    else:
+        grouped = {}
+        keys = []
+        for serie in source:
+            if serie.observations is None:
+                continue
+            if serie.entite.code not in grouped:
+                keys.append(serie.entite.code)
+            grouped.setdefault(serie.entite.code, []).append(serie)
+        columns = [
+            (key, ) + _align.timeline(grouped[key]) for key in keys
+        ]
+    for key, dte, res in columns:
+        start = 0 if begin is None else dte.searchsorted(begin)
+        stop = len(dte) if end is None else dte.searchsorted(end, 'right')
+        dte, res = dte[start:stop], res[start:stop]
+        valid = ~_numpy.isnan(res)
+        yield key, dte[valid], res[valid]
+
+
+def _digest(dte, res):
+    """Return the fingerprint of a timeline, its size and checksum."""
+    checksum = _zlib.crc32(_numpy.ascontiguousarray(dte))
+    return len(dte), _zlib.crc32(_numpy.ascontiguousarray(res), checksum)
+
+
+def _quantiles(values, probabilities):
+    """Return the values exceeded probabilities % of the sorted values."""
+    q = 1 - _numpy.asarray(probabilities, dtype=_numpy.float64) / 100
+    if ((q < 0) | (q > 1)).any():
+        raise ValueError('probabilities must be between 0 and 100')
+    size = len(values)
+    if not size:
+        return _numpy.repeat(_numpy.nan, len(q))
+    h = (size - 1) * q
+    lo = _numpy.floor(h).astype(_numpy.int64)
+    hi = _numpy.minimum(lo + 1, size - 1)
+    return values[lo] + (h - lo) * (values[hi] - values[lo])
+
+
+def _annual_maxima(dte, res, start_month, min_count):
+    """Return the (years, maxima) arrays of a timeline."""
+    if not len(dte):
+        return (
+            _numpy.array([], dtype=_numpy.int64),
+            _numpy.array([], dtype=_numpy.float64)
+        )
+    months = dte.view('datetime64[ns]').astype('datetime64[M]').view(
+        _numpy.int64
+    )
+    years = (months - (start_month - 1)) // 12 + 1970
+    starts = _numpy.flatnonzero(
+        _numpy.concatenate(([True], years[1:] != years[:-1]))
+    )
+    maxima = _numpy.maximum.reduceat(res, starts)
+    counts = _numpy.diff(_numpy.append(starts, len(res)))
+    maxima[counts < min_count] = _numpy.nan
+    return years[starts], maxima
+
+
+def _duration_frame(keys, curves, probabilities):
+    """Return the DataFrame of the duration curves."""
+    return _pandas.DataFrame(
+        _numpy.array(curves, dtype=_numpy.float64).reshape(
+            len(keys), len(probabilities)
+        ).T,
+        index=_pandas.Index(list(probabilities), name='probabilite'),
+        columns=keys
+    )
+
+
+def _maxima_frame(keys, maxima):
+    """Return the DataFrame of the (years, maxima) of each key."""
+    years = _numpy.unique(_numpy.concatenate(
+        [_numpy.array([], dtype=_numpy.int64)] + [y for y, _ in maxima]
+    ))
+    values = _numpy.empty((len(years), len(keys)))
+    values.fill(_numpy.nan)
+    for j, (y, m) in enumerate(maxima):
+        values[years.searchsorted(y), j] = m
+    return _pandas.DataFrame(
+        values, index=_pandas.Index(years, name='annee'), columns=keys
+    )
+
+
+def _lmoments(values):
+    """Return the (n, l1, l2, l3) arrays of the sample L-moments of each
+    column of values, the NaN being ignored."""
+    n = (~_numpy.isnan(values)).sum(axis=0).astype(_numpy.float64)
+    ordered = _numpy.sort(values, axis=0)  # NaN last
+    ranks = _numpy.arange(len(values), dtype=_numpy.float64)[:, _numpy.newaxis]
+    ordered = _numpy.where(ranks < n, ordered, 0)
+    # the probability weighted moments
+    with _numpy.errstate(divide='ignore', invalid='ignore'):
+        b0 = ordered.sum(axis=0) / n
+        b1 = (ordered * ranks).sum(axis=0) / (n * (n - 1))
+        b2 = (ordered * ranks * (ranks - 1)).sum(axis=0) / \
+            (n * (n - 1) * (n - 2))
+    return n, b0, 2 * b1 - b0, 6 * b2 - 6 * b1 + b0
+
+
+def _gamma(values):
+    """Return the gamma function of the values, NaN out of its domain."""
+    def gamma(value):
+        try:
+            return _math.gamma(value)
+        except (ValueError, OverflowError):
+            return _numpy.nan
+    return _numpy.array([gamma(value) for value in values], dtype=float)
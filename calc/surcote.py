@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Module surcote.
+
+Ce module contient la classe:
+    # Surcote
+
+et la fonction:
+    # residuals(serie, simulation, method, tolerance)
+
+Ces outils calculent les surcotes d'un maregraphe, les residus entre les
+hauteurs observees et les predictions de maree (du SHOM, voir
+shom.simulation_from_hfs, ou de maree.Harmonics.simulation):
+    residus = surcote.residuals(serie, simulation)  # une obshydro.Serie
+
+Les previsions de probabilite 50 de la simulation sont interpolees a la date
+de chaque observation, les pas de temps des observations et des previsions
+peuvent etre differents. Une observation hors de la periode des previsions
+n'a pas de residu.
+
+Un objet Surcote calcule les residus au fil de l'eau, sans realigner
+l'historique: chaque mise a jour ne traite que les observations posterieures
+au dernier residu calcule:
+    suivi = surcote.Surcote(simulation)
+    suivi.update(serie)  # les nouveaux residus
+    ...
+    suivi.update(serie)  # la serie completee de nouvelles observations
+    suivi.serie  # tous les residus
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+
+import numpy as _numpy
+import pandas as _pandas
+
+from ..core import obshydro as _obshydro
+from . import _align
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class Surcote -------------------------------------------------------------
+class Surcote(object):
+    """Classe Surcote.
+
+    Classe pour calculer au fil de l'eau les residus des observations d'un
+    maregraphe par rapport aux predictions d'une simulation.
+
+    Proprietes:
+        simulation (simulation.Simulation) = les predictions
+        method (string in _align.METHODS) = voir residuals
+        tolerance (int) = voir residuals, en nanosecondes
+        last (numpy.datetime64 ou None) = la date du dernier residu calcule
+        serie (obshydro.Serie) = tous les residus calcules, en lecture seule
+
+    """
+
+    def __init__(self, simulation, method='interpolation', tolerance=None):
+        """Initialisation.
+
+        Arguments:
+            simulation (simulation.Simulation) = avec des previsions de
+                probabilite 50
+            method (string in _align.METHODS, defaut interpolation)
+            tolerance (datetime.timedelta, defaut None)
+
+        """
+        if method not in _align.METHODS:
+            raise ValueError(
+                'method must be in %s' % ', '.join(_align.METHODS)
+            )
+        self.simulation = simulation
+        self.method = method
+        self.tolerance = _align.nanoseconds(tolerance)
+        # the predictions timeline, int64 nanoseconds and results
+        ensemble = simulation.ensemble
+        if (ensemble is None) or (50 not in ensemble.prb):
+            raise ValueError('simulation without previsions of probability 50')
+        res = ensemble.res[:, ensemble.prb.searchsorted(50)]
+        valid = ~_numpy.isnan(res)
+        self._dte = ensemble.dte.view(_numpy.int64)[valid]
+        self._res = res[valid]
+        # the (dte, res) chunks of residuals, and the first observed serie
+        # that gives its entite, grandeur and statut to the residuals
+        self._chunks = []
+        self._observed = None
+        self._cache = None
+        self.last = None
+
+    @property
+    def serie(self):
+        """Tous les residus calcules."""
+        if self._observed is None:
+            return None
+        if self._cache is None:
+            if len(self._chunks) != 1:
+                self._chunks = [_concatenate(self._chunks)]
+            self._cache = self._residuals(*self._chunks[0])
+        return self._cache
+
+    def update(self, serie):
+        """Retourne la obshydro.Serie des nouveaux residus de serie.
+
+        Seules les observations posterieures au dernier residu calcule sont
+        traitees, les autres sont ignorees.
+
+        Arguments:
+            serie (obshydro.Serie) = les hauteurs observees
+
+        """
+        grandeur = self.simulation.grandeur
+        if (serie.grandeur is not None) and (grandeur is not None) and \
+                (serie.grandeur != grandeur):
+            raise ValueError('serie and simulation grandeurs differ')
+        after = None if self.last is None else \
+            int(self.last.astype('datetime64[ns]').view(_numpy.int64))
+        if serie.observations is None:
+            dte, res = _concatenate([])
+        else:
+            dte, res = _align.timeline([serie], after=after)
+        predictions = _align.align(
+            self._dte, self._res, dte, method=self.method,
+            tolerance=self.tolerance
+        )
+        valid = ~_numpy.isnan(predictions)
+        dte, res = dte[valid], res[valid] - predictions[valid]
+        if self._observed is None:
+            self._observed = serie
+        if len(dte):
+            self._chunks.append((dte, res))
+            self._cache = None
+            self.last = dte[-1].view('datetime64[ns]')
+        return self._residuals(dte, res)
+
+    def _residuals(self, dte, res):
+        """Return the residual obshydro.Serie of the (dte, res) arrays."""
+        return _obshydro.Serie.from_trusted(
+            entite=self._observed.entite,
+            grandeur=self._observed.grandeur,
+            statut=self._observed.statut,
+            observations=_obshydro.Observations.from_arrays(
+                dte.view('datetime64[ns]'), res
+            )
+        )
+
+    def __len__(self):
+        """Return the number of residuals."""
+        return sum(len(dte) for dte, _ in self._chunks)
+
+    def __unicode__(self):
+        """Unicode representation."""
+        return 'Surcote de {} residus, dernier le {}'.format(
+            len(self),
+            '<aucun>' if self.last is None else _pandas.Timestamp(self.last)
+        )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- functions -----------------------------------------------------------------
+def residuals(serie, simulation, method='interpolation', tolerance=None):
+    """Retourne la obshydro.Serie des residus de serie par rapport a
+    simulation.
+
+    Le residu d'une observation est son resultat moins la prevision de
+    probabilite 50 de la simulation a sa date.
+
+    Arguments:
+        serie (obshydro.Serie) = les hauteurs observees
+        simulation (simulation.Simulation) = les predictions
+        method (string in _align.METHODS, defaut interpolation) =
+            interpolation = interpolation lineaire entre les 2 previsions
+                qui encadrent l'observation
+            nearest = prevision la plus proche
+        tolerance (datetime.timedelta, defaut None) = ecart maximum entre une
+            observation et les previsions utilisees
+
+    """
+    return Surcote(simulation, method=method, tolerance=tolerance).update(
+        serie
+    )
+
+
+#-- private functions ---------------------------------------------------------
+def _concatenate(chunks):
+    """Return the (dte, res) arrays of the (dte, res) chunks."""
+    if not chunks:
+        return (
+            _numpy.array([], dtype=_numpy.int64),
+            _numpy.array([], dtype=_numpy.float64)
+        )
+    return tuple(_numpy.concatenate(arrays) for arrays in zip(*chunks))
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""Module verification.
+
+Ce module contient la classe:
+    # Verification
+
+Une Verification compare les previsions de simulation.Simulation aux
+observations des obshydro.Serie de meme entite et de meme grandeur, et
+calcule les scores des modeles de prevision par echeance:
+    verif = Verification(simulations, series, step=timedelta(hours=1))
+    verif.pairs()  # les couples prevision / observation
+    verif.scores()  # les scores par modele, entite et echeance
+    verif.scores(by=['modele'], threshold=250)  # par modele, avec un seuil
+
+Les scores calcules sont:
+    # n = le nombre de couples prevision / observation
+    # bias = l'erreur moyenne (prevision - observation)
+    # rmse = la racine de l'erreur quadratique moyenne
+    # nash = le critere de Nash-Sutcliffe
+    # crps = le Continuous Ranked Probability Score moyen de l'ensemble
+    # pod, far = avec un seuil, la probabilite de detection et le taux de
+        fausses alertes du depassement du seuil
+
+La prevision deterministe est celle de probabilite 50, interpolee dans
+l'ensemble si elle n'est pas prevue. Le CRPS est approche par la moyenne des
+scores quantiles de l'ensemble:
+    CRPS = 2 x moyenne[(1{obs < res} - prb / 100) x (res - obs)]
+il est egal a l'erreur absolue pour une prevision deterministe.
+
+Les couples de toutes les simulations sont calcules simulation par
+simulation puis concatenes, les scores sont calcules en une seule passe pour
+tous les groupes.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import datetime as _datetime
+
+import numpy as _numpy
+import pandas as _pandas
+
+from . import _align
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the groups keys
+KEYS = ('modele', 'entite', 'echeance')
+
+
+#-- class Verification --------------------------------------------------------
+class Verification(object):
+    """Classe Verification.
+
+    Classe pour verifier des simulations par rapport aux observations.
+
+    Proprietes, une valeur par date prevue des simulations verifiees:
+        modele (numpy.array) = codes des modeles de prevision
+        entite (numpy.array) = codes des entites
+        dtprod (numpy.array de datetime64[ns]) = dates de production
+        dte (numpy.array de datetime64[ns]) = dates prevues
+        echeance (numpy.array de timedelta64[ns]) = echeances
+        obs (numpy.array de float) = observations, NaN si absente
+        prv (numpy.array de float) = previsions de probabilite 50
+        crps (numpy.array de float) = CRPS de l'ensemble
+
+    Les simulations sans previsions ou sans serie d'observations sont
+    ignorees.
+
+    """
+
+    def __init__(
+        self, simulations, series, method='interpolation', tolerance=None,
+        step=None
+    ):
+        """Initialisation.
+
+        Arguments:
+            simulations (iterable de simulation.Simulation)
+            series (iterable de obshydro.Serie) = les observations, les
+                series d'une meme entite et d'une meme grandeur sont
+                fusionnees
+            method (string, defaut interpolation) = alignement des
+                observations sur les dates prevues, interpolation lineaire
+                (interpolation) ou observation la plus proche (nearest)
+            tolerance (datetime.timedelta, defaut None) = ecart maximum entre
+                une date prevue et les observations utilisees
+            step (datetime.timedelta, defaut None) = pas des echeances, les
+                echeances sont arrondies au pas inferieur
+
+        """
+        if method not in _align.METHODS:
+            raise ValueError(
+                'method must be in %s' % ', '.join(_align.METHODS)
+            )
+        tolerance = _align.nanoseconds(tolerance)
+        step = _align.nanoseconds(step)
+
+        # the observations timelines by (entite, grandeur)
+        grouped = {}
+        for serie in series:
+            if (serie.entite is None) or (serie.observations is None):
+                continue
+            grouped.setdefault(
+                (serie.entite.code, serie.grandeur), []
+            ).append(serie)
+        timelines = dict(
+            (key, _align.timeline(value)) for key, value in grouped.items()
+        )
+
+        # the pairs, simulation by simulation
+        columns = dict((key, []) for key in (
+            'modele', 'entite', 'dtprod', 'dte', 'obs', 'prv', 'crps'
+        ))
+        for simulation in simulations:
+            if simulation.entite is None:
+                continue
+            timeline = timelines.get(
+                (simulation.entite.code, simulation.grandeur)
+            )
+            if (timeline is None) or (simulation.previsions is None):
+                continue
+            if simulation.dtprod is None:
+                raise ValueError('simulation without dtprod')
+            ensemble = simulation.ensemble
+            dte = ensemble.dte.view(_numpy.int64)
+            obs = _align.align(
+                timeline[0], timeline[1], dte, method, tolerance
+            )
+            size = len(dte)
+            columns['modele'].append(_numpy.repeat(
+                _numpy.array([_code(simulation.modeleprevision)], object),
+                size
+            ))
+            columns['entite'].append(_numpy.repeat(
+                _numpy.array([simulation.entite.code], object), size
+            ))
+            columns['dtprod'].append(_numpy.repeat(
+                _numpy.datetime64(simulation.dtprod).astype(
+                    'datetime64[ns]'
+                ).view(_numpy.int64),
+                size
+            ))
+            columns['dte'].append(dte)
+            columns['obs'].append(obs)
+            columns['prv'].append(ensemble.quantile(50).values)
+            columns['crps'].append(_crps(ensemble.res, ensemble.prb, obs))
+
+        # concatenate the columns
+        for key, dtype in (
+            ('modele', object), ('entite', object), ('dtprod', _numpy.int64),
+            ('dte', _numpy.int64), ('obs', _numpy.float64),
+            ('prv', _numpy.float64), ('crps', _numpy.float64)
+        ):
+            if columns[key]:
+                columns[key] = _numpy.concatenate(columns[key])
+            else:
+                columns[key] = _numpy.array([], dtype=dtype)
+        self.modele = columns['modele']
+        self.entite = columns['entite']
+        echeance = columns['dte'] - columns['dtprod']
+        if step:
+            echeance = echeance // step * step
+        self.echeance = echeance.view('timedelta64[ns]')
+        self.dtprod = columns['dtprod'].view('datetime64[ns]')
+        self.dte = columns['dte'].view('datetime64[ns]')
+        self.obs = columns['obs']
+        self.prv = columns['prv']
+        self.crps = columns['crps']
+
+    def pairs(self):
+        """Retourne un pandas.DataFrame des couples prevision / observation."""
+        return _pandas.DataFrame(
+            {
+                'modele': self.modele,
+                'entite': self.entite,
+                'dtprod': self.dtprod,
+                'dte': self.dte,
+                'echeance': self.echeance,
+                'obs': self.obs,
+                'prv': self.prv,
+                'crps': self.crps
+            },
+            columns=[
+                'modele', 'entite', 'dtprod', 'dte', 'echeance', 'obs', 'prv',
+                'crps'
+            ]
+        )
+
+    def scores(self, by=KEYS, threshold=None):
+        """Retourne un pandas.DataFrame des scores par groupe.
+
+        Seuls les couples dont l'observation et la prevision sont connues
+        sont pris en compte, les scores d'un groupe sans couple valent NaN.
+
+        Arguments:
+            by (sequence de modele, entite et echeance, defaut les 3) = les
+                cles des groupes, l'index du resultat, les echeances y sont
+                des datetime.timedelta
+            threshold (float, defaut None) = seuil de calcul de pod et far
+
+        """
+        by = list(by)
+        for key in by:
+            if key not in KEYS:
+                raise ValueError('by must be in %s' % ', '.join(KEYS))
+        if not by:
+            raise ValueError('by is empty')
+
+        columns = ['n', 'bias', 'rmse', 'nash', 'crps']
+        if threshold is not None:
+            columns.extend(['pod', 'far'])
+        if not len(self):
+            return _pandas.DataFrame(
+                columns=columns, index=_pandas.MultiIndex(
+                    levels=[[]] * len(by), labels=[[]] * len(by), names=by
+                ) if len(by) > 1 else _pandas.Index([], name=by[0])
+            )
+
+        # the groups
+        uniques, inverses = zip(*[
+            _numpy.unique(getattr(self, key), return_inverse=True)
+            for key in by
+        ])
+        shape = tuple(len(unique) for unique in uniques)
+        groups, group = _numpy.unique(
+            _numpy.ravel_multi_index(inverses, shape), return_inverse=True
+        )
+        ngroups = len(groups)
+
+        def total(values, mask):
+            """Return the sum of values by group."""
+            return _numpy.bincount(
+                group[mask], weights=values[mask], minlength=ngroups
+            )[:ngroups]
+
+        valid = ~(_numpy.isnan(self.obs) | _numpy.isnan(self.prv))
+        ones = _numpy.ones(len(self.obs))
+        error = self.prv - self.obs
+        with _numpy.errstate(divide='ignore', invalid='ignore'):
+            n = total(ones, valid)
+            mean = total(self.obs, valid) / n
+            bias = total(error, valid) / n
+            sse = total(error ** 2, valid)
+            rmse = _numpy.sqrt(sse / n)
+            nash = 1 - sse / total((self.obs - mean[group]) ** 2, valid)
+            hascrps = ~_numpy.isnan(self.crps)
+            crps = total(self.crps, hascrps) / total(ones, hascrps)
+            data = {
+                'n': n.astype(_numpy.int64), 'bias': bias, 'rmse': rmse,
+                'nash': nash, 'crps': crps
+            }
+            if threshold is not None:
+                forecast = self.prv >= threshold
+                observed = self.obs >= threshold
+                hits = total(ones, valid & forecast & observed)
+                misses = total(ones, valid & ~forecast & observed)
+                alarms = total(ones, valid & forecast & ~observed)
+                data['pod'] = hits / (hits + misses)
+                data['far'] = alarms / (hits + alarms)
+
+        # the index
+        levels = [
+            unique[codes] for unique, codes in
+            zip(uniques, _numpy.unravel_index(groups, shape))
+        ]
+        levels = [
+            _timedeltas(level) if key == 'echeance' else level
+            for key, level in zip(by, levels)
+        ]
+        if len(by) == 1:
+            index = _pandas.Index(levels[0], name=by[0])
+        else:
+            index = _pandas.MultiIndex.from_arrays(levels, names=by)
+        return _pandas.DataFrame(data, index=index, columns=columns)
+
+    def __len__(self):
+        """Return the number of pairs."""
+        return len(self.obs)
+
+
+#-- private functions ---------------------------------------------------------
+def _code(modeleprevision):
+    """Return the code of modeleprevision or None."""
+    if modeleprevision is None:
+        return None
+    return modeleprevision.code
+
+
+def _crps(res, prb, obs):
+    """Return the quantile approximation of the CRPS of each row of res.
+
+    res is the dates x probabilities array of an Ensemble, prb its
+    probabilities in percent and obs the observations.
+
+    """
+    obs = obs[:, _numpy.newaxis]
+    with _numpy.errstate(invalid='ignore'):
+        scores = ((obs < res) - prb / 100) * (res - obs)
+        valid = ~_numpy.isnan(scores)
+        return 2 * _numpy.where(valid, scores, 0).sum(axis=1) / \
+            valid.sum(axis=1)
+
+
+def _timedeltas(echeances):
+    """Return an object numpy.array of the datetime.timedelta of an array of
+    timedelta64[ns]."""
+    return _numpy.array(
+        [
+            _datetime.timedelta(microseconds=int(ns) // 1000)
+            for ns in echeances.view(_numpy.int64)
+        ],
+        dtype=object
+    )
@@ -4,10 +4,18 @@
 Ce package contient des convertisseurs de et vers differents formats.
 
 Il contient les modules:
+    # archive
     # shom
     # xml
 
+Les convertisseurs, et leurs dependances (pandas, lxml), sont importes a leur
+premier acces.
+
 """
-__all__ = ['shom', 'xml']
-from shom import shom as shom
-from xml import xml as xml
+__all__ = ['archive', 'shom', 'xml']
+# the converters are imported on first access
+from .._lazyimport import install as _install
+_install(
+    __name__,
+    {'archive': '.archive', 'shom': '.shom', 'xml': '.xml'}
+)
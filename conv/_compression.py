@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Module _compression.
+
+Ce module contient les outils de lecture des fichiers compresses utilises par
+les convertisseurs:
+    # uncompressed(src) = context manager qui retourne une source lisible par
+        les parseurs, decompressee a la volee si src est compresse
+    # detect(head) = retourne le format de compression des premiers octets
+        d'un fichier ou None
+    # stripext(path) = retire l'extension de compression d'un nom de fichier
+
+Les formats reconnus, par leur signature (magic bytes) et non par l'extension
+du fichier, sont:
+    # gzip
+    # bz2
+    # xz, si le module lzma (ou backports.lzma) est installe
+
+Les donnees sont decompressees par blocs de CHUNK octets au fur et a mesure
+de la lecture, sans fichier temporaire.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import os as _os
+import io as _io
+import contextlib as _contextlib
+import zlib as _zlib
+import bz2 as _bz2
+
+try:
+    import lzma as _lzma
+except ImportError:
+    try:
+        from backports import lzma as _lzma
+    except ImportError:
+        _lzma = None
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the size of the blocks read in the compressed source
+CHUNK = 64 * 1024
+
+# (signature, format)
+MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz')
+)
+# the number of bytes needed by detect
+HEAD = max(len(magic) for magic, _ in MAGIC)
+
+EXTENSIONS = {
+    'gzip': ('.gz', '.gzip'),
+    'bz2': ('.bz2',),
+    'xz': ('.xz',)
+}
+
+
+#-- functions -----------------------------------------------------------------
+def detect(head):
+    """Return the compression format of the bytes head, or None."""
+    for magic, codec in MAGIC:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def stripext(path):
+    """Return path without its compression extension, if any."""
+    root, ext = _os.path.splitext(path)
+    for extensions in EXTENSIONS.values():
+        if ext.lower() in extensions:
+            return root
+    return path
+
+
+@_contextlib.contextmanager
+def uncompressed(src, native=()):
+    """Context manager returning an uncompressed view of src.
+
+    src is returned unchanged when it is not compressed, or when it is not a
+    file name or a file object (url...). Otherwise the result is a readable
+    file object which decompresses src on the fly.
+
+    Arguments:
+        src (nom de fichier ou objet fichier ouvert en mode binaire)
+        native (sequence de formats) = formats que le parseur sait lire
+            lui-meme dans un fichier, un nom de fichier compresse dans l'un
+            de ces formats est retourne tel quel
+
+    """
+    # a file name
+    if isinstance(src, basestring):
+        if not _os.path.isfile(src):
+            yield src
+            return
+        with _io.open(src, 'rb') as f:
+            codec = detect(f.read(HEAD))
+            if (codec is None) or (codec in native):
+                # let the parsers read the file themselves
+                f.close()
+                yield src
+                return
+            f.seek(0)
+            with _reader(f, codec) as reader:
+                yield reader
+        return
+
+    # a file object
+    if not hasattr(src, 'read'):
+        yield src
+        return
+    head = src.read(HEAD)
+    codec = detect(head)
+    try:
+        src.seek(-len(head), _os.SEEK_CUR)
+        head = b''
+    except Exception:
+        # not seekable, the head is given back by the reader
+        pass
+    if (codec is None) and (not head):
+        yield src
+    else:
+        with _reader(src, codec, head) as reader:
+            yield reader
+
+
+#-- private functions ---------------------------------------------------------
+def _decompressor(codec):
+    """Return a new decompressor object for codec."""
+    if codec == 'gzip':
+        return _zlib.decompressobj(16 + _zlib.MAX_WBITS)
+    if codec == 'bz2':
+        return _bz2.BZ2Decompressor()
+    if codec == 'xz':
+        if _lzma is None:
+            raise ValueError('xz compression requires the lzma module')
+        return _lzma.LZMADecompressor()
+    raise ValueError('unknown compression %s' % codec)
+
+
+def _reader(fileobj, codec=None, head=b''):
+    """Return a buffered file object reading fileobj uncompressed."""
+    return _io.BufferedReader(
+        _RawReader(fileobj, codec, head), buffer_size=CHUNK
+    )
+
+
+#-- private classes -----------------------------------------------------------
+class _RawReader(_io.RawIOBase):
+    """Raw stream decompressing a file object by blocks of CHUNK bytes.
+
+    Concatenated streams (multi members gzip files...) are decoded one after
+    the other. With codec None, the data is just copied. The head bytes, if
+    any, are read before the file object.
+
+    """
+
+    def __init__(self, fileobj, codec=None, head=b''):
+        _io.RawIOBase.__init__(self)
+        self._fileobj = fileobj
+        self._codec = codec
+        self._decompressor = _decompressor(codec) if codec else None
+        self._head = head
+        self._buffer = b''
+        self._pos = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while (self._pos >= len(self._buffer)) and (not self._eof):
+            data = self._head or self._fileobj.read(CHUNK)
+            self._head = b''
+            if not data:
+                self._eof = True
+            else:
+                self._buffer = self._decompress(data)
+                self._pos = 0
+        n = min(len(b), len(self._buffer) - self._pos)
+        b[:n] = self._buffer[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def _decompress(self, data):
+        """Return the decompressed bytes of data."""
+        if self._decompressor is None:
+            return data
+        chunks = []
+        while data:
+            try:
+                chunks.append(self._decompressor.decompress(data))
+            except EOFError:
+                # bz2, data starts a new stream
+                self._decompressor = _decompressor(self._codec)
+                continue
+            data = self._decompressor.unused_data
+            if data:
+                self._decompressor = _decompressor(self._codec)
+        return b''.join(chunks)
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""Package libhydro.conv.archive.
+
+Le package archive contient des convertisseurs de et vers les archives
+compressees d'observations, disponibles au travers le module archive:
+    # serie_to_archive
+    # serie_from_archive
+    # blocks
+
+"""
+__all__ = [
+    'serie_to_archive', 'serie_from_archive', 'blocks', 'MAGIC', 'BLOCK',
+    'LEVEL', 'DEFAULTS', 'BLOCKS', 'ENTITES'
+]
+# for the user, this package is like its module archive, whatever the import
+# order. The functions are imported on first access.
+from ..._lazyimport import install as _install
+_install(__name__, {name: '.archive:%s' % name for name in __all__})
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""Module archive.
+
+Ce module contient les convertisseurs de et vers les fichiers d'archive
+compresses d'observations:
+    serie_to_archive()
+    serie_from_archive()
+    blocks()
+
+Une archive contient une obshydro.Serie, decoupee en blocs de BLOCK
+observations compresses independamment. Pour extraire une periode seuls les
+blocs qui la recouvrent sont lus et decompresses:
+    archive.serie_to_archive(serie, 'A1234567.lha')
+    serie = archive.serie_from_archive(
+        'A1234567.lha', begin='2013-01-01T00:00Z', end='2013-02-01T00:00Z'
+    )
+
+Les colonnes d'un bloc sont encodees separement puis le bloc est compresse en
+zlib:
+    # dte = les dates en secondes, en delta de delta (nul pour un pas de temps
+        constant), en entiers de longueur variable (varint zigzag)
+    # res = les bits des flottants en ou exclusif (xor) ou en difference
+        (delta) avec le resultat precedent, le plus compact des deux,
+        reordonnes octet par octet
+    # mth, qal, cnt = en plages de valeurs identiques (run-length)
+L'encodage est sans perte, resultats NaN compris.
+
+Format des fichiers:
+    # MAGIC
+    # la longueur de l'entete (uint32) et l'entete en json utf-8: entite,
+        grandeur, statut et nombre d'observations de la serie
+    # le nombre de blocs (uint32) et la table des blocs, de type BLOCKS
+    # les blocs compresses, a la position offset de la table comptee depuis
+        la fin de la table
+Les entiers sont little-endian.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import io as _io
+import json as _json
+import struct as _struct
+import zlib as _zlib
+
+import numpy as _numpy
+
+from ...core import (
+    sitehydro as _sitehydro, obshydro as _obshydro
+)
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the file signature, with the format version
+MAGIC = b'LHARC\x01'
+
+# the default number of observations by block
+BLOCK = 4096
+
+# the zlib compression level
+LEVEL = 6
+
+# the default values of the columns missing from simplified observations,
+# see Observations.from_arrays
+DEFAULTS = {'mth': 0, 'qal': 16, 'cnt': True}
+
+# the blocks table
+BLOCKS = _numpy.dtype([
+    (str('first'), str('<i8')),  # first date, in seconds
+    (str('last'), str('<i8')),  # last date, in seconds
+    (str('count'), str('<u4')),  # number of observations
+    (str('offset'), str('<u8')),
+    (str('length'), str('<u4'))
+])
+
+# the entities classes, with their type attribute
+ENTITES = {
+    'Sitehydro': 'typesite',
+    'Stationhydro': 'typestation',
+    'Capteur': 'typemesure'
+}
+
+# the res encodings
+_XOR = 0
+_DELTA = 1
+
+_UINT32 = _struct.Struct(str('<I'))
+
+
+#-- functions -----------------------------------------------------------------
+def serie_to_archive(serie, dst, block=BLOCK):
+    """Ecrit la Serie dans le fichier d'archive dst.
+
+    Les observations sont triees par date.
+
+    Arguments:
+        serie (obshydro.Serie)
+        dst (str ou file) = fichier destination, ouvert en mode binaire
+        block (int, defaut BLOCK) = nombre d'observations par bloc
+
+    """
+    if block < 1:
+        raise ValueError('block must be positive')
+
+    # the columns
+    observations = serie.observations
+    if observations is None:
+        observations = _obshydro.Observations.from_arrays([], [])
+    dte = observations.index.values.astype('datetime64[ns]').view(
+        _numpy.int64
+    ) // 10 ** 9
+    order = dte.argsort(kind='mergesort')
+    dte = dte[order]
+    dtype = _obshydro.Observation.DTYPE
+    columns = [
+        _numpy.ascontiguousarray(
+            observations[name].values[order], dtype=dtype[name]
+        ) if name in observations else
+        # the simplified observations only have a res column
+        _numpy.repeat(
+            _numpy.array(DEFAULTS[name], dtype=dtype[name]), len(dte)
+        )
+        for name in ('res', 'mth', 'qal', 'cnt')
+    ]
+
+    # the blocks
+    table = _numpy.zeros((len(dte) + block - 1) // block, dtype=BLOCKS)
+    data = []
+    offset = 0
+    for i, start in enumerate(range(0, len(dte), block)):
+        stop = start + block
+        encoded = _encode_block(
+            dte[start:stop], *[column[start:stop] for column in columns]
+        )
+        table[i] = (
+            dte[start], dte[min(stop, len(dte)) - 1], len(dte[start:stop]),
+            offset, len(encoded)
+        )
+        data.append(encoded)
+        offset += len(encoded)
+
+    # write
+    header = _json.dumps({
+        'entite': _entite_to_json(serie.entite),
+        'grandeur': serie.grandeur,
+        'statut': serie.statut,
+        'count': len(dte)
+    }).encode('utf-8')
+    if isinstance(dst, basestring):
+        with _io.open(dst, 'wb') as f:
+            _write(f, header, table, data)
+    else:
+        _write(dst, header, table, data)
+
+
+def serie_from_archive(src, begin=None, end=None):
+    """Retourne la obshydro.Serie d'un fichier d'archive.
+
+    Seuls les blocs contenant des observations de begin a end sont lus.
+
+    Arguments:
+        src (str ou file) = fichier source, ouvert en mode binaire
+        begin, end (datetime, numpy.datetime64 ou string au format ISO
+            8601, defaut None) = bornes incluses de la periode a extraire,
+            None pour ne pas borner
+
+    """
+    if isinstance(src, basestring):
+        with _io.open(src, 'rb') as f:
+            return _read(f, begin, end)
+    return _read(src, begin, end)
+
+
+def blocks(src):
+    """Retourne l'entete et la table des blocs d'un fichier d'archive.
+
+    Retourne un tuple (entete (dict), table (numpy.array de type BLOCKS)).
+
+    Arguments:
+        src (str ou file) = fichier source, ouvert en mode binaire
+
+    """
+    if isinstance(src, basestring):
+        with _io.open(src, 'rb') as f:
+            return _read_header(f)
+    return _read_header(src)
+
+
+#-- private functions ---------------------------------------------------------
+def _write(f, header, table, data):
+    """Write an archive in the binary file object f."""
+    f.write(MAGIC)
+    f.write(_UINT32.pack(len(header)))
+    f.write(header)
+    f.write(_UINT32.pack(len(table)))
+    f.write(table.tostring())
+    for encoded in data:
+        f.write(encoded)
+
+
+def _read_header(f):
+    """Return the (header, table) of the binary file object f, positioned
+    at the beginning of the blocks."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError('not an archive file')
+    header = _json.loads(f.read(_unpack(f)).decode('utf-8'))
+    size = _unpack(f) * BLOCKS.itemsize
+    table = _numpy.fromstring(f.read(size), dtype=BLOCKS)
+    if len(table) * BLOCKS.itemsize != size:
+        raise ValueError('truncated archive file')
+    return header, table
+
+
+def _read(f, begin=None, end=None):
+    """Return the Serie of the binary file object f from begin to end."""
+    header, table = _read_header(f)
+    origin = f.tell()
+    begin = None if begin is None else _seconds(begin)
+    end = None if end is None else _seconds(end)
+
+    # the blocks of the period
+    selected = _numpy.ones(len(table), dtype=bool)
+    if begin is not None:
+        selected &= table['last'] >= begin
+    if end is not None:
+        selected &= table['first'] <= end
+    decoded = []
+    for row in table[selected]:
+        f.seek(origin + int(row['offset']))
+        decoded.append(_decode_block(f.read(int(row['length'])), row['count']))
+    if decoded:
+        columns = [_numpy.concatenate(column) for column in zip(*decoded)]
+    else:
+        dtype = _obshydro.Observation.DTYPE
+        columns = [_numpy.array([], dtype=_numpy.int64)] + [
+            _numpy.array([], dtype=dtype[i]) for i in range(1, 5)
+        ]
+
+    # the period
+    start, stop = 0, len(columns[0])
+    if begin is not None:
+        start = columns[0].searchsorted(begin)
+    if end is not None:
+        stop = columns[0].searchsorted(end, 'right')
+    dte, res, mth, qal, cnt = [column[start:stop] for column in columns]
+
+    return _obshydro.Serie.from_trusted(
+        _entite_from_json(header['entite']), header['grandeur'],
+        header['statut'], _obshydro.Observations.from_arrays(
+            dte.view('datetime64[s]'), res, mth, qal, cnt
+        )
+    )
+
+
+def _unpack(f):
+    """Read an uint32 from the binary file object f."""
+    data = f.read(_UINT32.size)
+    if len(data) != _UINT32.size:
+        raise ValueError('truncated archive file')
+    return _UINT32.unpack(data)[0]
+
+
+def _seconds(dte):
+    """Return the seconds since the epoch of a date."""
+    return int(
+        _numpy.datetime64(dte).astype('datetime64[s]').view(_numpy.int64)
+    )
+
+
+def _entite_to_json(entite):
+    """Return the json dict of a site, a station or a capteur."""
+    if entite is None:
+        return None
+    name = type(entite).__name__
+    if name not in ENTITES:
+        raise TypeError(
+            'entite must be a Sitehydro, a Stationhydro or a Capteur'
+        )
+    return {
+        'type': name, 'code': entite.code, 'libelle': entite.libelle,
+        ENTITES[name]: getattr(entite, ENTITES[name])
+    }
+
+
+def _entite_from_json(entite):
+    """Return the site, station or capteur of a json dict."""
+    if entite is None:
+        return None
+    if entite['type'] not in ENTITES:
+        raise ValueError('unknown entite %s' % entite['type'])
+    kind = ENTITES[entite['type']]
+    return getattr(_sitehydro, entite['type']).from_trusted(
+        entite['code'], libelle=entite['libelle'], **{kind: entite[kind]}
+    )
+
+
+def _encode_block(dte, res, mth, qal, cnt):
+    """Return the compressed bytes of the columns of a block."""
+    sections = [
+        _dte_to_bytes(dte), _res_to_bytes(res), _runs_to_bytes(mth),
+        _runs_to_bytes(qal), _runs_to_bytes(cnt.view(_numpy.int8))
+    ]
+    return _zlib.compress(
+        b''.join(_UINT32.pack(len(s)) + s for s in sections), LEVEL
+    )
+
+
+def _decode_block(data, count):
+    """Return the (dte, res, mth, qal, cnt) arrays of a compressed block."""
+    data = _zlib.decompress(data)
+    sections = []
+    position = 0
+    while position < len(data):
+        length = _UINT32.unpack_from(data, position)[0]
+        position += _UINT32.size
+        sections.append(data[position:position + length])
+        position += length
+    if len(sections) != 5:
+        raise ValueError('corrupted archive block')
+    return (
+        _dte_from_bytes(sections[0], count),
+        _res_from_bytes(sections[1], count),
+        _runs_from_bytes(sections[2], count),
+        _runs_from_bytes(sections[3], count),
+        _runs_from_bytes(sections[4], count).view(_numpy.bool_)
+    )
+
+
+def _dte_to_bytes(dte):
+    """Return the delta of delta encoding of int64 seconds.
+
+    The encoded values are the first date, the first delta and the deltas
+    differences.
+
+    """
+    deltas = _numpy.concatenate((dte[:1], _numpy.diff(dte)))
+    dods = _numpy.concatenate((deltas[:2], _numpy.diff(deltas[1:])))
+    return _varint(_zigzag(dods))
+
+
+def _dte_from_bytes(data, count):
+    """Return the int64 seconds of a delta of delta encoding."""
+    dods = _unzigzag(_unvarint(data, count))
+    deltas = _numpy.concatenate((dods[:1], _numpy.cumsum(dods[1:])))
+    return _numpy.cumsum(deltas)
+
+
+def _res_to_bytes(res):
+    """Return the xor or delta encoding of float64 values, with its mode
+    byte."""
+    bits = res.view(_numpy.uint64)
+    xor = bits.copy()
+    xor[1:] ^= bits[:-1]
+    delta = bits.copy()
+    delta[1:] -= bits[:-1]
+    xor, delta = _shuffle(xor), _shuffle(delta)
+    # keep the encoding with the best compression
+    if len(_zlib.compress(delta, 1)) < len(_zlib.compress(xor, 1)):
+        return _struct.pack(str('<B'), _DELTA) + delta
+    return _struct.pack(str('<B'), _XOR) + xor
+
+
+def _res_from_bytes(data, count):
+    """Return the float64 values of a xor or delta encoding."""
+    mode = _struct.unpack_from(str('<B'), data)[0]
+    bits = _unshuffle(data[1:], count)
+    if mode == _XOR:
+        bits = _numpy.bitwise_xor.accumulate(bits)
+    elif mode == _DELTA:
+        bits = _numpy.cumsum(bits, dtype=_numpy.uint64)
+    else:
+        raise ValueError('corrupted archive block')
+    return bits.view(_numpy.float64)
+
+
+def _shuffle(values):
+    """Return the bytes of the uint64 values, byte 0 of all values first,
+    then byte 1...
+
+    The high order bytes of close values are identical and compress well
+    once grouped.
+
+    """
+    return values.astype(str('<u8')).view(_numpy.uint8).reshape(
+        len(values), 8
+    ).T.tostring()
+
+
+def _unshuffle(data, count):
+    """Return the uint64 values of shuffled bytes."""
+    array = _numpy.fromstring(data, dtype=_numpy.uint8)
+    if len(array) != 8 * count:
+        raise ValueError('corrupted archive block')
+    return _numpy.ascontiguousarray(array.reshape(8, count).T).view(
+        str('<u8')
+    ).reshape(count).astype(_numpy.uint64)
+
+
+def _runs_to_bytes(values):
+    """Return the run-length encoding of int8 values.
+
+    The encoding is the number of runs, the value of each run and the
+    varint lengths of the runs.
+
+    """
+    starts = _numpy.concatenate((
+        _numpy.zeros(min(len(values), 1), dtype=_numpy.int64),
+        _numpy.flatnonzero(values[1:] != values[:-1]) + 1
+    ))
+    lengths = _numpy.diff(_numpy.append(starts, len(values)))
+    return _UINT32.pack(len(starts)) + \
+        values[starts].astype(_numpy.int8).tostring() + \
+        _varint(lengths.astype(_numpy.uint64))
+
+
+def _runs_from_bytes(data, count):
+    """Return the int8 values of a run-length encoding."""
+    runs = _UINT32.unpack_from(data)[0]
+    start = _UINT32.size
+    values = _numpy.fromstring(data[start:start + runs], dtype=_numpy.int8)
+    lengths = _unvarint(data[start + runs:], runs).astype(_numpy.int64)
+    if (len(values) != runs) or (lengths.sum() != count):
+        raise ValueError('corrupted archive block')
+    return values.repeat(lengths)
+
+
+def _zigzag(values):
+    """Return the uint64 zigzag encoding of int64 values: 0, -1, 1, -2...
+    are 0, 1, 2, 3..."""
+    values = values.astype(_numpy.int64)
+    return ((values << 1) ^ (values >> 63)).view(_numpy.uint64)
+
+
+def _unzigzag(values):
+    """Return the int64 values of an uint64 zigzag encoding."""
+    one = _numpy.uint64(1)
+    return (
+        (values >> one) ^ (_numpy.uint64(0) - (values & one))
+    ).view(_numpy.int64)
+
+
+def _varint(values):
+    """Return the bytes of the variable length encoding of uint64 values.
+
+    Each value is written in groups of 7 bits, low order first, the high bit
+    of a byte being set when the value has more bytes.
+
+    """
+    groups = _numpy.empty((len(values), 10), dtype=_numpy.uint8)
+    nbytes = _numpy.ones(len(values), dtype=_numpy.int64)
+    for k in range(10):
+        shifted = values >> _numpy.uint64(7 * k)
+        groups[:, k] = shifted & _numpy.uint64(0x7f)
+        if k:
+            nbytes += shifted != 0
+    ranks = _numpy.arange(10)
+    groups[ranks < (nbytes - 1)[:, _numpy.newaxis]] |= 0x80
+    return groups[ranks < nbytes[:, _numpy.newaxis]].tostring()
+
+
+def _unvarint(data, count):
+    """Return the count uint64 values of a variable length encoding."""
+    array = _numpy.fromstring(data, dtype=_numpy.uint8)
+    ends = _numpy.flatnonzero(array < 0x80)
+    if (len(ends) != count) or (count and (ends[-1] != len(array) - 1)):
+        raise ValueError('corrupted archive block')
+    if not count:
+        return _numpy.array([], dtype=_numpy.uint64)
+    starts = _numpy.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts + 1
+    values = _numpy.zeros(count, dtype=_numpy.uint64)
+    for k in range(lengths.max()):
+        more = lengths > k
+        values[more] |= (
+            array[starts[more] + k] & 0x7f
+        ).astype(_numpy.uint64) << _numpy.uint64(7 * k)
+    return values
@@ -1,3 +1,19 @@
 # -*- coding: utf-8 -*-
-"""Package libhydro.conv.shom."""
-__all_ = ['shom']
+"""Package libhydro.conv.shom.
+
+Le package shom contient des convertisseurs de et vers les fichiers HFS du
+SHOM, disponibles au travers les fonctions du module shom:
+    # simulation_from_hfs
+    # simulation_to_hfs
+    # serie_from_hfs
+    # serie_to_hfs
+
+"""
+__all__ = [
+    'simulation_from_hfs', 'simulation_to_hfs', 'serie_from_hfs',
+    'serie_to_hfs'
+]
+# for the user, this package is like its module shom, whatever the import
+# order. The functions are imported on first access.
+from ..._lazyimport import install as _install
+_install(__name__, {name: '.shom:%s' % name for name in __all__})
@@ -12,7 +12,8 @@ des fonctions suivantes:
     serie_to_hfs()  -- not implemented --
 
 Format des fichiers HFS:
-    # fichier texte avec extension hfs
+    # fichier texte avec extension hfs, eventuellement compresse en gzip, bz2
+        ou xz (hfs.gz...)
     # le nom du fichier est le nom du maregraphe ou du port en majuscule
     # une ligne par donnee au format "yyyy-mm-dd hh:mm:ss xx.xx"
     # pas de temps constant et heures TU
@@ -39,6 +40,7 @@ import os as _os
 import pandas as _pandas
 import numpy as _numpy
 
+from .. import _compression
 from ...core import (
     sitehydro as _sitehydro, modeleprevision as _modeleprevision,
     obshydro as _obshydro, simulation as _simulation
@@ -47,12 +49,14 @@ from ...core import (
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1d"""
-__date__ = """2013-08-17"""
+__version__ = """0.1e"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-01
 #    first shot
+#V0.1e - 2026-10-19
+#    compressed sources
 
 
 #-- todos ---------------------------------------------------------------------
@@ -130,7 +134,7 @@ def serie_from_hfs(src, stationhydro=None, begin=None, end=None, strict=True):
     La Serie est simplifiee et ne contient que la colonne res.
 
     Arguments:
-        src (str o ou file) = fichier source
+        src (str o ou file) = fichier source, eventuellement compresse
         stationhydro (Stationhydro) = par defaut utilise le nom du fichier src
         begin, end (isoformat string) = dates de debut/fin de la plage de
             valeurs a conserver, bornes incluses
@@ -139,14 +143,15 @@ def serie_from_hfs(src, stationhydro=None, begin=None, end=None, strict=True):
 
     """
     # parse file
-    df = _pandas.read_table(
-        src,
-        header=None,
-        delim_whitespace=True,
-        parse_dates=[[0, 1]],
-        index_col=0,
-        names=['date', 'heure', 'res']
-    )
+    with _compression.uncompressed(src) as stream:
+        df = _pandas.read_table(
+            stream,
+            header=None,
+            delim_whitespace=True,
+            parse_dates=[[0, 1]],
+            index_col=0,
+            names=['date', 'heure', 'res']
+        )
 
     # update the DataFrame
     df.index.name = 'dte'
@@ -159,7 +164,9 @@ def serie_from_hfs(src, stationhydro=None, begin=None, end=None, strict=True):
         stationhydro = _sitehydro.Stationhydro(
             code=None,
             typestation='LIMNI',
-            libelle=_os.path.splitext(_os.path.split(src)[-1])[0],
+            libelle=_os.path.splitext(
+                _compression.stripext(_os.path.split(src)[-1])
+            )[0],
             strict=False
         )
 
@@ -8,13 +8,27 @@ Message.
 Il contient les classes:
     # Message
     # Scenario
+    # Instrument = mesure des temps de lecture et d'ecriture des messages
+    # MessageParser = lecture incrementale d'un message
+
+et la fonction:
+    # peek = lecture du seul scenario d'un message
 
 Exemples d'utilisation:
     (TODO)
 
 """
-__all__ = ['Message', 'Scenario']
+__all__ = ['Message', 'Scenario', 'Instrument', 'MessageParser', 'peek']
 # for the user, this package is like a module, sub-modules names are
-# underscored to hide them
-from _from_xml import Scenario
-from xml import Message
+# underscored to hide them. The classes are imported on first access.
+from ..._lazyimport import install as _install
+_install(
+    __name__,
+    {
+        'Scenario': '._from_xml:Scenario',
+        'Message': '.xml:Message',
+        'Instrument': '._instrument:Instrument',
+        'MessageParser': '._stream:MessageParser',
+        'peek': '._peek:peek'
+    }
+)
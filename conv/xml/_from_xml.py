@@ -9,6 +9,18 @@ Xml Hydrometrie (version 1.1 exclusivement).
 
 Toutes les heures sont considerees UTC si le fuseau horaire n'est pas precise.
 
+Les messages peuvent etre sans namespace ou dans un namespace, celui du SANDRE
+en general. Juste apres la lecture, le namespace est retire des elements du
+document en memoire, sauf a l'interieur des observations et des previsions qui
+sont decodees en tenant compte du namespace.
+
+Les fichiers compresses (gzip, bz2 ou xz) sont decompresses a la volee.
+
+Les messages peuvent etre valides a la lecture contre le schema XSD embarque
+hydrometrie.xsd, un sous-ensemble du schema SANDRE limite aux elements decodes
+par libhydro. Un message valide peut ensuite etre decode en mode 'trusted',
+sans les controles des proprietes des objets du package core.
+
 Les fonctions de ce module sont a usage prive, il est recommande d'utiliser la
 classe xml.Message comme interface aux fichiers Xml Hydrometrie.
 
@@ -22,6 +34,8 @@ from __future__ import (
 )
 
 import sys as _sys
+import os as _os
+import threading as _threading
 
 import datetime as _datetime
 import numpy as _numpy
@@ -33,26 +47,40 @@ from libhydro.core import (
     modeleprevision as _modeleprevision,
     obshydro as _obshydro,
     simulation as _simulation,
-    intervenant as _intervenant
+    intervenant as _intervenant,
+    _lazy
 )
+from libhydro.conv import _compression
+from . import _instrument
 
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1f"""
-__date__ = """2013-09-04"""
+__version__ = """0.1l"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-18
 #    first shot
+#V0.1g - 2026-10-19
+#    entities shared through a registre.Registre
+#V0.1h - 2026-10-19
+#    instrumented decoding stages
+#V0.1i - 2026-10-19
+#    per-thread parser and compiled prevision xpaths
+#V0.1j - 2026-10-19
+#    xsd validation and trusted decoding
+#V0.1k - 2026-10-19
+#    namespaced messages parsed in a single pass
+#V0.1l - 2026-10-19
+#    compressed sources
 
 
 #-- todos ---------------------------------------------------------------------
 # TODO - if xpath is too slow to acess elements, use indexing
 #        code=element[0].text,
 #        but xpath is more readable and do not care of xml order
-
-# TODO - XSD validation
+#        => done for the trusted decoders, the order is checked by the XSD
 
 
 # -- config -------------------------------------------------------------------
@@ -62,6 +90,26 @@ PREV_PROBABILITY = {
     'ResMaxPrev': 100
 }
 
+# the bundled XSD
+XSD = _os.path.join(_os.path.dirname(__file__), 'hydrometrie.xsd')
+
+# the SANDRE namespace of the messages
+NAMESPACE = 'http://xml.sandre.eaufrance.fr/scenario/hydrometrie/1.1'
+
+# lxml parsers can't be shared between threads, we keep one by thread
+_LOCAL = _threading.local()
+
+# the compiled XSD is loaded once, on first use
+_SCHEMA = None
+_SCHEMA_LOCK = _threading.Lock()
+
+# the elements whose content keeps its namespace
+_BULK = ('ObssHydro', 'Prevs')
+
+# compiled XPath of the repeated queries, by namespace
+_XPATHS = {}
+_XPATHS_LOCK = _threading.Lock()
+
 
 # -- class Scenario -----------------------------------------------------------
 class Scenario(object):
@@ -188,7 +236,7 @@ class Scenario(object):
 
 
 # -- tests function -----------------------------------------------------------
-def _parse(src):
+def _parse(src, registre=None, lazy=False, validate=False, trusted=False):
     """Parse le fichier src, instancie et retourne les objets qu'il contient.
 
     Cette fonction est destinee au tests unitaires. Les utilisateurs sont
@@ -198,6 +246,13 @@ def _parse(src):
     Arguments:
         src (nom de fichier, url, objet fichier...) = source de donnee. Les
             type de src acceptes sont ceux de lxml.etree.parse
+        registre (registre.Registre, defaut None) = cache des entites
+        lazy (bool, defaut False) = si True, les observations et les
+            previsions ne sont decodees qu'au premier acces
+        validate (bool, defaut False) = si True, le fichier est valide contre
+            le schema XSD pendant sa lecture
+        trusted (bool, defaut False) = si True, le fichier est valide et les
+            objets sont construits sans controle de leurs proprietes
 
     Retourne un dictionnaire avec les cles:
             # scenario: xml.Scenario
@@ -207,32 +262,31 @@ def _parse(src):
 
     """
     # read the file
-    parser = _etree.XMLParser(
-        remove_blank_text=True, remove_comments=True, ns_clean=True
-    )
-    tree = _etree.parse(src, parser=parser)
-
-    # deal with namespaces
-    # TODO - we could certainly do better with namespaces
-    if tree.getroot().nsmap != {}:
-        raise ValueError("can't parse xml file with namespaces")
+    with _instrument.stage('read.parse'):
+        tree = _read(src, validate=(validate or trusted))
 
     return {
         'scenario': _scenario_from_element(tree.find('Scenario')),
         # 'intervenants':
-        'siteshydro': _siteshydro_from_element(tree.find('RefHyd/SitesHydro')),
+        'siteshydro': _siteshydro_from_element(
+            tree.find('RefHyd/SitesHydro'), registre, trusted
+        ),
         # 'sitesmeteo'
         # 'modelesprevision': 'TODOS',
         # 'evenements'
         # 'courbestarage'
         # 'jaugeages'
         # 'courbescorrection'
-        'series': _series_from_element(tree.find('Donnees/Series')),
+        'series': _series_from_element(
+            tree.find('Donnees/Series'), registre, lazy, trusted
+        ),
         # 'obssmeteo'
         # 'obsselab'
         # 'gradshydro'
         # 'qualifsannee'
-        'simulations': _simulations_from_element(tree.find('Donnees/Simuls'))
+        'simulations': _simulations_from_element(
+            tree.find('Donnees/Simuls'), registre, lazy, trusted
+        )
         # 'alarmes'
     }
 
@@ -241,30 +295,43 @@ def _parse(src):
 
 # TODO - these 3 functions can be factorised
 
-def _siteshydro_from_element(element):
-    """Return a list of sitehydro.Sitehydro from a <SitesHydro> element."""
+def _siteshydro_from_element(element, registre=None, trusted=False):
+    """Return a list of sitehydro.Sitehydro from a <SitesHydro> element.
+
+    When a registre is given, the sites, with their stations and capteurs,
+    are added to it.
+
+    """
     if element is not None:
         siteshydro = []
         for sitehydro in element.findall('./SiteHydro'):
-            siteshydro.append(_sitehydro_from_element(sitehydro))
+            siteshydro.append(_sitehydro_from_element(sitehydro, trusted))
+            if registre is not None:
+                registre.add(siteshydro[-1])
         return siteshydro
 
 
-def _series_from_element(element):
+def _series_from_element(element, registre=None, lazy=False, trusted=False):
     """Return a list of obshydro.Serie from a <Series> element."""
     if element is not None:
         series = []
         for serie in element.findall('./Serie'):
-            series.append(_serie_from_element(serie))
+            series.append(_serie_from_element(serie, registre, lazy, trusted))
+        _instrument.count('read.series', len(series))
         return series
 
 
-def _simulations_from_element(element):
+def _simulations_from_element(
+    element, registre=None, lazy=False, trusted=False
+):
     """Return a list of simulation.Simulation from a <Simuls> element."""
     if element is not None:
         simuls = []
         for simul in element.findall('./Simul'):
-            simuls.append(_simulation_from_element(simul))
+            simuls.append(
+                _simulation_from_element(simul, registre, lazy, trusted)
+            )
+        _instrument.count('read.simulations', len(simuls))
         return simuls
 
 
@@ -286,7 +353,7 @@ def _scenario_from_element(element):
         )
 
 
-def _sitehydro_from_element(element):
+def _sitehydro_from_element(element, trusted=False):
     """Return a sitehydro.Sitehydro from a <SiteHydro> element."""
     if element is not None:
         # prepare args
@@ -294,17 +361,17 @@ def _sitehydro_from_element(element):
         args['code'] = _value(element, 'CdSiteHydro')
         args['libelle'] = _value(element, 'LbSiteHydro')
         args['stations'] = [
-            _stationhydro_from_element(e)
+            _stationhydro_from_element(e, trusted)
             for e in element.findall('StationsHydro/StationHydro')
         ]
         typesite = _value(element, 'TypSiteHydro')
         if typesite is not None:
             args['typesite'] = typesite
         # build Site
-        return _sitehydro.Sitehydro(**args)
+        return _build(_sitehydro.Sitehydro, trusted, **args)
 
 
-def _stationhydro_from_element(element):
+def _stationhydro_from_element(element, trusted=False):
     """Return a sitehydro.Stationhydro from a <Stationhydro> element."""
     if element is not None:
         # prepare args
@@ -312,17 +379,17 @@ def _stationhydro_from_element(element):
         args['code'] = _value(element, 'CdStationHydro')
         args['libelle'] = _value(element, 'LbStationHydro')
         args['capteurs'] = [
-            _capteur_from_element(e)
+            _capteur_from_element(e, trusted)
             for e in element.findall('Capteurs/Capteur')
         ]
         typestation = _value(element, 'TypStationHydro')
         if typestation is not None:
             args['typestation'] = typestation
         # build Station
-        return _sitehydro.Stationhydro(**args)
+        return _build(_sitehydro.Stationhydro, trusted, **args)
 
 
-def _capteur_from_element(element):
+def _capteur_from_element(element, trusted=False):
     """Return a sitehydro.Capteur from a <Capteur> element."""
     if element is not None:
         # prepare args
@@ -333,135 +400,441 @@ def _capteur_from_element(element):
         if typemesure is not None:
             args['typemesure'] = typemesure
         # build Capteur
-        return _sitehydro.Capteur(**args)
+        return _build(_sitehydro.Capteur, trusted, **args)
+
+
+def _serie_from_element(element, registre=None, lazy=False, trusted=False):
+    """Return a obshydro.Serie from a <Serie> element.
 
+    When lazy is True, the observations are decoded on first access.
+    When trusted is True, the element must be valid against the XSD.
 
-def _serie_from_element(element):
-    """Return a obshydro.Serie from a <Serie> element."""
+    """
     if element is not None:
 
         # entite can be a Sitehydro, a Stationhydro or a Capteur
         entite = None
         if element.find('CdSiteHydro') is not None:
-            entite = _sitehydro.Sitehydro(
-                code=_value(element, 'CdSiteHydro')
+            entite = _entite(
+                _sitehydro.Sitehydro, _value(element, 'CdSiteHydro'),
+                registre, trusted
             )
         elif element.find('CdStationHydro') is not None:
-            entite = _sitehydro.Stationhydro(
-                code=_value(element, 'CdStationHydro')
+            entite = _entite(
+                _sitehydro.Stationhydro, _value(element, 'CdStationHydro'),
+                registre, trusted
             )
         elif element.find('CdCapteur') is not None:
-            entite = _sitehydro.Capteur(
-                code=_value(element, 'CdCapteur')
+            entite = _entite(
+                _sitehydro.Capteur, _value(element, 'CdCapteur'), registre,
+                trusted
             )
 
         # make the Serie
+        if trusted:
+            return _obshydro.Serie.from_trusted(
+                entite=entite,
+                grandeur=_value(element, 'GrdSerie'),
+                statut=_value(element, 'StatutSerie', int),
+                observations=_decoder(
+                    _observations_from_trusted, element.find('ObssHydro'),
+                    lazy
+                )
+            )
         return _obshydro.Serie(
             entite=entite,
             grandeur=_value(element, 'GrdSerie'),
             statut=_value(element, 'StatutSerie'),
-            observations=_observations_from_element(element.find('ObssHydro'))
+            observations=_decoder(
+                _observations_from_element, element.find('ObssHydro'), lazy
+            )
         )
 
 
+@_instrument.timed('read.observations')
 def _observations_from_element(element):
     """Return a obshydro.Observations from a <ObssHydro> element."""
     if element is not None:
 
+        # the tags, with the namespace of the document
+        ns = _namespace(element)
+        dtobs, resobs, methobs, qualifobs, contobs = (
+            ns + tag for tag in (
+                'DtObsHydro', 'ResObsHydro', 'MethObsHydro', 'QualifObsHydro',
+                'ContObsHydro'
+            )
+        )
+
         # prepare a list of Observation
         observations = []
         for o in element:
             args = {}
-            args['dte'] = _value(o, 'DtObsHydro', _UTC)
-            args['res'] = _value(o, 'ResObsHydro')
-            mth = _value(o, 'MethObsHydro', int)
+            args['dte'] = _value(o, dtobs, _UTC)
+            args['res'] = _value(o, resobs)
+            mth = _value(o, methobs, int)
             if mth is not None:
                 args['mth'] = mth
-            qal = _value(o, 'QualifObsHydro', int)
+            qal = _value(o, qualifobs, int)
             if qal is not None:
                 args['qal'] = qal
             # we can't use bool injection here because bool('False') is True
-            cnt = _value(o, 'ContObsHydro')
+            cnt = _value(o, contobs)
             if cnt is not None:
                 args['cnt'] = True if (cnt == 'True') else False
             observations.append(_obshydro.Observation(**args))
 
         # build Observations
-        return _obshydro.Observations(*observations)
+        _instrument.count('read.observations', len(observations))
+        with _instrument.stage('read.observations.build'):
+            return _obshydro.Observations(*observations)
+
+
+def _simulation_from_element(
+    element, registre=None, lazy=False, trusted=False
+):
+    """Return a simulation.Simulation from a <Simul> element.
 
+    When lazy is True, the previsions are decoded on first access.
+    When trusted is True, the element must be valid against the XSD.
 
-def _simulation_from_element(element):
-    """Return a simulation.Simulation from a <Simul> element."""
+    """
     if element is not None:
         # entite can be a Sitehydro or a Stationhydro
         entite = None
         if element.find('CdSiteHydro') is not None:
-            entite = _sitehydro.Sitehydro(
-                code=_value(element, 'CdSiteHydro')
+            entite = _entite(
+                _sitehydro.Sitehydro, _value(element, 'CdSiteHydro'),
+                registre, trusted
             )
         elif element.find('CdStationHydro') is not None:
-            entite = _sitehydro.Stationhydro(
-                code=_value(element, 'CdStationHydro')
+            entite = _entite(
+                _sitehydro.Stationhydro, _value(element, 'CdStationHydro'),
+                registre, trusted
             )
+        modeleprevision = _entite(
+            _modeleprevision.Modeleprevision,
+            _value(element, 'CdModelePrevision'),
+            registre, trusted
+        )
+        qualite = _value(element, 'IndiceQualiteSimul', float)
+        if qualite is not None:
+            qualite = int(qualite)  # int(float())
+        # we can't use bool injection here because bool('False') is True
+        public = (_value(element, 'PubliSimul') == 'True')
+
         # make the Simulation
+        if trusted:
+            dtprod = _value(element, 'DtProdSimul', _UTC)
+            if dtprod is not None:
+                dtprod = _numpy.datetime64(dtprod, 's')
+            return _simulation.Simulation.from_trusted(
+                entite=entite,
+                modeleprevision=modeleprevision,
+                grandeur=_value(element, 'GrdSimul'),
+                statut=_value(element, 'StatutSimul', int),
+                qualite=qualite,
+                public=public,
+                commentaire=_value(element, 'ComSimul'),
+                dtprod=dtprod,
+                previsions=_decoder(
+                    _previsions_from_trusted, element.find('Prevs'), lazy
+                )
+            )
         return _simulation.Simulation(
             entite=entite,
-            modeleprevision=_modeleprevision.Modeleprevision(
-                code=_value(element, 'CdModelePrevision')
-            ),
+            modeleprevision=modeleprevision,
             grandeur=_value(element, 'GrdSimul'),
             statut=_value(element, 'StatutSimul', int),
-            qualite=int(_value(element, 'IndiceQualiteSimul', float)),  # int(float())
-            public=_value(element, 'PubliSimul', bool),
+            qualite=qualite,
+            public=public,
             commentaire=_value(element, 'ComSimul'),
             dtprod=_value(element, 'DtProdSimul', _UTC),
-            previsions=_previsions_from_element(element.find('Prevs'))
+            previsions=_decoder(
+                _previsions_from_element, element.find('Prevs'), lazy
+            )
         )
 
 
+@_instrument.timed('read.previsions')
 def _previsions_from_element(element):
     """Return a simulation.Previsions from a <Prevs> element."""
     if element is not None:
 
+        # the tags and the xpaths, with the namespace of the document
+        ns = _namespace(element)
+        dtprev, resprobprev, pprobprev = (
+            ns + tag for tag in ('DtPrev', 'ResProbPrev', 'PProbPrev')
+        )
+        xpath_resprev, xpath_probprev = _xpaths(ns)
+
         previsions = []
         for prev in element:
-            dte = _value(prev, 'DtPrev', _UTC)
+            dte = _value(prev, dtprev, _UTC)
 
             # -------------------
             # compute Res[Min|Moy|Max]Prev
             # -------------------
             # xpath syntax: p.xpath('ResMoyPrev|ResMinPrev|ResMaxPrev')
-            for resprev in prev.xpath('|'.join(PREV_PROBABILITY)):
+            for resprev in xpath_resprev(prev):
                 previsions.append(
                     _simulation.Prevision(
                         dte=dte,
                         res=resprev.text,
-                        prb=PREV_PROBABILITY[resprev.tag]
+                        prb=PREV_PROBABILITY[resprev.tag[len(ns):]]
                     )
                 )
 
             # -------------------
             # compute ProbsPrev
             # -------------------
-            for probprev in prev.findall('.//ProbPrev'):
+            for probprev in xpath_probprev(prev):
                 previsions.append(
                     _simulation.Prevision(
                         dte=dte,
-                        res=_value(probprev, 'ResProbPrev', float),
-                        prb=_value(probprev, 'PProbPrev', int)
+                        res=_value(probprev, resprobprev, float),
+                        prb=_value(probprev, pprobprev, int)
                     )
                 )
 
-        return _simulation.Previsions(*previsions)
+        _instrument.count('read.previsions', len(previsions))
+        with _instrument.stage('read.previsions.build'):
+            return _simulation.Previsions(*previsions)
+
+
+# -- trusted functions --------------------------------------------------------
+@_instrument.timed('read.observations')
+def _observations_from_trusted(element):
+    """Return a obshydro.Observations from a valid <ObssHydro> element.
+
+    The XSD guarantees the order of the <ObsHydro> children, the values are
+    not checked.
+
+    """
+    if element is not None:
+        ns = _namespace(element)
+        methobs, qualifobs, contobs = (
+            ns + tag for tag in (
+                'MethObsHydro', 'QualifObsHydro', 'ContObsHydro'
+            )
+        )
+        dte, res, mth, qal, cnt = [], [], [], [], []
+        for o in element:
+            dte.append(_UTC(o[0].text))
+            res.append(o[1].text)
+            # optional tags
+            m, q, c = 0, 16, True
+            for child in o[2:]:
+                if child.tag == methobs:
+                    m = child.text
+                elif child.tag == qualifobs:
+                    q = child.text
+                elif child.tag == contobs:
+                    c = (child.text == 'True')
+            mth.append(m)
+            qal.append(q)
+            cnt.append(c)
+
+        # build Observations
+        _instrument.count('read.observations', len(dte))
+        with _instrument.stage('read.observations.build'):
+            return _obshydro.Observations.from_arrays(
+                dte=dte, res=res, mth=mth, qal=qal, cnt=cnt
+            )
+
+
+@_instrument.timed('read.previsions')
+def _previsions_from_trusted(element):
+    """Return a simulation.Previsions from a valid <Prevs> element.
+
+    The XSD guarantees the order of the <Prev> children, the values are
+    not checked.
+
+    """
+    if element is not None:
+        ns = _namespace(element)
+        probsprev = ns + 'ProbsPrev'
+        resprev = dict(
+            (ns + tag, prb) for tag, prb in PREV_PROBABILITY.items()
+        )
+        dte, res, prb = [], [], []
+        for prev in element:
+            d = _UTC(prev[0].text)
+            for child in prev[1:]:
+                if child.tag == probsprev:
+                    for probprev in child:
+                        dte.append(d)
+                        prb.append(probprev[0].text)
+                        res.append(probprev[1].text)
+                elif child.tag in resprev:
+                    dte.append(d)
+                    prb.append(resprev[child.tag])
+                    res.append(child.text)
+
+        _instrument.count('read.previsions', len(dte))
+        with _instrument.stage('read.previsions.build'):
+            return _simulation.Previsions.from_arrays(
+                dte=dte, res=res, prb=prb
+            )
 
 
 # -- utility functions --------------------------------------------------------
+def _schema():
+    """Return the compiled XSD, loaded once."""
+    global _SCHEMA
+    if _SCHEMA is None:
+        with _SCHEMA_LOCK:
+            if _SCHEMA is None:
+                _SCHEMA = _etree.XMLSchema(_etree.parse(XSD))
+    return _SCHEMA
+
+
+def _parser(validate=False):
+    """Return the XMLParser of the current thread.
+
+    When validate is True, the parser validates the documents against the
+    XSD while parsing them.
+
+    """
+    attr = 'vparser' if validate else 'parser'
+    parser = getattr(_LOCAL, attr, None)
+    if parser is None:
+        parser = _etree.XMLParser(
+            remove_blank_text=True, remove_comments=True, ns_clean=True,
+            schema=_schema() if validate else None
+        )
+        setattr(_LOCAL, attr, parser)
+    return parser
+
+
+def _read(src, validate=False):
+    """Parse src and return the ElementTree, without namespace.
+
+    A compressed src is decompressed on the fly.
+    Raise a ValueError if validate is True and src is not valid.
+
+    """
+    try:
+        # libxml2 reads the gzip files faster than python
+        with _compression.uncompressed(src, native=('gzip',)) as stream:
+            return _normalize(
+                _etree.parse(stream, parser=_parser(validate=validate))
+            )
+    except _etree.XMLSyntaxError as err:
+        # a well formed but invalid document
+        last = err.error_log.last_error
+        if (last is not None) and \
+                (last.domain == _etree.ErrorDomains.SCHEMASV):
+            raise ValueError('invalid xml file: %s' % err)
+        raise
+
+
+def _normalize(tree):
+    """Remove in place the namespace of the root element from the tree.
+
+    The content of the _BULK elements, which is most of the document, is left
+    unchanged and decoded with the namespace. The tree is only walked when
+    the root element has a namespace.
+
+    """
+    _strip(tree.getroot())
+    return tree
+
+
+def _strip(element):
+    """Remove in place the namespace of element from its subtree.
+
+    See _normalize.
+
+    """
+    namespace = _etree.QName(element).namespace
+    if namespace is not None:
+        prefix = '{%s}' % namespace
+        elements = [element]
+        while elements:
+            element = elements.pop()
+            if element.tag.startswith(prefix):
+                element.tag = element.tag[len(prefix):]
+            if element.tag not in _BULK:
+                elements.extend(element.iterchildren(_etree.Element))
+
+
+def _namespace(element):
+    """Return the '{namespace}' of the children of element, or ''."""
+    if len(element) and element[0].tag.startswith('{'):
+        return element[0].tag[:element[0].tag.index('}') + 1]
+    return ''
+
+
+def _xpaths(ns=''):
+    """Return the compiled XPath of the previsions for the namespace ns.
+
+    The result is a tuple (Res[Min|Moy|Max]Prev, ProbPrev).
+
+    """
+    xpaths = _XPATHS.get(ns)
+    if xpaths is None:
+        with _XPATHS_LOCK:
+            if ns:
+                namespaces = {'ns': ns[1:-1]}
+                qualify = 'ns:%s'
+            else:
+                namespaces = None
+                qualify = '%s'
+            xpaths = _XPATHS[ns] = (
+                _etree.XPath(
+                    '|'.join(qualify % tag for tag in PREV_PROBABILITY),
+                    namespaces=namespaces
+                ),
+                _etree.XPath(
+                    './/%s' % (qualify % 'ProbPrev'), namespaces=namespaces
+                )
+            )
+    return xpaths
+
+
+def _build(cls, trusted=False, **kargs):
+    """Return cls(**kargs), or cls.from_trusted(**kargs) when trusted."""
+    if trusted:
+        return cls.from_trusted(**kargs)
+    return cls(**kargs)
+
+
+def _decoder(func, element, lazy=False):
+    """Return func(element), or a Lazy value when lazy is True.
+
+    A lazy value keeps a reference to the element, and so to the whole
+    document, until it is decoded.
+
+    """
+    if (element is None) or (not lazy):
+        return func(element)
+    return _lazy.Lazy(func, element)
+
+
+def _entite(cls, code, registre=None, trusted=False):
+    """Return cls(code=code) or the registre one.
+
+    When trusted is True, cls.from_trusted is used if it exists.
+
+    """
+    if registre is not None:
+        return registre.get(cls, code)
+    if trusted and hasattr(cls, 'from_trusted'):
+        return cls.from_trusted(code=code)
+    return cls(code=code)
+
+
 def _UTC(dte):
-    """Add +00 to the string dte if no time zone."""
-    if (dte is not None) and (dte.find('+') == -1):
-        return '%s+00' % dte
-    else:
+    """Add +00 to the string dte if no time zone.
+
+    The time zones of the XSD dateType are Z, +hh[[:]mm] and -hh[[:]mm],
+    the date part 'yyyy-mm-dd' has no '-' after its 10th character.
+
+    """
+    if (dte is None) or dte.endswith('Z') or (dte.find('+') != -1) or \
+            (dte.find('-', 10) != -1):
         return dte
+    return '%s+00' % dte
 
 
 def _value(element, tag, cast=unicode):
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""Module xml._instrument.
+
+Ce module contient la classe:
+    # Instrument
+
+et les fonctions utilisees par les convertisseurs pour s'instrumenter:
+    # stage(name) = context manager qui chronometre une etape
+    # timed(name) = decorateur qui chronometre une fonction
+    # count(name, n) = incremente un compteur
+    # enabled() = True si un Instrument est actif
+
+Un Instrument est un context manager qui collecte, pendant sa duree de vie,
+les temps passes dans chaque etape de la lecture et de l'ecriture des
+messages Xml et les compteurs associes:
+    with xml.Instrument() as instrument:
+        msg = xml.Message.from_file('message.xml')
+        msg.write('copie.xml')
+    print(instrument)
+
+Les etapes chronometrees sont:
+    # read.parse = lecture du fichier par lxml
+    # read.scenario, read.siteshydro, read.series, read.simulations =
+        decodage des sections du message, construction des objets incluse
+    # read.observations, read.previsions = decodage des observations et des
+        previsions, dont:
+    # read.observations.build, read.previsions.build = construction des
+        objets pandas
+    # write.build = construction de l'arbre Xml, dont:
+    # write.observations, write.previsions = encodage des observations et des
+        previsions
+    # write.serialize = ecriture du fichier par lxml
+
+Les compteurs sont:
+    # read.bytes, write.bytes = taille des fichiers lus et ecrits
+    # read.elements, write.elements = nombre d'elements Xml
+    # read.series, read.simulations, read.observations, read.previsions,
+        write.series, write.simulations, write.observations,
+        write.previsions = nombre d'objets decodes ou encodes
+
+Sans Instrument actif, l'instrumentation se limite a un test par etape.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import os as _os
+import collections as _collections
+import functools as _functools
+import timeit as _timeit
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- todos ---------------------------------------------------------------------
+# TODO - the active instruments are shared by all the threads
+
+
+# -- config -------------------------------------------------------------------
+# the active instruments
+ACTIVE = []
+
+
+#-- class Instrument ----------------------------------------------------------
+class Instrument(object):
+    """Classe Instrument.
+
+    Context manager qui collecte les temps et les compteurs des convertisseurs
+    Xml.
+
+    Proprietes:
+        times (dict) = {etape: secondes}
+        calls (dict) = {etape: nombre de passages}
+        counts (dict) = {compteur: valeur}
+        ontime (callable, defaut None) = fonction ontime(etape, secondes)
+            appelee a la fin de chaque etape
+        oncount (callable, defaut None) = fonction oncount(compteur, n)
+            appelee a chaque increment
+
+    """
+
+    def __init__(self, ontime=None, oncount=None):
+        """Initialisation.
+
+        Arguments:
+            ontime (callable, defaut None) = fonction ontime(etape, secondes)
+            oncount (callable, defaut None) = fonction oncount(compteur, n)
+
+        """
+        self.ontime = ontime
+        self.oncount = oncount
+        self.reset()
+
+    def reset(self):
+        """Remet a zero les temps et les compteurs."""
+        self.times = _collections.defaultdict(float)
+        self.calls = _collections.defaultdict(int)
+        self.counts = _collections.defaultdict(int)
+
+    def time(self, stage, seconds):
+        """Ajoute seconds au temps de l'etape stage."""
+        self.times[stage] += seconds
+        self.calls[stage] += 1
+        if self.ontime is not None:
+            self.ontime(stage, seconds)
+
+    def count(self, name, n=1):
+        """Ajoute n au compteur name."""
+        self.counts[name] += n
+        if self.oncount is not None:
+            self.oncount(name, n)
+
+    def __enter__(self):
+        """Active l'Instrument."""
+        ACTIVE.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Desactive l'Instrument."""
+        ACTIVE.remove(self)
+        return False
+
+    def __unicode__(self):
+        """Unicode representation."""
+        lines = ['Instrument']
+        for stage in sorted(self.times):
+            lines.append('    {0:<28} {1:>10.6f} s {2:>8} appel(s)'.format(
+                stage, self.times[stage], self.calls[stage]
+            ))
+        for name in sorted(self.counts):
+            lines.append('    {0:<28} {1:>12}'.format(
+                name, self.counts[name]
+            ))
+        return '\n'.join(lines)
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- private classes -----------------------------------------------------------
+class _Stage(object):
+    """Context manager timing a stage for the active instruments."""
+
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = _timeit.default_timer()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = _timeit.default_timer() - self.start
+        for instrument in ACTIVE:
+            instrument.time(self.name, seconds)
+        return False
+
+
+class _NullStage(object):
+    """Context manager doing nothing, used when no instrument is active."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+#-- functions -----------------------------------------------------------------
+def enabled():
+    """Return True if an Instrument is active."""
+    return bool(ACTIVE)
+
+
+def stage(name):
+    """Return a context manager timing the stage name."""
+    if ACTIVE:
+        return _Stage(name)
+    return _NULL_STAGE
+
+
+def timed(name):
+    """Decorator timing the calls of a function as the stage name."""
+    def decorator(func):
+        @_functools.wraps(func)
+        def wrapper(*args, **kargs):
+            if not ACTIVE:
+                return func(*args, **kargs)
+            with _Stage(name):
+                return func(*args, **kargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    """Add n to the counter name of the active instruments."""
+    for instrument in ACTIVE:
+        instrument.count(name, n)
+
+
+def nbytes(obj):
+    """Return the size in bytes of a file name or of a file object.
+
+    For a file object, this is its position, i.e. the size of the data read
+    or written. Return None if the size is unknown (urls...).
+
+    """
+    try:
+        if isinstance(obj, basestring):
+            return _os.path.getsize(obj)
+        return obj.tell()
+    except Exception:
+        return None
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Module xml._peek.
+
+Ce module contient la fonction:
+    # peek(src, count=False)
+
+La fonction peek lit le scenario d'un message Xml Hydrometrie sans decoder le
+reste du document, pour router un message avant de decider de le lire:
+    scenario = xml.peek('message.xml')
+    if scenario.destinataire.code == '1537':
+        message = xml.Message.from_file('message.xml')
+
+Le fichier est lu par blocs de PEEK octets et passe a un parseur incremental
+qui s'arrete a la fin de l'element <Scenario>, en general dans le premier
+bloc.
+
+Avec count=True, le reste du fichier est parcouru, sans parseur Xml, pour
+compter les elements <Serie> et <Simul>. Le comptage est une simple recherche
+des balises ouvrantes dans les octets du fichier, les balises placees dans
+des commentaires ou des sections CDATA sont donc aussi comptees.
+
+Les fichiers compresses (gzip, bz2 ou xz) sont decompresses a la volee.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import io as _io
+import re as _re
+
+from lxml import etree as _etree
+
+from libhydro.conv import _compression
+from . import _from_xml
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the size of the blocks read until the end of the scenario
+PEEK = 4 * 1024
+
+# the counted elements, by tag
+COUNTED = {b'Serie': 'series', b'Simul': 'simulations'}
+
+# an opening tag of a counted element, with an optional namespace prefix
+_TAGS = _re.compile(
+    b'<(?:[\\w.-]+:)?(' + b'|'.join(COUNTED) + b')[\\s/>]'
+)
+
+
+#-- functions -----------------------------------------------------------------
+def peek(src, count=False):
+    """Retourne le scenario du message src.
+
+    Arguments:
+        src (nom de fichier ou objet fichier ouvert en mode binaire)
+        count (bool, defaut False) = si True, compte aussi les series et les
+            simulations du message
+
+    Retourne un xml.Scenario, ou None si le message n'a pas de scenario, ou
+    avec count=True un tuple (scenario, {'series': n, 'simulations': n}).
+
+    Leve une lxml.etree.XMLSyntaxError si le debut du message est mal forme.
+
+    """
+    with _compression.uncompressed(src) as stream:
+        if isinstance(stream, basestring):
+            with _io.open(stream, 'rb') as f:
+                return _peek(f, count)
+        return _peek(stream, count)
+
+
+#-- private functions ---------------------------------------------------------
+def _peek(stream, count=False):
+    """Return the peek() result of the binary file object stream."""
+    parser = _etree.XMLPullParser(events=('start', 'end'))
+    counts = dict((name, 0) for name in COUNTED.values())
+    scenario = None
+    tail = b''
+    done = False
+    while True:
+        data = stream.read(PEEK)
+        if count:
+            tail = _count(tail + data, counts, last=not data)
+        if not done and data:
+            parser.feed(data)
+            done, scenario = _scenario(parser)
+        if not data or (done and not count):
+            break
+    if count:
+        return scenario, counts
+    return scenario
+
+
+def _scenario(parser):
+    """Return (done, scenario) from the pending events of parser.
+
+    done is True when the scenario is decoded, or when the first child of the
+    root element is not a scenario.
+
+    """
+    for event, element in parser.read_events():
+        parent = element.getparent()
+        if (parent is None) or (parent.getparent() is not None):
+            continue
+        if _etree.QName(element).localname != 'Scenario':
+            return True, None
+        if event == 'end':
+            _from_xml._strip(element)
+            return True, _from_xml._scenario_from_element(element)
+    return False, None
+
+
+def _count(data, counts, last=False):
+    """Add the counted tags of data to counts, return the unread tail.
+
+    The data after the last '<' is returned unread, unless last is True, as
+    it can be the beginning of a tag.
+
+    """
+    end = len(data) if last else data.rfind(b'<')
+    if end < 0:
+        return b''
+    for tag in _TAGS.findall(data, 0, end):
+        counts[COUNTED[tag]] += 1
+    return data[end:]
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Module xml._stream.
+
+Ce module contient la classe:
+    # MessageParser
+
+Un MessageParser decode un message Xml Hydrometrie au fur et a mesure que ses
+octets arrivent (upload HTTP, socket...), sans attendre la fin du message ni
+passer par un fichier:
+    parser = xml.MessageParser()
+    for chunk in upload:
+        for obj in parser.feed(chunk):
+            traitement(obj)
+    for obj in parser.close():
+        traitement(obj)
+
+Les objets sont retournes des que leur element Xml est complet, dans l'ordre
+du message:
+    # les sitehydro.Sitehydro du referentiel
+    # les obshydro.Serie
+    # les simulation.Simulation
+Le scenario est disponible dans la propriete scenario des qu'il est lu.
+
+Les elements decodes sont liberes au fur et a mesure, la memoire utilisee
+reste de l'ordre de celle du plus gros element.
+
+La methode feed ne bloque pas sur les entrees-sorties, un MessageParser peut
+donc etre alimente par une boucle evenementielle, un serveur asynchrone...
+Pour lire plusieurs fichiers en parallele, voir Message.from_files.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+from lxml import etree as _etree
+
+from . import (_from_xml, _instrument)
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- todos ---------------------------------------------------------------------
+# TODO - XSD validation: the pull parser only validates the document on
+#        close, after the objects have been returned
+
+
+# -- config -------------------------------------------------------------------
+# the decoded elements, by (parent tag, tag)
+DECODERS = {
+    ('SitesHydro', 'SiteHydro'): 'siteshydro',
+    ('Series', 'Serie'): 'series',
+    ('Simuls', 'Simul'): 'simulations'
+}
+
+
+#-- class MessageParser -------------------------------------------------------
+class MessageParser(object):
+    """Classe MessageParser.
+
+    Parseur incremental de messages Xml Hydrometrie.
+
+    Proprietes:
+        scenario (xml.Scenario) = le scenario du message, None tant qu'il
+            n'est pas lu
+        registre (registre.Registre, defaut None) = cache d'entites, voir
+            Message.from_file
+
+    Methodes:
+        feed(data) = ajoute des octets au message et retourne la liste des
+            objets completes
+        close() = termine le message et retourne la liste des derniers
+            objets
+
+    """
+
+    def __init__(self, registre=None):
+        """Constructeur.
+
+        Arguments:
+            registre (registre.Registre, defaut None) = cache d'entites
+
+        """
+        self.registre = registre
+        self.scenario = None
+        self._parser = _etree.XMLPullParser(
+            events=('end',),
+            tag=('{*}Scenario', '{*}SiteHydro', '{*}Serie', '{*}Simul'),
+            remove_blank_text=True,
+            remove_comments=True
+        )
+
+    def feed(self, data):
+        """Ajoute les octets data au message.
+
+        Retourne la liste des objets dont l'element Xml est complet.
+
+        """
+        _instrument.count('read.bytes', len(data))
+        self._parser.feed(data)
+        return self._objects()
+
+    def close(self):
+        """Termine le message et retourne la liste des derniers objets.
+
+        Leve une lxml.etree.XMLSyntaxError si le message est incomplet.
+
+        """
+        self._parser.close()
+        return self._objects()
+
+    def _objects(self):
+        """Return the list of the decoded objects of the pending events."""
+        objects = []
+        for _, element in self._parser.read_events():
+            obj = self._decode(element)
+            if obj is not None:
+                objects.append(obj)
+        return objects
+
+    def _decode(self, element):
+        """Decode and free element, return the decoded object or None."""
+        parent = element.getparent()
+        if parent is None:
+            return None
+        key = (
+            _etree.QName(parent).localname, _etree.QName(element).localname
+        )
+        if key == ('hydrometrie', 'Scenario'):
+            _from_xml._strip(element)
+            self.scenario = _from_xml._scenario_from_element(element)
+            obj = None
+        elif key in DECODERS:
+            _from_xml._strip(element)
+            obj = self._decoder(DECODERS[key], element)
+        else:
+            # an element with a known tag at an unexpected place
+            return None
+
+        # free the element and its previous siblings
+        element.clear()
+        while element.getprevious() is not None:
+            del parent[0]
+        return obj
+
+    def _decoder(self, section, element):
+        """Return the object of element in section."""
+        if section == 'siteshydro':
+            obj = _from_xml._sitehydro_from_element(element)
+            if self.registre is not None:
+                self.registre.add(obj)
+            return obj
+        if section == 'series':
+            _instrument.count('read.series')
+            return _from_xml._serie_from_element(element, self.registre)
+        _instrument.count('read.simulations')
+        return _from_xml._simulation_from_element(element, self.registre)
@@ -21,15 +21,19 @@ from __future__ import (
 from lxml import etree as _etree
 import numpy as _numpy
 
+from . import _instrument
+
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1e"""
-__date__ = """2013-09-04"""
+__version__ = """0.1f"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-20
 #    first shot
+#V0.1f - 2026-10-19
+#    instrumented encoding stages
 
 
 #-- todos ---------------------------------------------------------------------
@@ -121,6 +125,7 @@ def _series_to_element(series):
         element = _etree.Element('Series')
         for serie in series:
             element.append(_serie_to_element(serie))
+        _instrument.count('write.series', len(series))
         return element
 
 
@@ -130,6 +135,7 @@ def _simulations_to_element(simulations):
         element = _etree.Element('Simuls')
         for simulation in simulations:
             element.append(_simulation_to_element(simulation))
+        _instrument.count('write.simulations', len(simulations))
         return element
 
 
@@ -266,6 +272,7 @@ def _serie_to_element(serie):
         return element
 
 
+@_instrument.timed('write.observations')
 def _observations_to_element(observations):
     """Return a <ObssHydro> element from a obshydro.Observations."""
 
@@ -294,6 +301,7 @@ def _observations_to_element(observations):
                 child.text = unicode(observation[1]['cnt'])
 
         # return
+        _instrument.count('write.observations', len(observations))
         return element
 
 
@@ -337,6 +345,7 @@ def _simulation_to_element(simulation):
         return element
 
 
+@_instrument.timed('write.previsions')
 def _previsions_to_element(previsions):
     """Return a <Prevs> element from a simulation.Previsions."""
 
@@ -398,6 +407,7 @@ def _previsions_to_element(previsions):
                     )
 
         # return
+        _instrument.count('write.previsions', len(previsions))
         return element
 
 
@@ -18,7 +18,7 @@ import os as _os
 
 from lxml import etree as _etree
 
-from . import (_from_xml, _to_xml)
+from . import (_from_xml, _to_xml, _instrument)
 from libhydro.core import (
     # intervenant as _intervenant,  # FIXME
     sitehydro as _sitehydro,
@@ -29,12 +29,26 @@ from libhydro.core import (
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1e"""
-__date__ = """2013-09-05"""
+__version__ = """0.1l"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-20
 #    first shot
+#V0.1f - 2026-10-19
+#    registre argument of Message.from_file
+#V0.1g - 2026-10-19
+#    instrumented read and write
+#V0.1h - 2026-10-19
+#    per-thread parser
+#V0.1i - 2026-10-19
+#    validate and trusted arguments of Message.from_file
+#V0.1j - 2026-10-19
+#    namespaced messages
+#V0.1k - 2026-10-19
+#    compressed sources
+#V0.1l - 2026-10-19
+#    Message.from_files
 
 
 # -- class Message ------------------------------------------------------------
@@ -206,32 +220,93 @@ class Message(object):
 
     # -- class methods --
     @classmethod
-    def from_file(cls, src):
+    def from_file(
+        cls, src, registre=None, lazy=False, validate=False, trusted=False
+    ):
         """Parse le fichier src et retourne un xml.Message.
 
         Arguments:
             src (nom de fichier, url, objet fichier...) = source de donnee. Les
-                type de src acceptes sont ceux de lxml.etree.parse
+                type de src acceptes sont ceux de lxml.etree.parse. Les
+                fichiers compresses en gzip, bz2 ou xz sont decompresses a la
+                volee
+            registre (registre.Registre, defaut None) = cache d'entites. Si
+                il est fourni, les series et les simulations partagent les
+                instances des entites de meme code, y compris entre plusieurs
+                appels, et les sites du message y sont enregistres
+            lazy (bool, defaut False) = si True, les observations des series
+                et les previsions des simulations ne sont decodees qu'au
+                premier acces a la propriete correspondante. Le document Xml
+                reste alors en memoire jusqu'au decodage. Ce mode accelere la
+                lecture des messages dont on ne veut que le contenu (entites,
+                grandeurs...)
+            validate (bool, defaut False) = si True, le message est valide
+                pendant sa lecture contre le schema XSD embarque, une
+                ValueError est levee si il est invalide
+            trusted (bool, defaut False) = si True, le message est valide
+                puis les objets sont construits sans les controles de leurs
+                proprietes, ce qui accelere nettement la lecture. Les
+                controles de coherence entre proprietes ne sont pas faits
 
         """
         # read the file
-        parser = _etree.XMLParser(
-            remove_blank_text=True, remove_comments=True, ns_clean=True
-        )
-        tree = _etree.parse(src, parser=parser)
+        with _instrument.stage('read.parse'):
+            tree = _from_xml._read(src, validate=(validate or trusted))
+        if _instrument.enabled():
+            _instrument.count('read.bytes', _instrument.nbytes(src) or 0)
+            _instrument.count(
+                'read.elements', sum(1 for _ in tree.iter(_etree.Element))
+            )
 
-        # deal with namespaces
-        # TODO - we could certainly do better with namespaces
-        if tree.getroot().nsmap != {}:
-            raise ValueError("can't parse xml file with namespaces")
+        # decode the message sections
+        with _instrument.stage('read.scenario'):
+            scenario = _from_xml._scenario_from_element(tree.find('Scenario'))
+        with _instrument.stage('read.siteshydro'):
+            siteshydro = _from_xml._siteshydro_from_element(
+                tree.find('RefHyd/SitesHydro'), registre, trusted
+            )
+        with _instrument.stage('read.series'):
+            series = _from_xml._series_from_element(
+                tree.find('Donnees/Series'), registre, lazy, trusted
+            )
+        with _instrument.stage('read.simulations'):
+            simulations = _from_xml._simulations_from_element(
+                tree.find('Donnees/Simuls'), registre, lazy, trusted
+            )
 
         return Message(
-            scenario=_from_xml._scenario_from_element(tree.find('Scenario')),
-            siteshydro=_from_xml._siteshydro_from_element(tree.find('RefHyd/SitesHydro')),
-            series=_from_xml._series_from_element(tree.find('Donnees/Series')),
-            simulations=_from_xml._simulations_from_element(tree.find('Donnees/Simuls'))
+            scenario=scenario,
+            siteshydro=siteshydro,
+            series=series,
+            simulations=simulations
         )
 
+    @classmethod
+    def from_files(cls, srcs, executor=None, **kargs):
+        """Parse les fichiers srcs et retourne la liste des xml.Message.
+
+        Les fichiers sont lus par executor, ce qui permet de recouvrir les
+        entrees-sorties et, avec un pool de processus, le decodage. lxml
+        libere le GIL pendant la lecture, un pool de threads suffit quand
+        les messages sont surtout lus.
+
+        Arguments:
+            srcs (iterable de sources) = voir from_file
+            executor (objet avec une methode map(func, iterable), defaut
+                None) = multiprocessing.pool.ThreadPool,
+                multiprocessing.Pool, concurrent.futures.Executor... Sans
+                executor, les fichiers sont lus un par un
+            **kargs = les arguments de from_file. Le registre n'etant pas
+                thread safe, il est interdit avec un executor, et le mode
+                lazy est incompatible avec un pool de processus
+
+        """
+        if executor is None:
+            return [cls.from_file(src, **kargs) for src in srcs]
+        if kargs.get('registre') is not None:
+            raise ValueError("a registre can't be shared by an executor")
+        return list(executor.map(_from_file, [(src, kargs) for src in srcs]))
+
             # 'intervenants':
             # 'sitesmeteo'
             # 'modelesprevision': 'TODOS',
@@ -289,22 +364,30 @@ class Message(object):
         if (not force) and (_os.path.isfile(file)):
             raise IOError('file already exists')
         # procede !
-        tree = _etree.ElementTree(
-            _to_xml._to_xml(
-                scenario=self.scenario,
-                siteshydro=self.siteshydro,
-                series=self.series,
-                simulations=self.simulations
+        with _instrument.stage('write.build'):
+            tree = _etree.ElementTree(
+                _to_xml._to_xml(
+                    scenario=self.scenario,
+                    siteshydro=self.siteshydro,
+                    series=self.series,
+                    simulations=self.simulations
+                )
             )
-        )
-        tree.write(
-            file=file,
-            encoding=encoding,
-            method='xml',
-            pretty_print=False,
-            xml_declaration=True,
-            compression=compression
-        )
+        if _instrument.enabled():
+            _instrument.count(
+                'write.elements', sum(1 for _ in tree.iter(_etree.Element))
+            )
+        with _instrument.stage('write.serialize'):
+            tree.write(
+                file=file,
+                encoding=encoding,
+                method='xml',
+                pretty_print=False,
+                xml_declaration=True,
+                compression=compression
+            )
+        if _instrument.enabled():
+            _instrument.count('write.bytes', _instrument.nbytes(file) or 0)
 
     def show(self):
         """Screen print XML."""
@@ -339,3 +422,14 @@ class Message(object):
             return self.__unicode__()
         else:  # Python 2
             return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+# -- private functions --------------------------------------------------------
+def _from_file(args):
+    """Return Message.from_file(src, **kargs) for args (src, kargs).
+
+    A module function for the process pools.
+
+    """
+    src, kargs = args
+    return Message.from_file(src, **kargs)
@@ -6,23 +6,39 @@ Ce package expose les classes modelisees par le Sandre dans les dictionnaires:
     # processus d'acquisition des donnees hydrometriques (V1.1)
 
 Il contient les modules:
+    # downsample
     # intervenant
     # modeleprevision
     # nomenclature
     # obshydro
+    # panel
+    # referentiel
+    # registre
+    # regularindex
     # simulation
     # sitehydro
 
+Les modules sont importes a leur premier acces, numpy et pandas ne le sont
+que par les modules qui en dependent (downsample, obshydro, panel,
+regularindex, simulation).
 
 """
 __all__ = [
+    'downsample',
     'intervenant',
     'modeleprevision',
     'nomenclature',
     'obshydro',
-    'simulation'
+    'panel',
+    'referentiel',
+    'registre',
+    'regularindex',
+    'simulation',
     'sitehydro',
 ]
+# the modules are imported on first access
+from .._lazyimport import install as _install
+_install(__name__, dict((name, '.' + name) for name in __all__))
 
 # alarm
 # courbecorrection
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Module _lazy.
+
+Ce module prive contient la classe:
+    # Lazy
+
+Un objet Lazy est une valeur dont le calcul est differe jusqu'a sa premiere
+utilisation. Les proprietes qui acceptent un Lazy (Serie.observations,
+Simulation.previsions) le calculent et le remplacent par sa valeur au premier
+acces.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class Lazy ----------------------------------------------------------------
+class Lazy(object):
+    """Classe Lazy.
+
+    Valeur differee, calculee par func(*args) a chaque appel de l'objet.
+
+    """
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        """Initialisation.
+
+        Arguments:
+            func (callable) = fonction de calcul de la valeur
+            *args = arguments de func
+
+        """
+        self.func = func
+        self.args = args
+
+    def __call__(self):
+        """Calcule et retourne la valeur."""
+        return self.func(*self.args)
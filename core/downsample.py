@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""Module downsample.
+
+Ce module contient la classe:
+    # Pyramid
+
+et les fonctions:
+    # downsample(x, y, n_points, method)
+    # lttb(x, y, n_points)
+    # minmax(x, y, n_points)
+
+Ces fonctions reduisent une courbe a n_points points pour l'afficher, en
+conservant sa forme et ses pics. Elles retournent les positions des points
+conserves, toujours dans l'ordre, le premier et le dernier point compris.
+
+Les methodes disponibles sont:
+    # lttb = Largest-Triangle-Three-Buckets: les points sont repartis en
+        n_points - 2 groupes de meme effectif et dans chaque groupe on
+        conserve le point qui forme le plus grand triangle avec le point
+        conserve du groupe precedent et la moyenne du groupe suivant
+    # minmax = les points sont repartis en (n_points - 2) / 2 intervalles de
+        temps de meme duree et dans chaque intervalle on conserve le minimum
+        et le maximum, pour 3 points on conserve le seul extremum le plus
+        eloigne de la moyenne
+
+Une Pyramid conserve des reductions minmax successives d'une courbe, chacune
+FACTOR fois plus petite que la precedente, pour zoomer sans repartir des
+donnees brutes: chaque reduction est calculee a partir du niveau le plus
+grossier qui contient encore assez de points sur la periode demandee. Chaque
+niveau conservant les extremums du precedent, les pics ne sont jamais
+perdus.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import numpy as _numpy
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+METHODS = ('lttb', 'minmax')
+
+# the size ratio of two levels of a pyramid
+FACTOR = 4
+
+# the minimum size of the coarsest level of a pyramid
+MIN_LEVEL = 256
+
+# the minimum ratio of the points of a pyramid level used to the points
+# requested
+OVERSAMPLING = 4
+
+
+#-- class Pyramid -------------------------------------------------------------
+class Pyramid(object):
+    """Classe Pyramid.
+
+    Classe pour conserver les reductions successives d'une courbe.
+
+    Propriete:
+        levels (liste de numpy.array de int) = les positions des points de
+            chaque niveau, du plus fin (tous les points) au plus grossier
+
+    """
+
+    def __init__(self, x, y, factor=FACTOR):
+        """Initialisation.
+
+        Arguments:
+            x (numpy.array de datetime64 ou de nombres, trie) = abscisses
+            y (numpy.array de nombres) = ordonnees, les NaN sont ignores
+            factor (int > 1, defaut FACTOR) = rapport de taille de 2 niveaux
+
+        """
+        if factor < 2:
+            raise ValueError('factor must be greater than 1')
+        self._x, self._y = _floats(x), _numpy.asarray(y, dtype=float)
+        level = _numpy.flatnonzero(~_numpy.isnan(self._y))
+        self.levels = [level]
+        while len(level) // factor >= MIN_LEVEL:
+            level = level[minmax(
+                self._x[level], self._y[level], len(level) // factor
+            )]
+            self.levels.append(level)
+
+    def downsample(self, n_points, method='lttb', begin=None, end=None):
+        """Retourne les positions des n_points points conserves de begin a
+        end.
+
+        Arguments:
+            n_points (int >= 3) = nombre de points maximum
+            method (string in METHODS, defaut lttb)
+            begin, end (memes types que x, defaut None) = bornes incluses,
+                None pour ne pas borner
+
+        """
+        _check(method)
+        begin = None if begin is None else _floats(begin)
+        end = None if end is None else _floats(end)
+        for level in reversed(self.levels):
+            x = self._x[level]
+            start = 0 if begin is None else x.searchsorted(begin)
+            stop = len(x) if end is None else x.searchsorted(end, 'right')
+            if (stop - start >= OVERSAMPLING * n_points) or \
+                    (level is self.levels[0]):
+                break
+        level = level[start:stop]
+        return level[_METHODS[method](
+            self._x[level], self._y[level], n_points
+        )]
+
+    def __len__(self):
+        """Return the number of levels."""
+        return len(self.levels)
+
+
+#-- functions -----------------------------------------------------------------
+def downsample(x, y, n_points, method='lttb'):
+    """Retourne les positions des n_points points conserves.
+
+    Arguments:
+        x (numpy.array de datetime64 ou de nombres, trie) = abscisses
+        y (numpy.array de nombres) = ordonnees, les points NaN ne sont jamais
+            conserves
+        n_points (int >= 3) = nombre de points maximum
+        method (string in METHODS, defaut lttb)
+
+    """
+    _check(method)
+    y = _numpy.asarray(y, dtype=float)
+    valid = _numpy.flatnonzero(~_numpy.isnan(y))
+    return valid[_METHODS[method](_floats(x)[valid], y[valid], n_points)]
+
+
+def lttb(x, y, n_points):
+    """Retourne les positions des points conserves par la methode lttb.
+
+    Voir la fonction downsample, x et y doivent etre des numpy.array de
+    float sans NaN.
+
+    """
+    size = len(x)
+    if n_points < 3:
+        raise ValueError('n_points must be at least 3')
+    if size <= n_points:
+        return _numpy.arange(size)
+    # small abscissas for the areas precision
+    x = x - x[0]
+
+    # the buckets of the points between the first and the last ones
+    nbuckets = n_points - 2
+    bounds = (
+        _numpy.arange(nbuckets + 1) * (size - 2) // nbuckets + 1
+    ).astype(_numpy.int64)
+    starts, sizes = bounds[:-1], _numpy.diff(bounds)
+    # the average point of the next bucket, the last point for the last one
+    xavg = _numpy.append(
+        _numpy.add.reduceat(x[1:-1], starts - 1) / sizes, x[-1]
+    )[1:]
+    yavg = _numpy.append(
+        _numpy.add.reduceat(y[1:-1], starts - 1) / sizes, y[-1]
+    )[1:]
+
+    # the doubled area of the triangle (a, b, c), for a point b of a bucket,
+    # the selected point a of the previous one and the average point c of
+    # the next one, is |xa * p + ya * q + r|
+    positions = starts[:, _numpy.newaxis] + _numpy.minimum(
+        _numpy.arange(sizes.max()), sizes[:, _numpy.newaxis] - 1
+    )
+    xb, yb = x[positions], y[positions]
+    xc, yc = xavg[:, _numpy.newaxis], yavg[:, _numpy.newaxis]
+    p = yb - yc
+    q = xc - xb
+    r = xb * yc - xc * yb
+
+    selected = _numpy.empty(n_points, dtype=_numpy.int64)
+    selected[0], selected[-1] = 0, size - 1
+    a = 0
+    for i in range(nbuckets):
+        areas = _numpy.abs(x[a] * p[i] + y[a] * q[i] + r[i])
+        a = selected[i + 1] = positions[i, areas.argmax()]
+    return selected
+
+
+def minmax(x, y, n_points):
+    """Retourne les positions des points conserves par la methode minmax.
+
+    Voir la fonction downsample, x et y doivent etre des numpy.array de
+    float sans NaN.
+
+    """
+    size = len(x)
+    if n_points < 3:
+        raise ValueError('n_points must be at least 3')
+    if size <= n_points:
+        return _numpy.arange(size)
+
+    # the time buckets of the points
+    nbuckets = (n_points - 2) // 2
+    if nbuckets == 0:
+        # room for a single extreme between the first and the last points
+        extreme = _numpy.abs(y[1:-1] - y.mean()).argmax() + 1
+        return _numpy.array([0, extreme, size - 1])
+    span = x[-1] - x[0]
+    if span <= 0:
+        return _numpy.array([0, size - 1])
+    buckets = _numpy.minimum(
+        ((x - x[0]) * (nbuckets / span)).astype(_numpy.int64), nbuckets - 1
+    )
+    starts = _numpy.flatnonzero(
+        _numpy.concatenate(([True], buckets[1:] != buckets[:-1]))
+    )
+    groups = _numpy.zeros(size, dtype=_numpy.int64)
+    groups[starts[1:]] = 1
+    groups = groups.cumsum()
+
+    # the first minimum and the first maximum of each bucket
+    mins = _numpy.minimum.reduceat(y, starts)
+    maxs = _numpy.maximum.reduceat(y, starts)
+    first = _numpy.zeros(size, dtype=bool)
+    first[0] = first[-1] = True
+    for extremes in (mins, maxs):
+        candidates = _numpy.flatnonzero(y == extremes[groups])
+        _, index = _numpy.unique(groups[candidates], return_index=True)
+        first[candidates[index]] = True
+    return _numpy.flatnonzero(first)
+
+
+#-- private functions ---------------------------------------------------------
+def _check(method):
+    """Raise a ValueError for an unknown method."""
+    if method not in METHODS:
+        raise ValueError('method must be in %s' % ', '.join(METHODS))
+
+
+def _floats(x):
+    """Return the float array of numbers or datetime64 seconds."""
+    x = _numpy.asarray(x)
+    if x.dtype.kind == 'M':
+        x = x.astype('datetime64[ns]').view(_numpy.int64) / 10 ** 9
+    elif x.dtype.kind in 'SUO':
+        x = _numpy.asarray(x, dtype='datetime64[ns]').view(
+            _numpy.int64
+        ) / 10 ** 9
+    return _numpy.asarray(x, dtype=float)
+
+
+# the methods functions
+_METHODS = {'lttb': lttb, 'minmax': minmax}
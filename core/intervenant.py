@@ -17,17 +17,22 @@ from __future__ import (
 
 import sys as _sys
 
+from . import nomenclature as _nomenclature
 from .nomenclature import NOMENCLATURE as _NOMENCLATURE
 
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1c"""
-__date__ = """2013-09-03"""
+__version__ = """0.1e"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-20
 #    first shot
+#V0.1d - 2026-10-19
+#    __slots__ and from_trusted constructors
+#V0.1e - 2026-10-19
+#    civilite checked by nomenclature.validator
 
 
 #-- todos ---------------------------------------------------------------------
@@ -49,6 +54,8 @@ class Intervenant(object):
 
     """
 
+    __slots__ = ('_code', '_origine', 'nom', 'mnemo', '_contacts')
+
     # TODO - Intervenant other properties
 
     # statut
@@ -86,6 +93,26 @@ class Intervenant(object):
             self.origine = origine
         self.contacts = contacts
 
+    @classmethod
+    def from_trusted(
+        cls, code, origine='SANDRE', nom=None, mnemo=None, contacts=None
+    ):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Ce constructeur est destine au chargement en masse de donnees deja
+        validees en amont. Les contacts sont rattaches a l'intervenant.
+
+        """
+        obj = cls.__new__(cls)
+        obj._code = code
+        obj._origine = origine
+        obj.nom = nom
+        obj.mnemo = mnemo
+        obj._contacts = list(contacts) if contacts else []
+        for contact in obj._contacts:
+            contact._intervenant = obj
+        return obj
+
     # -- property code --
     @property
     def code(self):
@@ -222,6 +249,8 @@ class Contact(object):
 
     """
 
+    __slots__ = ('_code', 'nom', 'prenom', '_civilite', '_intervenant')
+
     # TODO - Contact other properties
 
     # profil
@@ -261,6 +290,23 @@ class Contact(object):
         self.civilite = civilite
         self.intervenant = intervenant
 
+    @classmethod
+    def from_trusted(
+        cls, code=0, nom=None, prenom=None, civilite=None, intervenant=None
+    ):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Voir Intervenant.from_trusted.
+
+        """
+        obj = cls.__new__(cls)
+        obj._code = code
+        obj.nom = nom
+        obj.prenom = prenom
+        obj._civilite = civilite
+        obj._intervenant = intervenant
+        return obj
+
     # -- property code --
     @property
     def code(self):
@@ -293,17 +339,9 @@ class Contact(object):
         return self._civilite
 
     @civilite.setter
+    @_nomenclature.validator(538, cast=int, required=False)
     def civilite(self, civilite):
-        try:
-
-            if civilite is not None:
-                civilite = int(civilite)
-                if civilite not in _NOMENCLATURE[538]:
-                    raise ValueError('civilite incorrect')
-            self._civilite = civilite
-
-        except:
-            raise
+        self._civilite = civilite
 
     # -- property intervenant --
     @property
@@ -15,17 +15,21 @@ from __future__ import (
 
 import sys as _sys
 
-from .nomenclature import NOMENCLATURE as _NOMENCLATURE
+from . import nomenclature as _nomenclature
 
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1c"""
-__date__ = """2013-09-03"""
+__version__ = """0.1e"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-06
 #    first shot
+#V0.1d - 2026-10-19
+#    __slots__ and from_trusted constructor
+#V0.1e - 2026-10-19
+#    typemodele checked by nomenclature.validator
 
 
 #-- todos ---------------------------------------------------------------------
@@ -48,6 +52,10 @@ class Modeleprevision(object):
 
     """
 
+    __slots__ = (
+        '_strict', '_code', 'libelle', '_typemodele', 'description'
+    )
+
     #dtmaj
     #auteur
 
@@ -77,6 +85,24 @@ class Modeleprevision(object):
         self.code = code
         self.typemodele = typemodele
 
+    @classmethod
+    def from_trusted(
+        cls, code=None, libelle=None, typemodele=0, description=None
+    ):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Ce constructeur est destine au chargement en masse de donnees deja
+        validees en amont.
+
+        """
+        obj = cls.__new__(cls)
+        obj._strict = True
+        obj._code = code
+        obj.libelle = libelle
+        obj._typemodele = typemodele
+        obj.description = description
+        return obj
+
     # -- property code --
     @property
     def code(self):
@@ -101,15 +127,9 @@ class Modeleprevision(object):
         return self._typemodele
 
     @typemodele.setter
+    @_nomenclature.validator(525, cast=int, required=False)
     def typemodele(self, typemodele):
-        try:
-            if typemodele is not None:
-                typemodele = int(typemodele)
-                if (self._strict) and (typemodele not in _NOMENCLATURE[525]):
-                    raise ValueError('typemodele incorrect')
-            self._typemodele = typemodele
-        except:
-            raise
+        self._typemodele = typemodele
 
     # -- other methods --
     def __unicode__(self):
@@ -12,6 +12,12 @@ Usage:
         {code: mnemonique, ...}. Les codes des items d'une nomenclature sont
         des entiers ou des chaines.
 
+    validator(i) est un decorateur de setter qui controle qu'une valeur
+        appartient a la nomenclature i.
+
+    isvalid(i, values) et invalid(i, values) controlent en une seule
+        operation numpy un tableau de codes de la nomenclature i.
+
 """
 #-- imports -------------------------------------------------------------------
 from __future__ import (
@@ -21,20 +27,23 @@ from __future__ import (
     print_function as _print_function
 )
 
+import functools as _functools
+
 
 #-- strings -------------------------------------------------------------------
 __author__ = """philippe.gouin@developpement-durable.gouv.fr"""
-__version__ = """0.1d"""
-__date__ = """2013-08-09"""
+__version__ = """0.1e"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-07-12
 #    first shot
+#V0.1e - 2026-10-19
+#    validator, isvalid and invalid
 
 
 #-- todos ---------------------------------------------------------------------
 # TODO - all nomenclatures
-# TODO - write a decorator to check an attribute validity
 
 
 # -- config -------------------------------------------------------------------
@@ -105,3 +114,117 @@ NOMENCLATURE = {
 }
 
 NOMENCLATURES = NOMENCLATURE.keys()
+
+# the codes of each nomenclature, as frozensets
+_CODES = dict((k, frozenset(v)) for k, v in NOMENCLATURE.iteritems())
+
+# integer codes above this limit are not checked with a lookup table
+_LUT_MAXCODE = 1024
+
+# lookup tables cache {nomenclature: numpy.array(bool) or None}
+_LUTS = {}
+
+
+# -- validators ---------------------------------------------------------------
+def validator(nomenclature, cast=unicode, required=True):
+    """Decorateur de setter controlant la validite d'une valeur.
+
+    La valeur passee au setter est convertie avec cast puis controlee, et
+    le setter decore ne recoit que des valeurs valides.
+
+    Arguments:
+        nomenclature (int) = code de la nomenclature
+        cast (type, defaut unicode) = conversion de la valeur
+        required (bool ou 'strict', defaut True) = si True, la valeur None
+            leve une TypeError, si 'strict' seulement pour un objet strict,
+            sinon elle est transmise au setter telle quelle
+
+    Le controle d'appartenance a la nomenclature n'est fait que si l'objet
+    n'a pas d'attribut _strict ou si cet attribut est vrai.
+
+    Exemple:
+        @typesite.setter
+        @nomenclature.validator(530)
+        def typesite(self, typesite):
+            self._typesite = typesite
+
+    """
+    codes = _CODES[nomenclature]
+
+    def decorator(setter):
+        name = setter.__name__
+
+        @_functools.wraps(setter)
+        def wrapper(self, value):
+            if value is None:
+                if required and (
+                    (required != 'strict') or getattr(self, '_strict', True)
+                ):
+                    raise TypeError('{} is required'.format(name))
+            else:
+                value = cast(value)
+                if (value not in codes) and getattr(self, '_strict', True):
+                    raise ValueError('{} incorrect'.format(name))
+            return setter(self, value)
+
+        return wrapper
+
+    return decorator
+
+
+def isvalid(nomenclature, values):
+    """Retourne un numpy.array de booleens, True pour les codes valides.
+
+    Pour les nomenclatures a codes entiers, le controle est fait en une seule
+    operation a l'aide d'une table de correspondance precalculee.
+
+    Arguments:
+        nomenclature (int) = code de la nomenclature
+        values (iterable) = les codes a controler
+
+    """
+    # numpy is imported on demand: this module is imported by light ones
+    import numpy as _numpy
+    values = _numpy.asarray(values)
+    lut = _lut(nomenclature)
+    if (lut is not None) and (values.dtype.kind in 'iub'):
+        return lut.take(values, mode='clip') & \
+            (values >= 0) & (values < len(lut))
+    if (lut is not None) and (values.dtype.kind == 'f'):
+        valid = _numpy.zeros(values.shape, dtype=bool)
+        with _numpy.errstate(invalid='ignore'):  # NaN values
+            integers = (values >= 0) & (values < len(lut)) & \
+                (values == _numpy.floor(values))
+        valid[integers] = lut[values[integers].astype(int)]
+        return valid
+    return _numpy.in1d(
+        values.ravel(), list(_CODES[nomenclature])
+    ).reshape(values.shape)
+
+
+def invalid(nomenclature, values):
+    """Retourne les positions (numpy.array) des codes invalides de values.
+
+    Arguments:
+        nomenclature (int) = code de la nomenclature
+        values (iterable) = les codes a controler
+
+    """
+    # numpy is imported on demand: this module is imported by light ones
+    import numpy as _numpy
+    return _numpy.flatnonzero(~isvalid(nomenclature, values))
+
+
+def _lut(nomenclature):
+    """Return the lookup table of an integer nomenclature or None."""
+    try:
+        return _LUTS[nomenclature]
+    except KeyError:
+        import numpy as _numpy
+        codes = _CODES[nomenclature]
+        lut = None
+        if all(isinstance(c, int) and (0 <= c <= _LUT_MAXCODE) for c in codes):
+            lut = _numpy.zeros(max(codes) + 1, dtype=bool)
+            lut[list(codes)] = True
+        _LUTS[nomenclature] = lut
+        return lut
@@ -8,11 +8,20 @@ Ce module contient les classes:
 
 et quelques fonctions utiles:
     # Observations.concat() pour concatener des observations
+    # Observations.check() pour controler les nomenclatures des observations
 
 La Serie est le conteneur de reference pour les observations hydrometriques.
 Les observations y sont contenues dans l'attribut du meme nom, sous la forme
 d'un pandas.DataFrame dont l'index est une serie de timestamp.
 
+Les dates d'une serie a pas de temps fixe peuvent etre representees par un
+regularindex.RegularIndex, sans stocker les timestamps (voir
+Serie.from_regular). Le DataFrame n'est alors construit qu'au premier acces
+aux observations.
+
+Pour l'affichage, Serie.downsample reduit une serie a un nombre de points
+donne en conservant ses pics (voir le module downsample).
+
 """
 
 # On peux aussi utiliser directement les classes de la librairie Pandas, les
@@ -51,18 +60,34 @@ import sys as _sys
 import numpy as _numpy
 import pandas as _pandas
 
-from .nomenclature import NOMENCLATURE as _NOMENCLATURE
-from . import sitehydro as _sitehydro
+from . import nomenclature as _nomenclature
+from .nomenclature import (
+    NOMENCLATURE as _NOMENCLATURE, _CODES as _NOMENCLATURE_CODES
+)
+from . import (
+    sitehydro as _sitehydro, regularindex as _regularindex,
+    downsample as _downsample, _lazy
+)
 
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1h"""
-__date__ = """2013-09-03"""
+__version__ = """0.1m"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-07-18
 #    first shot
+#V0.1i - 2026-10-19
+#    Observations.check and nomenclature validators
+#V0.1j - 2026-10-19
+#    observations decoded on first access
+#V0.1k - 2026-10-19
+#    Serie.from_trusted and Observations.from_arrays
+#V0.1l - 2026-10-19
+#    regular time index, window and from_regular
+#V0.1m - 2026-10-19
+#    Serie.downsample and its pyramid
 
 
 #-- todos ---------------------------------------------------------------------
@@ -131,9 +156,11 @@ class Observation(_numpy.ndarray):
     def __new__(cls, dte, res, mth=0, qal=16, cnt=True):
         if not isinstance(dte, _numpy.datetime64):
             dte = _numpy.datetime64(dte, 's')
-        if (mth != 0) and (mth not in _NOMENCLATURE[507]):
+        # a plain membership test, the arrays are checked by
+        # Observations.check
+        if mth not in _NOMENCLATURE_CODES[507]:
             raise ValueError('methode incorrecte')
-        if (qal != 16) and (qal not in _NOMENCLATURE[515]):
+        if qal not in _NOMENCLATURE_CODES[515]:
             raise ValueError('qualification incorrecte')
         obj = _numpy.array(
             (dte, res, mth, qal, cnt),
@@ -215,7 +242,37 @@ class Observations(_pandas.DataFrame):
         # prepare a tmp numpy.array
         array = _numpy.array(object=obss)
 
-        # get the pandas.DataFrame
+        # get the pandas.DataFrame, already checked observation by observation
+        obj = Observations._from_array(array)
+        obj._checked = True
+        return obj
+
+    @staticmethod
+    def from_arrays(dte, res, mth=0, qal=16, cnt=True):
+        """Constructeur rapide a partir des colonnes, sans controle.
+
+        Ce constructeur est destine aux donnees deja validees en amont
+        (fichier valide...). On peut controler a posteriori les methodes et
+        les qualifications avec Observations.check.
+
+        Arguments:
+            dte (sequence de dates au format ISO 8601 ou de numpy.datetime64)
+            res (sequence de resultats)
+            mth, qal, cnt (sequences ou valeurs communes, defaut 0, 16 et
+                True) = voir Observation
+
+        """
+        array = _numpy.empty(len(dte), dtype=Observation.DTYPE)
+        array['dte'] = dte
+        array['res'] = res
+        array['mth'] = mth
+        array['qal'] = qal
+        array['cnt'] = cnt
+        return Observations._from_array(array)
+
+    @staticmethod
+    def _from_array(array):
+        """Return the DataFrame of a numpy.array of Observation.DTYPE."""
         index = _pandas.Index(array['dte'], name='dte')
         obj = _pandas.DataFrame(
             data=array[list(array.dtype.names[1:])],
@@ -249,6 +306,34 @@ class Observations(_pandas.DataFrame):
         except Exception:
             return _pandas.concat([observations, Observations(others)])
 
+    @staticmethod
+    def check(observations):
+        """Controle les methodes et les qualifications des observations.
+
+        Les colonnes mth et qal, si elles existent, sont controlees en une
+        seule operation par colonne. Leve une ValueError indiquant les
+        premieres lignes en erreur.
+
+        Les observations controlees sont marquees, le setter
+        Serie.observations ne les controle plus.
+
+        Arguments:
+            observations (Observations)
+
+        """
+        for column, nomenclature in (('mth', 507), ('qal', 515)):
+            if column in observations:
+                rows = _nomenclature.invalid(
+                    nomenclature, observations[column].values
+                )
+                if len(rows) > 0:
+                    raise ValueError(
+                        '{} incorrect in {} rows, first ones: {}'.format(
+                            column, len(rows), rows[:10].tolist()
+                        )
+                    )
+        observations._checked = True
+
 
 #-- class Serie ---------------------------------------------------------------
 class Serie(object):
@@ -261,6 +346,15 @@ class Serie(object):
         grandeur (char in NOMENCLATURE[509]) = H ou Q
         statut (int in NOMENCALTURE[510]) = donnee brute, corrigee...
         observations (Observations)
+        regular (regularindex.RegularIndex) = les dates des observations si
+            leur pas de temps est fixe, sinon None. En lecture seule
+
+    Les observations peuvent etre passees sous la forme d'un objet Lazy,
+    elles ne sont alors calculees (et controlees) qu'au premier acces.
+
+    Les methodes position et window d'une serie reguliere n'examinent pas les
+    dates des observations, et celles d'une serie construite par from_regular
+    ne construisent pas le DataFrame des observations.
 
     """
 
@@ -293,6 +387,10 @@ class Serie(object):
 
         # -- simple properties --
         self._strict = strict
+        # the cached RegularIndex and the observations it describes
+        self._regular = self._regular_of = None
+        # the cached downsampling pyramid and the observations it describes
+        self._pyramid = self._pyramid_of = None
 
         # -- full properties --
         self.entite = entite
@@ -300,6 +398,61 @@ class Serie(object):
         self.statut = statut
         self.observations = observations
 
+    @classmethod
+    def from_trusted(cls, entite, grandeur, statut=0, observations=None):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Ce constructeur est destine au chargement en masse de donnees deja
+        validees en amont (fichier valide...). Les arguments doivent etre du
+        bon type, observations peut etre un objet Lazy.
+
+        """
+        obj = cls.__new__(cls)
+        obj._strict = True
+        obj._entite = entite
+        obj._grandeur = grandeur
+        obj._statut = statut
+        obj._observations = observations
+        obj._regular = obj._regular_of = None
+        obj._pyramid = obj._pyramid_of = None
+        return obj
+
+    @classmethod
+    def from_regular(
+        cls, entite, grandeur, regular, res, mth=0, qal=16, cnt=True,
+        statut=0
+    ):
+        """Constructeur d'une serie a pas de temps fixe, sans controle.
+
+        Les observations ne sont construites qu'a leur premier acces. Comme
+        pour from_trusted, les arguments doivent etre du bon type.
+
+        Arguments:
+            entite (Sitehydro, Stationhydro ou Capteur)
+            grandeur (char in NOMENCLATURE[509]) = H ou Q
+            regular (regularindex.RegularIndex) = les dates
+            res (numpy.array de len(regular) resultats)
+            mth, qal, cnt (numpy.array ou valeurs communes, defaut 0, 16 et
+                True) = voir Observation
+            statut (int in NOMENCLATURE[510], defaut 0)
+
+        """
+        columns = []
+        for column, dtype in zip(
+            (res, mth, qal, cnt), Observation.DTYPE.descr[1:]
+        ):
+            column = _numpy.asarray(column, dtype=dtype[1])
+            if column.ndim == 0:
+                column = _numpy.repeat(column, len(regular))
+            if len(column) != len(regular):
+                raise ValueError('columns and regular lengths do not match')
+            columns.append(column)
+        observations = _lazy.Lazy(_observations_from_regular, regular, columns)
+        obj = cls.from_trusted(entite, grandeur, statut, observations)
+        obj._regular = regular
+        obj._regular_of = observations
+        return obj
+
     # -- property entite --
     @property
     def entite(self):
@@ -335,23 +488,9 @@ class Serie(object):
         return self._grandeur
 
     @grandeur.setter
+    @_nomenclature.validator(509, required='strict')
     def grandeur(self, grandeur):
-        try:
-            if self._strict:
-
-                # None case
-                if grandeur is None:
-                    raise TypeError('grandeur is required')
-
-                # other cases
-                grandeur = unicode(grandeur)
-                if (grandeur not in _NOMENCLATURE[509]):
-                    raise ValueError('grandeur incorrect')
-
-            # all is well
-            self._grandeur = grandeur
-        except:
-            raise
+        self._grandeur = grandeur
 
     # -- property statut --
     @property
@@ -360,30 +499,29 @@ class Serie(object):
         return self._statut
 
     @statut.setter
+    @_nomenclature.validator(510, cast=int)
     def statut(self, statut):
-        try:
-
-            # None case
-            if statut is None:
-                raise TypeError('statut is required')
-
-            # other cases
-            statut = int(statut)
-            if (self._strict) and (statut not in _NOMENCLATURE[510]):
-                raise ValueError('statut incorrect')
-            self._statut = statut
-
-        except:
-            raise
+        self._statut = statut
 
     # -- property observations --
     @property
     def observations(self):
         """Observations."""
+        if isinstance(self._observations, _lazy.Lazy):
+            lazy = self._observations
+            self.observations = lazy()
+            if self._regular_of is lazy:
+                # the regular index describes the computed observations
+                self._regular_of = self._observations
         return self._observations
 
     @observations.setter
     def observations(self, observations):
+        # lazy observations are checked when computed
+        if isinstance(observations, _lazy.Lazy):
+            self._observations = observations
+            return
+
         try:
 
             if (self._strict):
@@ -391,12 +529,136 @@ class Serie(object):
                 # ... and that index contains datetimes
                 observations.res
                 observations.index[0].isoformat()  # FIXME - should fail with datetime64 object. Use .item().isoformat()
-            self._observations = observations
 
         except:
             raise TypeError('observations incorrect')
 
+        if self._strict and not getattr(observations, '_checked', False):
+            Observations.check(observations)
+        self._observations = observations
+
+    # -- property regular --
+    @property
+    def regular(self):
+        """RegularIndex des observations ou None."""
+        if self._regular_of is not self._observations:
+            observations = self.observations
+            if observations is None:
+                self._regular = None
+            else:
+                self._regular = _regularindex.RegularIndex.from_dates(
+                    observations.index.values
+                )
+            self._regular_of = observations
+        return self._regular
+
     # -- other methods --
+    def position(self, dte):
+        """Retourne la position de l'observation de date dte.
+
+        Leve une KeyError si il n'y a pas d'observation a cette date.
+
+        """
+        regular = self.regular
+        if regular is not None:
+            return regular.position(dte)
+        index = self.observations.index
+        dte = _numpy.datetime64(dte).astype('datetime64[ns]')
+        position = index.values.searchsorted(dte)
+        if (position == len(index)) or (index.values[position] != dte):
+            raise KeyError('%s not in index' % dte)
+        return int(position)
+
+    def window(self, begin=None, end=None):
+        """Retourne la Serie des observations de begin a end, bornes
+        incluses.
+
+        Les observations sont triees par date, l'extrait est un extrait par
+        position.
+
+        Arguments:
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601, defaut None) = bornes de l'extrait, None pour ne pas
+                borner
+
+        """
+        regular = self.regular
+        if regular is not None:
+            start = 0 if begin is None else regular.searchsorted(begin)
+            stop = len(regular) if end is None else \
+                regular.searchsorted(end, 'right')
+        else:
+            values = self.observations.index.values
+            start = 0 if begin is None else values.searchsorted(
+                _numpy.datetime64(begin).astype('datetime64[ns]')
+            )
+            stop = len(values) if end is None else values.searchsorted(
+                _numpy.datetime64(end).astype('datetime64[ns]'), 'right'
+            )
+
+        # a regular serie which is not computed yet
+        if (regular is not None) and \
+                isinstance(self._observations, _lazy.Lazy):
+            return Serie.from_regular(
+                self.entite, self.grandeur, regular[start:stop],
+                *[column[start:stop] for column in self._observations.args[1]],
+                statut=self.statut
+            )
+
+        serie = Serie.from_trusted(
+            self.entite, self.grandeur, self.statut,
+            self.observations[start:stop]
+        )
+        if regular is not None:
+            serie._regular = regular[start:stop]
+            serie._regular_of = serie._observations
+        return serie
+
+    def downsample(
+        self, n_points, method='lttb', begin=None, end=None, pyramid=False
+    ):
+        """Retourne la Serie reduite a n_points observations au plus.
+
+        Les observations conservees sont choisies sur la courbe des resultats
+        pour en conserver la forme et les pics, les resultats NaN ne sont
+        pas conserves (voir le module downsample).
+
+        Arguments:
+            n_points (int >= 3) = nombre d'observations maximum
+            method (string in downsample.METHODS, defaut lttb)
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601, defaut None) = bornes incluses de la periode, None pour
+                ne pas borner
+            pyramid (bool, defaut False) = si True, les reductions sont
+                calculees a partir d'une downsample.Pyramid, conservee tant
+                que les observations ne sont pas remplacees, pour les appels
+                repetes sur une meme serie (zoom...)
+
+        """
+        observations = self.observations
+        if observations is None:
+            raise ValueError('serie without observations')
+        dte = observations.index.values
+        res = observations['res'].values
+        if pyramid:
+            if self._pyramid_of is not observations:
+                self._pyramid = _downsample.Pyramid(dte, res)
+                self._pyramid_of = observations
+            positions = self._pyramid.downsample(
+                n_points, method, _date(begin), _date(end)
+            )
+        else:
+            start = 0 if begin is None else dte.searchsorted(_date(begin))
+            stop = len(dte) if end is None else \
+                dte.searchsorted(_date(end), 'right')
+            positions = start + _downsample.downsample(
+                dte[start:stop], res[start:stop], n_points, method
+            )
+        return Serie.from_trusted(
+            self.entite, self.grandeur, self.statut,
+            observations.iloc[positions]
+        )
+
     def __unicode__(self):
         """Unicode representation."""
         # compute entite name
@@ -443,3 +705,16 @@ class Serie(object):
             return self.__unicode__()
         else:  # Python 2
             return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- private functions ---------------------------------------------------------
+def _date(dte):
+    """Return dte as a numpy.datetime64[ns] or None."""
+    if dte is None:
+        return None
+    return _numpy.datetime64(dte).astype('datetime64[ns]')
+
+
+def _observations_from_regular(regular, columns):
+    """Return the Observations of a RegularIndex and the columns arrays."""
+    return Observations.from_arrays(regular.values, *columns)
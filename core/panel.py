@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Module panel.
+
+Ce module contient la classe:
+    # SeriesPanel
+
+Un SeriesPanel aligne les observations de plusieurs obshydro.Serie sur un axe
+des temps commun, trie et sans doublon, l'union des dates des series. Les
+valeurs sont stockees dans des tableaux numpy a 2 dimensions, une ligne par
+date et une colonne par serie:
+    panel = SeriesPanel(message.series)
+    panel.keys  # les codes des entites des series
+    panel.res  # les resultats, NaN pour une date absente d'une serie
+    panel['H2354310']  # les resultats de la serie H2354310
+    panel.window('2012-05-01', '2012-05-02 12:00')  # un extrait
+    panel.dataframe()  # un pandas.DataFrame des resultats
+
+Les tableaux des methodes et des qualifications valent -1 pour une date
+absente d'une serie, celui des continuites False.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+
+import numpy as _numpy
+import pandas as _pandas
+
+from . import obshydro as _obshydro
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the value of the missing mth and qal
+MISSING = -1
+
+
+#-- class SeriesPanel ---------------------------------------------------------
+class SeriesPanel(object):
+    """Classe SeriesPanel.
+
+    Classe pour aligner plusieurs series d'observations hydrometriques.
+
+    Proprietes:
+        series (liste de obshydro.Serie)
+        keys (liste) = les cles des colonnes, par defaut les codes des entites
+            des series
+        index (numpy.array de datetime64[ns]) = l'axe des temps, trie
+        res (numpy.array de float, len(index) x len(keys)) = resultats, NaN si
+            absent
+        mth, qal (numpy.array de int8, len(index) x len(keys)) = methodes et
+            qualifications, -1 si absent
+        cnt (numpy.array de bool, len(index) x len(keys)) = continuites,
+            False si absent
+
+    Les extraits retournes par la methode window partagent les tableaux du
+    panel dont ils sont issus.
+
+    """
+
+    def __init__(self, series, keys=None):
+        """Initialisation.
+
+        Les series sont alignees en une seule passe, par un tri de l'union de
+        leurs dates. Pour une date presente plusieurs fois dans une serie,
+        c'est la derniere observation qui est retenue.
+
+        Arguments:
+            series (iterable de obshydro.Serie)
+            keys (iterable, defaut None) = une cle unique par serie, par
+                defaut les codes des entites des series
+
+        """
+        series = list(series)
+        for serie in series:
+            if not isinstance(serie, _obshydro.Serie):
+                raise TypeError('series must be obshydro.Serie')
+            if serie.observations is None:
+                raise ValueError('serie without observations')
+
+        # the columns keys
+        if keys is None:
+            try:
+                keys = [serie.entite.code for serie in series]
+            except AttributeError:
+                raise ValueError('serie without entite, keys are required')
+        keys = list(keys)
+        if len(keys) != len(series):
+            raise ValueError('keys and series lengths do not match')
+        if len(set(keys)) != len(keys):
+            raise ValueError('duplicate keys')
+
+        # the time axis, the sorted union of the dates
+        dates = [
+            serie.observations.index.values.astype('datetime64[ns]')
+            for serie in series
+        ]
+        if dates:
+            index = _numpy.unique(_numpy.concatenate(dates))
+        else:
+            index = _numpy.array([], dtype='datetime64[ns]')
+
+        # the arrays
+        shape = (len(index), len(series))
+        res = _numpy.empty(shape, dtype=_numpy.float64)
+        res.fill(_numpy.nan)
+        mth = _numpy.empty(shape, dtype=_numpy.int8)
+        mth.fill(MISSING)
+        qal = _numpy.empty(shape, dtype=_numpy.int8)
+        qal.fill(MISSING)
+        cnt = _numpy.zeros(shape, dtype=_numpy.bool_)
+        for j, (serie, dte) in enumerate(zip(series, dates)):
+            rows = index.searchsorted(dte)
+            observations = serie.observations
+            res[rows, j] = observations['res'].values
+            # the simplified observations only have a res column
+            if 'mth' in observations:
+                mth[rows, j] = observations['mth'].values
+            if 'qal' in observations:
+                qal[rows, j] = observations['qal'].values
+            if 'cnt' in observations:
+                cnt[rows, j] = observations['cnt'].values
+
+        self._set(series, keys, index, res, mth, qal, cnt)
+
+    def _set(self, series, keys, index, res, mth, qal, cnt):
+        """Set the panel attributes."""
+        self.series = series
+        self.keys = keys
+        self.index = index
+        self.res = res
+        self.mth = mth
+        self.qal = qal
+        self.cnt = cnt
+        self._columns = dict((key, j) for j, key in enumerate(keys))
+
+    # -- other methods --
+    def window(self, begin=None, end=None):
+        """Retourne le SeriesPanel des dates de begin a end, bornes incluses.
+
+        L'extrait partage les tableaux du panel, il n'y a pas de
+        realignement.
+
+        Arguments:
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601, defaut None) = bornes de l'extrait, None pour ne pas
+                borner
+
+        """
+        start = 0
+        stop = len(self.index)
+        if begin is not None:
+            start = self.index.searchsorted(_datetime64(begin), side='left')
+        if end is not None:
+            stop = self.index.searchsorted(_datetime64(end), side='right')
+        window = SeriesPanel.__new__(SeriesPanel)
+        window._set(
+            self.series, self.keys, self.index[start:stop],
+            self.res[start:stop], self.mth[start:stop], self.qal[start:stop],
+            self.cnt[start:stop]
+        )
+        return window
+
+    def dataframe(self, column='res'):
+        """Retourne un pandas.DataFrame, une colonne par serie.
+
+        Arguments:
+            column (string, defaut 'res') = res, mth, qal ou cnt
+
+        """
+        if column not in ('res', 'mth', 'qal', 'cnt'):
+            raise ValueError('column must be res, mth, qal or cnt')
+        return _pandas.DataFrame(
+            getattr(self, column),
+            index=_pandas.Index(self.index, name='dte'),
+            columns=self.keys
+        )
+
+    def __getitem__(self, key):
+        """Retourne la pandas.Series des resultats de la serie key."""
+        try:
+            j = self._columns[key]
+        except KeyError:
+            raise KeyError('unknown key %s' % key)
+        return _pandas.Series(
+            self.res[:, j],
+            index=_pandas.Index(self.index, name='dte'),
+            name=key
+        )
+
+    def __len__(self):
+        """Return the number of dates."""
+        return len(self.index)
+
+    def __unicode__(self):
+        """Unicode representation."""
+        if len(self.index):
+            period = '{} - {}'.format(
+                _pandas.Timestamp(self.index[0]),
+                _pandas.Timestamp(self.index[-1])
+            )
+        else:
+            period = '<vide>'
+        return 'SeriesPanel de {} series x {} dates\nPeriode: {}'.format(
+            len(self.keys), len(self.index), period
+        )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- private functions ---------------------------------------------------------
+def _datetime64(dte):
+    """Return dte as a numpy.datetime64[ns]."""
+    return _numpy.datetime64(dte).astype('datetime64[ns]')
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Module referentiel.
+
+Ce module contient la classe:
+    # Referentiel
+
+Le Referentiel indexe par leur code les sites hydro, leurs stations et leurs
+capteurs. Il permet de retrouver en temps constant une entite, ou son entite
+parente, a partir de son code, et de rechercher les entites par prefixe de
+code (toutes les stations d'un bassin par exemple):
+    referentiel = Referentiel(message.siteshydro)
+    referentiel['A123456701']  # la Stationhydro de code A123456701
+    referentiel.parent('A123456701')  # son Sitehydro
+    referentiel.find('A12', sitehydro.Stationhydro)
+    referentiel.join(serie)  # l'entite du referentiel de la serie
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import bisect as _bisect
+
+from . import sitehydro as _sitehydro
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class Referentiel ---------------------------------------------------------
+class Referentiel(object):
+    """Classe Referentiel.
+
+    Classe pour indexer un ensemble de sites hydrometriques, avec leurs
+    stations et leurs capteurs.
+
+    Proprietes:
+        siteshydro (une liste de Sitehydro)
+
+    """
+
+    # the indexed classes, from the top to the bottom of the hierarchy
+    CLASSES = (
+        _sitehydro.Sitehydro, _sitehydro.Stationhydro, _sitehydro.Capteur
+    )
+
+    def __init__(self, siteshydro=None):
+        """Initialisation.
+
+        Arguments:
+            siteshydro (un Sitehydro ou un iterable de Sitehydro, par exemple
+                Message.siteshydro)
+
+        """
+
+        # -- simple properties --
+        self.siteshydro = []
+        # {class: {code: entite}}
+        self._index = dict((cls, {}) for cls in self.CLASSES)
+        # {entite: parent}
+        self._parents = {}
+        # {class: sorted codes list} or None when it must be rebuilt
+        self._codes = None
+
+        # -- add the sites --
+        if siteshydro is not None:
+            if isinstance(siteshydro, _sitehydro.Sitehydro):
+                siteshydro = [siteshydro]
+            for sitehydro in siteshydro:
+                self.add(sitehydro)
+
+    # -- other methods --
+    def add(self, sitehydro):
+        """Ajoute un Sitehydro, ses stations et ses capteurs au referentiel.
+
+        Un site deja present (meme code) est remplace.
+
+        """
+        if not isinstance(sitehydro, _sitehydro.Sitehydro):
+            raise TypeError('sitehydro must be a Sitehydro')
+        old = self._index[_sitehydro.Sitehydro].get(sitehydro.code)
+        if old is not None:
+            self.remove(old.code)
+        self.siteshydro.append(sitehydro)
+        self._index[_sitehydro.Sitehydro][sitehydro.code] = sitehydro
+        for station in sitehydro.stations:
+            self._index[_sitehydro.Stationhydro][station.code] = station
+            self._parents[station] = sitehydro
+            for capteur in station.capteurs:
+                self._index[_sitehydro.Capteur][capteur.code] = capteur
+                self._parents[capteur] = station
+        self._codes = None
+
+    def remove(self, code):
+        """Retire du referentiel le Sitehydro de code code."""
+        sitehydro = self._index[_sitehydro.Sitehydro].pop(code)
+        self.siteshydro.remove(sitehydro)
+        for station in sitehydro.stations:
+            self._index[_sitehydro.Stationhydro].pop(station.code, None)
+            self._parents.pop(station, None)
+            for capteur in station.capteurs:
+                self._index[_sitehydro.Capteur].pop(capteur.code, None)
+                self._parents.pop(capteur, None)
+        self._codes = None
+
+    def get(self, code, cls=None, default=None):
+        """Retourne l'entite de code code, ou default.
+
+        Arguments:
+            code (string) = code hydro
+            cls (Sitehydro, Stationhydro ou Capteur, defaut None) = type de
+                l'entite. Par defaut il est deduit de la longueur du code.
+
+        """
+        if cls is None:
+            # try the class of the code length first
+            for cls in self.CLASSES:
+                if _sitehydro.CODE_HYDRO_LENGTH[cls] == len(code or ''):
+                    entite = self._index[cls].get(code)
+                    if entite is not None:
+                        return entite
+            for cls in self.CLASSES:
+                entite = self._index[cls].get(code)
+                if entite is not None:
+                    return entite
+            return default
+        return self._index[cls].get(code, default)
+
+    def parent(self, entite):
+        """Retourne l'entite parente d'une entite ou d'un code, ou None.
+
+        Le parent d'une station est son site, celui d'un capteur sa station.
+
+        """
+        if not isinstance(entite, self.CLASSES):
+            entite = self.get(entite)
+        return self._parents.get(entite)
+
+    def sitehydro(self, entite):
+        """Retourne le Sitehydro d'une entite ou d'un code, ou None."""
+        if not isinstance(entite, self.CLASSES):
+            entite = self.get(entite)
+        while (entite is not None) and \
+                (not isinstance(entite, _sitehydro.Sitehydro)):
+            entite = self._parents.get(entite)
+        return entite
+
+    def find(self, prefix, cls=None):
+        """Retourne la liste des entites dont le code commence par prefix.
+
+        Les entites sont triees par type (sites, stations puis capteurs) et
+        par code.
+
+        Arguments:
+            prefix (string) = debut du code hydro
+            cls (Sitehydro, Stationhydro ou Capteur, defaut None) = pour
+                filtrer le type des entites
+
+        """
+        if self._codes is None:
+            self._codes = dict(
+                (c, sorted(self._index[c])) for c in self.CLASSES
+            )
+        prefix = unicode(prefix)
+        entities = []
+        for c in (self.CLASSES if cls is None else (cls,)):
+            codes = self._codes[c]
+            begin = _bisect.bisect_left(codes, prefix)
+            end = _bisect.bisect_left(codes, prefix + '\uffff', begin)
+            entities.extend(self._index[c][code] for code in codes[begin:end])
+        return entities
+
+    def join(self, obj):
+        """Retourne l'entite du referentiel correspondant a l'entite de obj.
+
+        Arguments:
+            obj (obshydro.Serie, simulation.Simulation ou tout objet avec
+                une propriete entite)
+
+        Retourne None si l'entite est inconnue du referentiel.
+
+        """
+        entite = obj.entite
+        if entite is None:
+            return None
+        return self._index.get(entite.__class__, {}).get(entite.code)
+
+    def __getitem__(self, code):
+        """Retourne l'entite de code code ou leve une KeyError."""
+        entite = self.get(code)
+        if entite is None:
+            raise KeyError(code)
+        return entite
+
+    def __contains__(self, code):
+        """Test de presence d'un code."""
+        return self.get(code) is not None
+
+    def __len__(self):
+        """Nombre total d'entites."""
+        return sum(len(index) for index in self._index.itervalues())
+
+    def __unicode__(self):
+        """Unicode representation."""
+        return 'Referentiel de {0} sites, {1} stations et {2} capteurs'.format(
+            *(len(self._index[cls]) for cls in self.CLASSES)
+        )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
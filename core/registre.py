@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Module registre.
+
+Ce module contient la classe:
+    # Registre
+
+Le Registre est un cache d'entites (Sitehydro, Stationhydro, Capteur,
+Modeleprevision...) indexees par leur type et leur code. Il permet de
+partager une instance unique par code entre les objets qui y font reference,
+par exemple toutes les Serie d'une meme station lues dans plusieurs fichiers:
+    registre = Registre()
+    msg1 = xml.Message.from_file('f1.xml', registre=registre)
+    msg2 = xml.Message.from_file('f2.xml', registre=registre)
+    msg1.series[0].entite is msg2.series[0].entite  # si meme code
+
+La taille du cache est bornee, les entites les moins recemment utilisees
+sont evincees en premier (LRU).
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import collections as _collections
+
+from . import sitehydro as _sitehydro
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- todos ---------------------------------------------------------------------
+# TODO - the Registre is not thread safe
+
+
+# -- config -------------------------------------------------------------------
+MAXSIZE = 100000
+
+
+#-- class Registre ------------------------------------------------------------
+class Registre(object):
+    """Classe Registre.
+
+    Cache d'entites, de taille bornee, avec eviction LRU.
+
+    Les entites sont indexees par le couple (classe, code).
+
+    Proprietes:
+        maxsize (int, defaut MAXSIZE) = nombre maximum d'entites, None pour
+            un cache sans limite
+        hits (int) = nombre d'entites servies depuis le cache
+        misses (int) = nombre d'entites instanciees par le cache
+
+    """
+
+    def __init__(self, maxsize=MAXSIZE):
+        """Initialisation.
+
+        Arguments:
+            maxsize (int, defaut MAXSIZE) = nombre maximum d'entites, None
+                pour un cache sans limite
+
+        """
+
+        # -- simple properties --
+        self.hits = self.misses = 0
+        self._cache = _collections.OrderedDict()
+
+        # -- full properties --
+        self.maxsize = maxsize
+
+    # -- property maxsize --
+    @property
+    def maxsize(self):
+        """Taille maximum du cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        try:
+            if maxsize is not None:
+                maxsize = int(maxsize)
+                if maxsize < 1:
+                    raise ValueError('maxsize must be positive')
+            self._maxsize = maxsize
+            self._evict()
+
+        except:
+            raise
+
+    # -- other methods --
+    def get(self, cls, code, **kargs):
+        """Retourne l'entite de type cls et de code code.
+
+        L'entite est prise dans le cache, ou a defaut instanciee avec
+        cls(code=code, **kargs) puis mise en cache.
+
+        Arguments:
+            cls (classe) = classe de l'entite, Sitehydro, Modeleprevision...
+            code (string) = code de l'entite
+            **kargs = arguments supplementaires du constructeur, ignores si
+                l'entite est deja dans le cache
+
+        """
+        key = (cls, code)
+        try:
+            # move the entity at the end of the LRU list
+            entity = self._cache.pop(key)
+            self.hits += 1
+        except KeyError:
+            entity = cls(code=code, **kargs)
+            self.misses += 1
+            self._evict(1)
+        self._cache[key] = entity
+        return entity
+
+    def add(self, entite):
+        """Ajoute ou remplace une entite dans le cache.
+
+        Pour un Sitehydro ou une Stationhydro, les stations et les capteurs
+        rattaches sont aussi ajoutes.
+
+        """
+        key = (entite.__class__, entite.code)
+        self._cache.pop(key, None)
+        self._evict(1)
+        self._cache[key] = entite
+        if isinstance(entite, _sitehydro.Sitehydro):
+            for station in entite.stations:
+                self.add(station)
+        elif isinstance(entite, _sitehydro.Stationhydro):
+            for capteur in entite.capteurs:
+                self.add(capteur)
+
+    def clear(self):
+        """Vide le cache et remet a zero les compteurs."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def _evict(self, room=0):
+        """Evince les entites les plus anciennes pour faire room places."""
+        if self._maxsize is not None:
+            while len(self._cache) > self._maxsize - room:
+                self._cache.popitem(last=False)
+
+    def __contains__(self, key):
+        """Test de presence d'un couple (classe, code)."""
+        return key in self._cache
+
+    def __len__(self):
+        """Nombre d'entites dans le cache."""
+        return len(self._cache)
+
+    def __unicode__(self):
+        """Unicode representation."""
+        return 'Registre {0}/{1} entites [{2} hits, {3} misses]'.format(
+            len(self),
+            self.maxsize or '<illimite>',
+            self.hits,
+            self.misses
+        )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Module regularindex.
+
+Ce module contient la classe:
+    # RegularIndex
+
+Un RegularIndex represente les dates d'une serie a pas de temps fixe sans
+les stocker: une date de debut, un pas de temps et un nombre de pas, plus la
+liste des pas manquants (les lacunes):
+    index = RegularIndex.from_dates(observations.index.values)
+    index.position('2013-01-23 10:20')  # la position d'une date
+    index.date(12)  # la date d'une position
+    index[100:200]  # un extrait, sans calcul des dates
+    index.to_index()  # le pandas.DatetimeIndex des dates
+
+Le cout des recherches (date -> position, position -> date) ne depend que du
+nombre de lacunes, pas du nombre de dates.
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys as _sys
+import datetime as _datetime
+
+import numpy as _numpy
+import pandas as _pandas
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+# the maximum ratio of missing steps of a regular index, see from_dates
+MAX_MISSING = 0.1
+
+
+#-- class RegularIndex --------------------------------------------------------
+class RegularIndex(object):
+    """Classe RegularIndex.
+
+    Classe pour representer les dates d'une serie a pas de temps fixe.
+
+    Proprietes:
+        start (numpy.datetime64[ns]) = date du premier pas
+        step (numpy.timedelta64[ns]) = pas de temps
+        count (int) = nombre de pas, lacunes comprises
+        missing (numpy.array de int64) = numeros des pas manquants, tries
+
+    Les dates sont start + k * step pour k de 0 a count - 1, sauf les pas
+    manquants. Le premier et le dernier pas ne sont jamais manquants.
+
+    """
+
+    def __init__(self, start, step, count, missing=None):
+        """Initialisation.
+
+        Arguments:
+            start (numpy.datetime64, datetime ou string au format ISO 8601)
+            step (numpy.timedelta64 ou datetime.timedelta) = pas de temps
+            count (int) = nombre de pas, lacunes comprises
+            missing (sequence d'entiers, defaut None) = pas manquants
+
+        """
+        self._start = _nanoseconds(_numpy.datetime64(start))
+        self._step = _nanoseconds(_numpy.timedelta64(step))
+        if self._step <= 0:
+            raise ValueError('step must be positive')
+        self.count = int(count)
+        if self.count < 0:
+            raise ValueError('count must be positive')
+        if missing is None:
+            missing = _numpy.array([], dtype=_numpy.int64)
+        missing = _numpy.unique(_numpy.asarray(missing, dtype=_numpy.int64))
+        if len(missing) and (
+            (missing[0] <= 0) or (missing[-1] >= self.count - 1)
+        ):
+            raise ValueError('the first and last steps can not be missing')
+        self.missing = missing
+        # the positions shift of the missing steps, see _slot
+        self._shift = missing - _numpy.arange(len(missing))
+
+    # -- properties --
+    @property
+    def start(self):
+        """Date du premier pas."""
+        return _numpy.datetime64(self._start, 'ns')
+
+    @property
+    def step(self):
+        """Pas de temps."""
+        return _numpy.timedelta64(self._step, 'ns')
+
+    @property
+    def values(self):
+        """Le numpy.array de datetime64[ns] des dates."""
+        slots = _numpy.arange(self.count, dtype=_numpy.int64)
+        if len(self.missing):
+            slots = _numpy.delete(slots, self.missing)
+        return (self._start + slots * self._step).view('datetime64[ns]')
+
+    # -- constructors --
+    @classmethod
+    def from_dates(cls, dates, max_missing=MAX_MISSING):
+        """Retourne le RegularIndex des dates, ou None si elles ne sont pas
+        regulieres.
+
+        Les dates doivent etre triees, sans doublon, et ecartees d'un
+        multiple du plus petit ecart, le pas de temps. Il faut au moins 2
+        dates et au plus max_missing x count pas manquants.
+
+        Arguments:
+            dates (numpy.array de datetime64 ou pandas.DatetimeIndex)
+            max_missing (float, defaut MAX_MISSING) = proportion maximale de
+                pas manquants
+
+        """
+        dates = _numpy.asarray(dates).astype('datetime64[ns]').view(
+            _numpy.int64
+        )
+        if len(dates) < 2:
+            return None
+        diffs = _numpy.diff(dates)
+        step = diffs.min()
+        if (step <= 0) or (diffs % step).any():
+            return None
+        count = (dates[-1] - dates[0]) // step + 1
+        if count - len(dates) > max_missing * count:
+            return None
+        missing = _numpy.delete(
+            _numpy.arange(count, dtype=_numpy.int64),
+            (dates - dates[0]) // step
+        )
+        return cls(
+            dates[0].view('datetime64[ns]'), step.view('timedelta64[ns]'),
+            count, missing
+        )
+
+    # -- other methods --
+    def position(self, dte):
+        """Retourne la position de la date dte.
+
+        Leve une KeyError si dte n'est pas une date de l'index.
+
+        """
+        t = _nanoseconds(_numpy.datetime64(dte))
+        k, remainder = divmod(t - self._start, self._step)
+        if (remainder != 0) or (k < 0) or (k >= self.count):
+            raise KeyError('%s not in index' % dte)
+        j = self.missing.searchsorted(k)
+        if (j < len(self.missing)) and (self.missing[j] == k):
+            raise KeyError('%s not in index' % dte)
+        return int(k - j)
+
+    def searchsorted(self, dte, side='left'):
+        """Retourne la position d'insertion de dte, comme
+        numpy.searchsorted."""
+        t = _nanoseconds(_numpy.datetime64(dte))
+        if side == 'left':
+            # the first slot >= t
+            k = -((self._start - t) // self._step)
+        else:
+            # the first slot > t
+            k = (t - self._start) // self._step + 1
+        k = min(max(k, 0), self.count)
+        return int(k - self.missing.searchsorted(k))
+
+    def date(self, position):
+        """Retourne la date de la position."""
+        if position < 0:
+            position += len(self)
+        if (position < 0) or (position >= len(self)):
+            raise IndexError('position out of range')
+        return _numpy.datetime64(
+            self._start + self._slot(position) * self._step, 'ns'
+        )
+
+    def to_index(self):
+        """Retourne le pandas.DatetimeIndex des dates."""
+        return _pandas.Index(self.values, name='dte')
+
+    def _slot(self, position):
+        """Return the step number of position."""
+        return position + int(self._shift.searchsorted(position, 'right'))
+
+    def __getitem__(self, key):
+        """Retourne l'extrait des positions key, une slice de pas 1."""
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError('only slices are supported')
+        start, stop, _ = key.indices(len(self))
+        if stop <= start:
+            return RegularIndex(self.start, self.step, 0)
+        first = self._slot(start)
+        last = self._slot(stop - 1)
+        missing = self.missing[
+            self.missing.searchsorted(first):self.missing.searchsorted(last)
+        ]
+        return RegularIndex(
+            _numpy.datetime64(self._start + first * self._step, 'ns'),
+            self.step, last - first + 1, missing - first
+        )
+
+    def __len__(self):
+        """Return the number of dates."""
+        return self.count - len(self.missing)
+
+    def __unicode__(self):
+        """Unicode representation."""
+        if not len(self):
+            return 'RegularIndex vide'
+        return 'RegularIndex de {} dates du {} au {} au pas de {}, ' \
+               '{} lacunes'.format(
+                   len(self), _pandas.Timestamp(self.start),
+                   _pandas.Timestamp(self.date(-1)),
+                   _timedelta(self._step), len(self.missing)
+               )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
+#-- private functions ---------------------------------------------------------
+def _nanoseconds(value):
+    """Return the numpy.datetime64 or timedelta64 value as int nanoseconds."""
+    unit = 'datetime64[ns]' if isinstance(value, _numpy.datetime64) \
+        else 'timedelta64[ns]'
+    return int(value.astype(unit).view(_numpy.int64))
+
+
+def _timedelta(nanoseconds):
+    """Return the string of a duration in nanoseconds."""
+    return unicode(_datetime.timedelta(microseconds=nanoseconds // 1000))
@@ -3,6 +3,7 @@
 
 Ce module contient les classes:
     # Simulation
+    # Ensemble
     # Previsions
     # Prevision
 
@@ -10,6 +11,15 @@ La Simulation est le conteneur de reference pour les previsions hydrometriques.
 Les previsions y sont contenues dans l'attribut du meme nom, sous la forme
 d'une pandas.Series a double index, un timestamp et une probabilite.
 
+Les statistiques des previsions probabilistes sont calculees par un Ensemble,
+accessible par la propriete ensemble de la Simulation:
+    simulation.quantile(75)  # les resultats de probabilite 75
+    simulation.prob_exceed(2.5)  # les probabilites de depasser 2.5
+    simulation.envelope()  # les resultats min et max de chaque date
+
+Pour l'affichage, Simulation.downsample reduit les previsions a un nombre de
+dates donne (voir le module downsample).
+
 """
 
 # On peux aussi utiliser directement les classes de la librairie Pandas, les
@@ -47,18 +57,34 @@ import sys as _sys
 import numpy as _numpy
 import pandas as _pandas
 
+from . import nomenclature as _nomenclature
 from .nomenclature import NOMENCLATURE as _NOMENCLATURE
-from . import (sitehydro as _sitehydro, modeleprevision as _modeleprevision)
+from . import (
+    sitehydro as _sitehydro, modeleprevision as _modeleprevision,
+    downsample as _downsample, _lazy
+)
 
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.1g"""
-__date__ = """2013-09-03"""
+__version__ = """0.1m"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-08-07
 #    first shot
+#V0.1h - 2026-10-19
+#    grandeur and statut checked by nomenclature.validator
+#V0.1i - 2026-10-19
+#    previsions decoded on first access
+#V0.1j - 2026-10-19
+#    Simulation.from_trusted and Previsions.from_arrays
+#V0.1k - 2026-10-19
+#    Ensemble statistics of the previsions
+#V0.1l - 2026-10-19
+#    Simulation.downsample
+#V0.1m - 2026-10-19
+#    Previsions MultiIndex built from levels and labels
 
 
 #-- todos ---------------------------------------------------------------------
@@ -215,11 +241,53 @@ class Previsions(_pandas.Series):
         # prepare a tmp numpy.array
         array = _numpy.array(object=prvs)
 
-        # make index
-        index = _pandas.MultiIndex.from_tuples(
-            zip(array['dte'], array['prb']),
-            names=['dte', 'prb']
-        )
+        # get the pandas.Series
+        return Previsions._from_array(array)
+
+    @staticmethod
+    def from_arrays(dte, res, prb=50):
+        """Constructeur rapide a partir des colonnes, sans controle.
+
+        Ce constructeur est destine aux donnees deja validees en amont
+        (fichier valide...).
+
+        Arguments:
+            dte (sequence de dates au format ISO 8601 ou de numpy.datetime64)
+            res (sequence de resultats)
+            prb (sequence ou valeur commune, defaut 50) = probabilites
+
+        """
+        array = _numpy.empty(len(dte), dtype=Prevision.DTYPE)
+        array['dte'] = dte
+        array['res'] = res
+        array['prb'] = prb
+        return Previsions._from_array(array)
+
+    @staticmethod
+    def _from_array(array):
+        """Return the Series of a numpy.array of Prevision.DTYPE."""
+        # make index, from the sorted levels and the labels of the rows
+        if len(array):
+            dte, dte_labels = _numpy.unique(
+                array['dte'].astype('datetime64[ns]').view(_numpy.int64),
+                return_inverse=True
+            )
+            prb, prb_labels = _numpy.unique(
+                array['prb'].astype(_numpy.int64), return_inverse=True
+            )
+            index = _pandas.MultiIndex(
+                levels=[
+                    _pandas.DatetimeIndex(dte.view('datetime64[ns]')),
+                    _pandas.Index(prb)
+                ],
+                labels=[dte_labels, prb_labels],
+                names=['dte', 'prb']
+            )
+        else:
+            index = _pandas.MultiIndex.from_tuples(
+                zip(array['dte'], array['prb']),
+                names=['dte', 'prb']
+            )
 
         # get the pandas.Series
         obj = _pandas.Series(
@@ -234,6 +302,188 @@ class Previsions(_pandas.Series):
         return obj
 
 
+#-- class Ensemble ------------------------------------------------------------
+class Ensemble(object):
+    """Classe Ensemble.
+
+    Classe pour calculer des statistiques sur des previsions probabilistes.
+
+    Les previsions sont pivotees une seule fois en un tableau numpy a 2
+    dimensions, une ligne par date et une colonne par probabilite. Les
+    statistiques sont calculees pour toutes les dates a la fois, par
+    interpolation lineaire selon l'axe des probabilites.
+
+    La probabilite d'une prevision est celle de non-depassement de son
+    resultat, en pourcents (voir la classe Prevision).
+
+    Proprietes:
+        previsions (Previsions)
+        dte (numpy.array de datetime64[ns]) = les dates, triees
+        prb (numpy.array de int) = les probabilites, triees
+        res (numpy.array de float, len(dte) x len(prb)) = resultats, NaN si
+            la probabilite n'est pas prevue a cette date
+
+    """
+
+    def __init__(self, previsions):
+        """Initialisation.
+
+        Pour un couple (date, probabilite) present plusieurs fois, c'est la
+        derniere prevision qui est retenue.
+
+        Arguments:
+            previsions (Previsions)
+
+        """
+        self.previsions = previsions
+        index = previsions.index
+        self.dte, rows = _numpy.unique(
+            index.get_level_values(0).values.astype('datetime64[ns]'),
+            return_inverse=True
+        )
+        self.prb, cols = _numpy.unique(
+            index.get_level_values(1).values, return_inverse=True
+        )
+        self.res = _numpy.empty((len(self.dte), len(self.prb)))
+        self.res.fill(_numpy.nan)
+        self.res[rows, cols] = previsions.values
+
+    def quantile(self, p):
+        """Retourne les resultats de probabilite p.
+
+        Les resultats sont interpoles lineairement entre les 2 probabilites
+        prevues les plus proches, ils valent NaN pour une date ou p est hors
+        des probabilites prevues.
+
+        Arguments:
+            p (nombre ou sequence de nombres entre 0 et 100) = probabilite(s)
+
+        Retourne une pandas.Series indexee par les dates pour un nombre, un
+        pandas.DataFrame avec une colonne par probabilite pour une sequence.
+
+        """
+        if _numpy.isscalar(p):
+            return _pandas.Series(
+                self._quantile(p), index=self._index(), name=p
+            )
+        return _pandas.DataFrame(
+            dict((q, self._quantile(q)) for q in p),
+            index=self._index(),
+            columns=list(p)
+        )
+
+    def prob_exceed(self, threshold):
+        """Retourne les probabilites de depassement de threshold.
+
+        Les probabilites, en pourcents, sont interpolees lineairement entre
+        les 2 resultats prevus les plus proches de threshold. Elles valent 0
+        au-dessus du plus fort resultat prevu et 100 au-dessous du plus
+        faible.
+
+        Arguments:
+            threshold (float) = le seuil
+
+        Retourne une pandas.Series indexee par les dates.
+
+        """
+        valid = ~_numpy.isnan(self.res)
+        lower = self._last(valid & (self.res <= threshold))
+        upper = self._first(valid & (self.res >= threshold))
+        last = len(self.prb) - 1
+        rows = _numpy.arange(len(self.dte))
+        pl = self.prb[lower.clip(0, last)].astype(_numpy.float64)
+        pu = self.prb[upper.clip(0, last)].astype(_numpy.float64)
+        rl = self.res[rows, lower.clip(0, last)]
+        ru = self.res[rows, upper.clip(0, last)]
+        with _numpy.errstate(divide='ignore', invalid='ignore'):
+            prb = _numpy.where(
+                pl >= pu, pl, pl + (threshold - rl) * (pu - pl) / (ru - rl)
+            )
+        prb[lower < 0] = 0
+        prb[upper > last] = 100
+        prb[~valid.any(axis=1)] = _numpy.nan
+        return _pandas.Series(100 - prb, index=self._index(), name=threshold)
+
+    def envelope(self, low=None, high=None):
+        """Retourne l'enveloppe des previsions.
+
+        Arguments:
+            low, high (nombre entre 0 et 100, defaut None) = probabilites des
+                bornes, None pour le plus faible et le plus fort resultat
+                prevu a chaque date
+
+        Retourne un pandas.DataFrame indexe par les dates avec les colonnes
+        min et max.
+
+        """
+        valid = ~_numpy.isnan(self.res)
+        rows = _numpy.arange(len(self.dte))
+        last = len(self.prb) - 1
+        if low is None:
+            lower = self.res[rows, self._first(valid).clip(0, last)]
+        else:
+            lower = self._quantile(low)
+        if high is None:
+            upper = self.res[rows, self._last(valid).clip(0, last)]
+        else:
+            upper = self._quantile(high)
+        return _pandas.DataFrame(
+            {'min': lower, 'max': upper},
+            index=self._index(),
+            columns=['min', 'max']
+        )
+
+    def _quantile(self, p):
+        """Return the numpy.array of the results of probability p."""
+        p = float(p)
+        if (p < 0) or (p > 100):
+            raise ValueError('probabilite incorrecte')
+        valid = ~_numpy.isnan(self.res)
+        lower = self._last(valid & (self.prb <= p))
+        upper = self._first(valid & (self.prb >= p))
+        last = len(self.prb) - 1
+        rows = _numpy.arange(len(self.dte))
+        pl = self.prb[lower.clip(0, last)].astype(_numpy.float64)
+        pu = self.prb[upper.clip(0, last)].astype(_numpy.float64)
+        rl = self.res[rows, lower.clip(0, last)]
+        ru = self.res[rows, upper.clip(0, last)]
+        with _numpy.errstate(divide='ignore', invalid='ignore'):
+            res = _numpy.where(
+                pl == pu, rl, rl + (p - pl) * (ru - rl) / (pu - pl)
+            )
+        res[(lower < 0) | (upper > last)] = _numpy.nan
+        return res
+
+    def _first(self, mask):
+        """Return the first True column of each row of mask, len(prb) if
+        none."""
+        cols = _numpy.where(mask, _numpy.arange(len(self.prb)), len(self.prb))
+        return cols.min(axis=1)
+
+    def _last(self, mask):
+        """Return the last True column of each row of mask, -1 if none."""
+        cols = _numpy.where(mask, _numpy.arange(len(self.prb)), -1)
+        return cols.max(axis=1)
+
+    def _index(self):
+        """Return the dates pandas.Index."""
+        return _pandas.Index(self.dte, name='dte')
+
+    def __unicode__(self):
+        """Unicode representation."""
+        return 'Ensemble de {} dates x {} probabilites ({})'.format(
+            len(self.dte), len(self.prb),
+            ', '.join('{}%'.format(prb) for prb in self.prb)
+        )
+
+    def __str__(self):
+        """String representation."""
+        if _sys.version_info[0] >= 3:  # pragma: no cover - Python 3
+            return self.__unicode__()
+        else:  # Python 2
+            return self.__unicode__().encode(_sys.stdout.encoding)
+
+
 #-- class Simulation ----------------------------------------------------------
 class Simulation(object):
     """Classe simulation.
@@ -250,6 +500,16 @@ class Simulation(object):
         commentaire (texte)
         dtprod (datetime.datetime) = date de production
         previsions (Previsions)
+        ensemble (Ensemble) = les statistiques des previsions, en lecture
+            seule
+
+    Les previsions peuvent etre passees sous la forme d'un objet Lazy, elles
+    ne sont alors calculees (et controlees) qu'au premier acces.
+
+    L'ensemble est calcule au premier acces puis conserve tant que les
+    previsions ne sont pas remplacees. Apres une modification en place des
+    previsions, il faut les reaffecter pour le recalculer:
+        simulation.previsions = simulation.previsions
 
     """
 
@@ -296,6 +556,33 @@ class Simulation(object):
         self.dtprod = dtprod
         self.previsions = previsions
 
+    @classmethod
+    def from_trusted(
+        cls, entite, modeleprevision, grandeur, statut=4, qualite=None,
+        public=False, commentaire=None, dtprod=None, previsions=None
+    ):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Ce constructeur est destine au chargement en masse de donnees deja
+        validees en amont (fichier valide...). Les arguments doivent etre du
+        bon type, dtprod un numpy.datetime64 et previsions peut etre un objet
+        Lazy.
+
+        """
+        obj = cls.__new__(cls)
+        obj._strict = True
+        obj.public = public
+        obj.commentaire = commentaire
+        obj._entite = entite
+        obj._modeleprevision = modeleprevision
+        obj._grandeur = grandeur
+        obj._statut = statut
+        obj._qualite = qualite
+        obj._dtprod = dtprod
+        obj._previsions = previsions
+        obj._ensemble = None
+        return obj
+
     # -- property entite --
     @property
     def entite(self):
@@ -369,16 +656,9 @@ class Simulation(object):
         return self._grandeur
 
     @grandeur.setter
+    @_nomenclature.validator(509, required=False)
     def grandeur(self, grandeur):
-        try:
-            if (grandeur is not None):
-                grandeur = unicode(grandeur)
-                if (self._strict) and (grandeur not in _NOMENCLATURE[509]):
-                    raise ValueError('grandeur incorrect')
-            self._grandeur = grandeur
-
-        except:
-            raise
+        self._grandeur = grandeur
 
     # -- property statut --
     @property
@@ -387,20 +667,9 @@ class Simulation(object):
         return self._statut
 
     @statut.setter
+    @_nomenclature.validator(516, cast=int)
     def statut(self, statut):
-        try:
-            # None case
-            if statut is None:
-                raise TypeError('statut is required')
-            # other cases
-            statut = int(statut)
-            if (self._strict) and (statut not in _NOMENCLATURE[516]):
-                raise ValueError('statut incorrect')
-            # all is well
-            self._statut = statut
-
-        except:
-            raise
+        self._statut = statut
 
     # -- property qualite --
     @property
@@ -447,12 +716,17 @@ class Simulation(object):
     @property
     def previsions(self):
         """Previsions."""
+        if isinstance(self._previsions, _lazy.Lazy):
+            self.previsions = self._previsions()
         return self._previsions
 
     @previsions.setter
     def previsions(self, previsions):
         try:
-            if previsions is not None:
+            if isinstance(previsions, _lazy.Lazy):
+                # lazy previsions are checked when computed
+                pass
+            elif previsions is not None:
                 # we check we have a Series...
                 # ... and that index contains datetimes
                 if (self._strict):
@@ -465,10 +739,85 @@ class Simulation(object):
                     previsions.index[0][0].isoformat()
             # all seeem's ok :-)
             self._previsions = previsions
+            self._ensemble = None
         except:
             raise
 
+    # -- property ensemble --
+    @property
+    def ensemble(self):
+        """Ensemble des previsions, None sans previsions."""
+        previsions = self.previsions
+        if previsions is None:
+            return None
+        ensemble = getattr(self, '_ensemble', None)
+        if (ensemble is None) or (ensemble.previsions is not previsions):
+            ensemble = self._ensemble = Ensemble(previsions)
+        return ensemble
+
     # -- other methods --
+    def quantile(self, p):
+        """Retourne les resultats de probabilite p, voir Ensemble.quantile."""
+        return self._statistics().quantile(p)
+
+    def prob_exceed(self, threshold):
+        """Retourne les probabilites de depasser threshold, voir
+        Ensemble.prob_exceed."""
+        return self._statistics().prob_exceed(threshold)
+
+    def envelope(self, low=None, high=None):
+        """Retourne l'enveloppe des previsions, voir Ensemble.envelope."""
+        return self._statistics().envelope(low, high)
+
+    def downsample(self, n_points, method='lttb', begin=None, end=None):
+        """Retourne la Simulation reduite aux previsions de n_points dates au
+        plus.
+
+        Les dates sont choisies sur la courbe des resultats de probabilite 50
+        pour en conserver la forme et les pics, les dates sans resultat de
+        probabilite 50 ne sont pas conservees. Toutes les previsions des
+        dates choisies sont conservees.
+
+        Arguments:
+            n_points (int >= 3) = nombre de dates maximum
+            method (string in downsample.METHODS, defaut lttb)
+            begin, end (datetime, numpy.datetime64 ou string au format ISO
+                8601, defaut None) = bornes incluses de la periode, None pour
+                ne pas borner
+
+        """
+        ensemble = self._statistics()
+        dte = ensemble.dte
+        start = 0 if begin is None else dte.searchsorted(
+            _numpy.datetime64(begin).astype('datetime64[ns]')
+        )
+        stop = len(dte) if end is None else dte.searchsorted(
+            _numpy.datetime64(end).astype('datetime64[ns]'), 'right'
+        )
+        positions = start + _downsample.downsample(
+            dte[start:stop], ensemble._quantile(50)[start:stop], n_points,
+            method
+        )
+        previsions = self.previsions
+        kept = _numpy.in1d(
+            previsions.index.get_level_values(0).values.astype(
+                'datetime64[ns]'
+            ).view(_numpy.int64),
+            dte[positions].view(_numpy.int64)
+        )
+        return Simulation.from_trusted(
+            self.entite, self.modeleprevision, self.grandeur, self.statut,
+            self.qualite, self.public, self.commentaire, self.dtprod,
+            previsions[kept]
+        )
+
+    def _statistics(self):
+        """Return the ensemble or raise a ValueError."""
+        ensemble = self.ensemble
+        if ensemble is None:
+            raise ValueError('simulation without previsions')
+        return ensemble
+
     def __unicode__(self):
         """Unicode representation."""
         # compute entite name
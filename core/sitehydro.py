@@ -17,17 +17,21 @@ from __future__ import (
 
 import sys as _sys
 
-from .nomenclature import NOMENCLATURE as _NOMENCLATURE
+from . import nomenclature as _nomenclature
 
 
 #-- strings -------------------------------------------------------------------
 __author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
-__version__ = """0.2e"""
-__date__ = """2013-09-03"""
+__version__ = """0.2g"""
+__date__ = """2026-10-19"""
 
 #HISTORY
 #V0.1 - 2013-07-12
 #    first shot
+#V0.2f - 2026-10-19
+#    __slots__ and from_trusted constructors
+#V0.2g - 2026-10-19
+#    setters checked by nomenclature.validator
 
 
 #-- todos ---------------------------------------------------------------------
@@ -48,8 +52,13 @@ class _Entitehydro(object):
         libelle (string)
         _strict (bool) = strict or fuzzy mode
 
+    Hydro entities are numerous (a full referential holds tens of thousands
+    of them), so the classes use __slots__ and don't have any __dict__.
+
     """
 
+    __slots__ = ('_code', 'libelle', '_strict')
+
     def __init__(self, code, libelle=None, strict=True):
         """Constructor.
 
@@ -112,6 +121,8 @@ class Sitehydro(_Entitehydro):
 
     """
 
+    __slots__ = ('_typesite', '_stations')
+
     # TODO - Sitehydro other properties
 
     #libelleusuel
@@ -179,6 +190,23 @@ class Sitehydro(_Entitehydro):
         self.typesite = typesite
         self.stations = stations
 
+    @classmethod
+    def from_trusted(cls, code, typesite='REEL', libelle=None, stations=None):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Ce constructeur est destine au chargement en masse de donnees deja
+        validees en amont (referentiel, fichier valide...). Les arguments
+        doivent etre du bon type, les stations une liste de Stationhydro.
+
+        """
+        obj = cls.__new__(cls)
+        obj._strict = True
+        obj._code = code
+        obj.libelle = libelle
+        obj._typesite = typesite
+        obj._stations = list(stations) if stations else []
+        return obj
+
     # -- property typesite --
     @property
     def typesite(self):
@@ -186,23 +214,9 @@ class Sitehydro(_Entitehydro):
         return self._typesite
 
     @typesite.setter
+    @_nomenclature.validator(530)
     def typesite(self, typesite):
-        try:
-
-            # None case
-            if typesite is None:
-                raise TypeError('typesite is required')
-
-            # other cases
-            typesite = unicode(typesite)
-            if (self._strict) and (typesite not in _NOMENCLATURE[530]):
-                raise ValueError('typesite incorrect')
-
-            # all is well
-            self._typesite = typesite
-
-        except:
-            raise
+        self._typesite = typesite
 
     # -- property stations --
     @property
@@ -269,6 +283,8 @@ class Stationhydro(_Entitehydro):
 
     """
 
+    __slots__ = ('_typestation', '_capteurs')
+
     # TODO - Stationhydro other properties
 
     #capteurs
@@ -331,6 +347,23 @@ class Stationhydro(_Entitehydro):
         self.typestation = typestation
         self.capteurs = capteurs
 
+    @classmethod
+    def from_trusted(
+        cls, code, typestation='LIMNI', libelle=None, capteurs=None
+    ):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Voir Sitehydro.from_trusted.
+
+        """
+        obj = cls.__new__(cls)
+        obj._strict = True
+        obj._code = code
+        obj.libelle = libelle
+        obj._typestation = typestation
+        obj._capteurs = list(capteurs) if capteurs else []
+        return obj
+
     # -- property typestation --
     @property
     def typestation(self):
@@ -338,23 +371,9 @@ class Stationhydro(_Entitehydro):
         return self._typestation
 
     @typestation.setter
+    @_nomenclature.validator(531)
     def typestation(self, typestation):
-        try:
-
-            # None case
-            if typestation is None:
-                raise TypeError('typestation is required')
-
-            # other cases
-            typestation = unicode(typestation)
-            if (self._strict) and (typestation not in _NOMENCLATURE[531]):
-                raise ValueError('typestation incorrect')
-
-            # all is well
-            self._typestation = typestation
-
-        except:
-            raise
+        self._typestation = typestation
 
     # -- property capteurs --
     @property
@@ -421,6 +440,8 @@ class Capteur(_Entitehydro):
 
     """
 
+    __slots__ = ('_typemesure',)
+
     # TODO - Capteur other properties
 
     #mnemonique
@@ -458,6 +479,20 @@ class Capteur(_Entitehydro):
         # -- full properties --
         self.typemesure = typemesure
 
+    @classmethod
+    def from_trusted(cls, code, typemesure='H', libelle=None):
+        """Constructeur rapide, sans aucun controle de validite.
+
+        Voir Sitehydro.from_trusted.
+
+        """
+        obj = cls.__new__(cls)
+        obj._strict = True
+        obj._code = code
+        obj.libelle = libelle
+        obj._typemesure = typemesure
+        return obj
+
     # -- property typemesure --
     @property
     def typemesure(self):
@@ -465,23 +500,9 @@ class Capteur(_Entitehydro):
         return self._typemesure
 
     @typemesure.setter
+    @_nomenclature.validator(520)
     def typemesure(self, typemesure):
-        try:
-
-            # None case
-            if typemesure is None:
-                raise TypeError('typemesure is required')
-
-            # other cases
-            typemesure = unicode(typemesure)
-            if (self._strict) and (typemesure not in _NOMENCLATURE[520]):
-                raise ValueError('typemesure incorrect')
-
-            # all is well
-            self._typemesure = typemesure
-
-        except:
-            raise
+        self._typemesure = typemesure
 
     # -- other methods --
     def __unicode__(self):
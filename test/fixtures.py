@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures of the test programs.
+
+This module contains the function:
+    # serie(entite, res, grandeur, start, step) = a serie at a fixed step
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import numpy
+
+from libhydro.core import obshydro
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- functions -----------------------------------------------------------------
+def serie(entite, res, grandeur='Q', start='2013-01-01T00:00+00', step=3600):
+    """Return a serie of the results res from start every step seconds."""
+    return obshydro.Serie(
+        entite=entite,
+        grandeur=grandeur,
+        observations=obshydro.Observations.from_arrays(
+            numpy.datetime64(start, 's') + numpy.arange(len(res)) * step,
+            res
+        )
+    )
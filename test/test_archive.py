@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""Test program for archive converter.
+
+To run all tests just type:
+    './test_archive.py' or 'python test_archive.py'
+
+To run only a class test:
+    python -m unittest test_archive.TestClass
+
+To run only a specific test:
+    python -m unittest test_archive.TestClass
+    python -m unittest test_archive.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import io
+import tempfile
+import shutil
+import numpy
+
+from libhydro.conv import archive, shom
+from libhydro.core import sitehydro, obshydro
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestArchive ---------------------------------------------------------
+class TestArchive(unittest.TestCase):
+    """Archive converter tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        # 10 days at a 5 minutes step, with a shift and a 2 hours gap
+        n = 2880
+        dte = numpy.datetime64('2013-01-01T00:00Z', 's') + \
+            numpy.arange(n) * 300
+        dte[1000:] += 60
+        dte[2000:] += 7200
+        res = numpy.round(250 + 50 * numpy.sin(numpy.arange(n) / 100), 2)
+        res[[10, 11]] = numpy.nan
+        res[20] = -0.0
+        self.serie = obshydro.Serie(
+            entite=sitehydro.Stationhydro(
+                code='A123456789', typestation='DEB', libelle='La station'
+            ),
+            grandeur='Q',
+            statut=4,
+            observations=obshydro.Observations.from_arrays(
+                dte, res, numpy.where(numpy.arange(n) < 1500, 0, 4), 16,
+                numpy.arange(n) % 100 != 0
+            )
+        )
+
+    def _archive(self, serie, block=500):
+        """Return a BytesIO of the archive of serie."""
+        f = io.BytesIO()
+        archive.serie_to_archive(serie, f, block=block)
+        f.seek(0)
+        return f
+
+    def assertObservationsEqual(self, first, second):
+        """Assert that two Observations are identical, NaN included."""
+        self.assertTrue((first.index.values == second.index.values).all())
+        self.assertEqual(first.dtypes.tolist(), second.dtypes.tolist())
+        self.assertEqual(
+            first['res'].values.tostring(), second['res'].values.tostring()
+        )
+        for column in ('mth', 'qal', 'cnt'):
+            self.assertTrue((first[column] == second[column]).all())
+
+    def test_base_01(self):
+        """Round trip."""
+        serie = archive.serie_from_archive(self._archive(self.serie))
+        self.assertObservationsEqual(
+            serie.observations, self.serie.observations
+        )
+        self.assertEqual((serie.grandeur, serie.statut), ('Q', 4))
+        self.assertIsInstance(serie.entite, sitehydro.Stationhydro)
+        self.assertEqual(
+            (
+                serie.entite.code, serie.entite.typestation,
+                serie.entite.libelle
+            ),
+            ('A123456789', 'DEB', 'La station')
+        )
+
+    def test_base_02(self):
+        """Blocks and period."""
+        f = self._archive(self.serie)
+        header, table = archive.blocks(f)
+        self.assertEqual(header['count'], 2880)
+        self.assertEqual(table['count'].tolist(), [500] * 5 + [380])
+        self.assertTrue((table['first'][1:] > table['last'][:-1]).all())
+        # a period in the 2nd block only
+        f.seek(0)
+        serie = archive.serie_from_archive(
+            f, begin='2013-01-03T00:00Z', end='2013-01-03T02:00Z'
+        )
+        expected = self.serie.observations[
+            '2013-01-03 00:00':'2013-01-03 02:00'
+        ]
+        self.assertEqual(len(expected), 25)
+        self.assertObservationsEqual(serie.observations, expected)
+        # no observation in the period
+        f.seek(0)
+        serie = archive.serie_from_archive(f, end='2012-01-01T00:00Z')
+        self.assertEqual(len(serie.observations), 0)
+
+    def test_base_03(self):
+        """Compression."""
+        f = self._archive(self.serie)
+        raw = 2880 * obshydro.Observation.DTYPE.itemsize
+        self.assertLess(len(f.getvalue()) * 5, raw)
+
+    def test_base_04(self):
+        """Unsorted, empty and file archives."""
+        observations = self.serie.observations
+        self.serie.observations = observations.iloc[::-1]
+        serie = archive.serie_from_archive(self._archive(self.serie, 7))
+        self.assertObservationsEqual(serie.observations, observations)
+        # empty serie
+        serie = archive.serie_from_archive(
+            self._archive(obshydro.Serie(grandeur='H', strict=False))
+        )
+        self.assertIsNone(serie.entite)
+        self.assertEqual(len(serie.observations), 0)
+        # file
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'serie.lha')
+            archive.serie_to_archive(self.serie, path)
+            self.assertObservationsEqual(
+                archive.serie_from_archive(path).observations, observations
+            )
+            self.assertEqual(archive.blocks(path)[0]['count'], 2880)
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_base_05(self):
+        """Simplified observations with a res column only."""
+        simplified = shom.serie_from_hfs(
+            os.path.join('data', 'shom', 'LOCMARIAQUER.hfs')
+        )
+        self.assertEqual(simplified.observations.columns.tolist(), ['res'])
+        serie = archive.serie_from_archive(self._archive(simplified))
+        observations = serie.observations
+        self.assertTrue(
+            (observations.index.values ==
+             simplified.observations.index.values).all()
+        )
+        self.assertTrue(
+            (observations['res'] == simplified.observations['res']).all()
+        )
+        # the missing columns get their defaults
+        self.assertTrue((observations['mth'] == 0).all())
+        self.assertTrue((observations['qal'] == 16).all())
+        self.assertTrue(observations['cnt'].all())
+
+    def test_error_01(self):
+        """Errors."""
+        self.assertRaises(
+            ValueError, archive.serie_to_archive, self.serie, io.BytesIO(), 0
+        )
+        self.assertRaises(
+            ValueError, archive.serie_from_archive, io.BytesIO(b'<?xml ')
+        )
+        data = self._archive(self.serie).getvalue()
+        self.assertRaises(
+            ValueError, archive.serie_from_archive, io.BytesIO(data[:50])
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Test program for crues.
+
+To run all tests just type:
+    './test_calc_crues.py' or 'python test_calc_crues.py'
+
+To run only a class test:
+    python -m unittest test_calc_crues.TestClass
+
+To run only a specific test:
+    python -m unittest test_calc_crues.TestClass
+    python -m unittest test_calc_crues.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import numpy
+
+from libhydro.core import sitehydro
+from libhydro.calc import crues
+
+import fixtures
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- functions -----------------------------------------------------------------
+def _hours(values):
+    """Return the hours of a datetime64[ns] or a timedelta64[ns] array."""
+    return (values.view(numpy.int64) // (3600 * 10 ** 9) % 24).tolist()
+
+
+#-- class TestEvents ----------------------------------------------------------
+class TestEvents(unittest.TestCase):
+    """Events function tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'),
+            [0, 10, 20, 10, 0, 0, 15, 5, 30, 30, 0]
+        )
+
+    def test_base_01(self):
+        """Events."""
+        table = crues.events([self.serie], 10)
+        self.assertEqual(table.columns.tolist(), list(crues.COLUMNS))
+        self.assertEqual(table.index.name, 'entite')
+        self.assertEqual(table.index.tolist(), ['A123456789'] * 3)
+        self.assertEqual(table['grandeur'].tolist(), ['Q'] * 3)
+        self.assertEqual(_hours(table['debut'].values), [1, 6, 8])
+        self.assertEqual(_hours(table['fin'].values), [3, 6, 9])
+        self.assertEqual(_hours(table['dtmax'].values), [2, 6, 8])
+        self.assertEqual(table['max'].tolist(), [20, 15, 30])
+        self.assertEqual(_hours(table['montee'].values), [1, 0, 0])
+        self.assertEqual(_hours(table['duree'].values), [2, 0, 1])
+        # the threshold crossings are interpolated
+        volumes = [10, 5 / 6 + 5 / 4, 8 + 20 + 20 / 3]
+        for volume, expected in zip(table['volume'], volumes):
+            self.assertAlmostEqual(volume, expected * 3600)
+
+    def test_base_02(self):
+        """Separation and thresholds."""
+        table = crues.events(
+            [self.serie], 10, separation=datetime.timedelta(hours=3)
+        )
+        self.assertEqual(_hours(table['debut'].values), [1, 6])
+        self.assertEqual(_hours(table['fin'].values), [3, 9])
+        self.assertEqual(table['max'].tolist(), [20, 30])
+        self.assertEqual(_hours(table['montee'].values), [1, 2])
+        # thresholds by entite and by (entite, grandeur)
+        other = fixtures.serie(
+            sitehydro.Stationhydro(code='B123456789'), [0, 5, 0], grandeur='H'
+        )
+        table = crues.events(
+            [self.serie, other], {'A123456789': 25, 'B123456789': 1}
+        )
+        self.assertEqual(table.index.tolist(), ['A123456789', 'B123456789'])
+        self.assertEqual(table['max'].tolist(), [30, 5])
+        table = crues.events(
+            [self.serie, other], {('B123456789', 'Q'): 1, 'A123456789': 25}
+        )
+        self.assertEqual(table.index.tolist(), ['A123456789'])
+
+    def test_base_03(self):
+        """Merged series and no events."""
+        # the series of an entite are merged
+        station = sitehydro.Stationhydro(code='A123456789')
+        first = fixtures.serie(station, [0, 20, 20])
+        second = fixtures.serie(
+            station, [20, 0], start='2013-01-01T03:00+00'
+        )
+        table = crues.events([first, second], 10)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(_hours(table['duree'].values), [2])
+        # no events
+        table = crues.events([self.serie], 100)
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.columns.tolist(), list(crues.COLUMNS))
+        self.assertEqual(len(crues.events([], 100)), 0)
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Test program for maree.
+
+To run all tests just type:
+    './test_calc_maree.py' or 'python test_calc_maree.py'
+
+To run only a class test:
+    python -m unittest test_calc_maree.TestClass
+
+To run only a specific test:
+    python -m unittest test_calc_maree.TestClass
+    python -m unittest test_calc_maree.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import math
+import numpy
+
+from libhydro.core import sitehydro, obshydro, simulation
+from libhydro.calc import maree
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestHarmonics -------------------------------------------------------
+class TestHarmonics(unittest.TestCase):
+    """Harmonics class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.station = sitehydro.Stationhydro(code='A123456789')
+        self.harmonics = maree.Harmonics(
+            z0=4, names=['M2', 'S2'], amplitudes=[2, 0.5], phases=[90, 0],
+            entite=self.station
+        )
+
+    def test_base_01(self):
+        """Base case."""
+        self.assertEqual(self.harmonics.names, ('M2', 'S2'))
+        self.assertEqual(self.harmonics.amplitudes.tolist(), [2, 0.5])
+        self.assertEqual(
+            unicode(self.harmonics),
+            'Constantes harmoniques de 2 composantes, z0 4.000, '
+            'principales M2 2.000, S2 0.500'
+        )
+        self.assertRaises(
+            ValueError, maree.Harmonics, 0, ['XX'], [1], [0]
+        )
+        self.assertRaises(
+            ValueError, maree.Harmonics, 0, ['M2'], [1, 2], [0]
+        )
+
+    def test_predict_01(self):
+        """Predict."""
+        # at EPOCH, z0 + 2 cos(-90) + 0.5 cos(0)
+        self.assertAlmostEqual(
+            self.harmonics.predict([maree.EPOCH])[0], 4.5
+        )
+        # 3 hours later for S2, a quarter of its period
+        heights = self.harmonics.predict(
+            ['2000-01-01T00:00Z', '2000-01-01T03:00Z']
+        )
+        self.assertAlmostEqual(
+            heights[1],
+            4 + 2 * math.cos(math.radians(3 * 28.9841042 - 90))
+        )
+
+    def test_simulation_01(self):
+        """Simulation."""
+        simul = self.harmonics.simulation(
+            begin='2014-01-01T00:00Z', end='2014-01-02T00:00Z',
+            dtprod=datetime.datetime(2013, 12, 31)
+        )
+        self.assertIsInstance(simul, simulation.Simulation)
+        self.assertEqual(simul.entite, self.station)
+        self.assertEqual(simul.grandeur, 'H')
+        self.assertEqual(simul.modeleprevision.code, maree.MODELE)
+        self.assertEqual(simul.modeleprevision.typemodele, 5)
+        self.assertEqual(len(simul.previsions), 145)
+        dates = simul.previsions.index.get_level_values('dte')
+        self.assertEqual(dates[1], datetime.datetime(2014, 1, 1, 0, 10))
+        numpy.testing.assert_allclose(
+            simul.previsions.values, self.harmonics.predict(dates.values)
+        )
+        self.assertEqual(
+            set(simul.previsions.index.get_level_values('prb')), set([50])
+        )
+        # a step and an empty period
+        simul = self.harmonics.simulation(
+            begin='2014-01-01T00:00Z', end='2014-01-02T00:00Z',
+            step=datetime.timedelta(hours=1)
+        )
+        self.assertEqual(len(simul.previsions), 25)
+        self.assertRaises(
+            ValueError, self.harmonics.simulation, '2014-01-01',
+            '2014-01-02', datetime.timedelta(0)
+        )
+
+
+#-- class TestAnalyse ---------------------------------------------------------
+class TestAnalyse(unittest.TestCase):
+    """Analyse function tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        # 30 days of hourly observations
+        self.harmonics = maree.Harmonics(
+            z0=4.5, names=['M2', 'S2', 'K1', 'O1'],
+            amplitudes=[2.1, 0.7, 0.1, 0.07], phases=[120, 160, 80, 300]
+        )
+        dte = numpy.datetime64('2013-01-01T00:00Z', 's') + \
+            numpy.arange(30 * 24) * 3600
+        self.serie = obshydro.Serie(
+            entite=sitehydro.Stationhydro(code='A123456789'),
+            grandeur='H',
+            observations=obshydro.Observations.from_arrays(
+                dte, self.harmonics.predict(dte)
+            )
+        )
+
+    def test_base_01(self):
+        """Analyse given constituents."""
+        harmonics = maree.analyse(
+            self.serie, constituents=['O1', 'M2', 'K1', 'S2']
+        )
+        self.assertEqual(harmonics.names, ('M2', 'S2', 'K1', 'O1'))
+        self.assertAlmostEqual(harmonics.z0, 4.5)
+        numpy.testing.assert_allclose(
+            harmonics.amplitudes, self.harmonics.amplitudes
+        )
+        numpy.testing.assert_allclose(
+            harmonics.phases, self.harmonics.phases
+        )
+        self.assertEqual(harmonics.entite, self.serie.entite)
+
+    def test_base_02(self):
+        """Rayleigh criterion and period."""
+        harmonics = maree.analyse(self.serie)
+        # K2 and P1 need 6 months, SA a year
+        for name in ('M2', 'S2', 'N2', 'K1', 'O1'):
+            self.assertIn(name, harmonics.names)
+        for name in ('K2', 'P1', 'SA', 'SSA'):
+            self.assertNotIn(name, harmonics.names)
+        # 10 days are not enough to separate M2 and S2, K1 and O1
+        harmonics = maree.analyse(
+            self.serie, constituents=['M2', 'S2', 'K1', 'O1'],
+            begin='2013-01-05', end='2013-01-14T23:00Z'
+        )
+        self.assertEqual(harmonics.names, ('M2', 'K1'))
+        harmonics = maree.analyse(
+            self.serie, constituents=['K1', 'P1'], rayleigh=0
+        )
+        self.assertEqual(harmonics.names, ('K1', 'P1'))
+
+    def test_error_01(self):
+        """Errors."""
+        self.assertRaises(
+            ValueError, maree.analyse, self.serie, constituents=['XX']
+        )
+        self.assertRaises(
+            ValueError, maree.analyse, self.serie, begin='2014-01-01'
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
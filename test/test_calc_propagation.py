@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Test program for propagation.
+
+To run all tests just type:
+    './test_calc_propagation.py' or 'python test_calc_propagation.py'
+
+To run only a class test:
+    python -m unittest test_calc_propagation.TestClass
+
+To run only a specific test:
+    python -m unittest test_calc_propagation.TestClass
+    python -m unittest test_calc_propagation.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import numpy
+
+from libhydro.core import sitehydro, simulation
+from libhydro.calc import propagation
+
+import fixtures
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestLagRoute --------------------------------------------------------
+class TestLagRoute(unittest.TestCase):
+    """LagRoute class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.site = sitehydro.Sitehydro(code='A1234567')
+        self.model = propagation.LagRoute(
+            step=datetime.timedelta(hours=1), lags=[1], widths=[2],
+            gains=[2], intercept=1, errors={10: -1, 50: 0}, entite=self.site,
+            grandeur='Q'
+        )
+        self.upstream = fixtures.serie(
+            sitehydro.Stationhydro(code='B123456789'), [1, 2, 3, 4]
+        )
+
+    def test_base_01(self):
+        """Base case."""
+        self.assertEqual(self.model.step, 3600 * 10 ** 9)
+        self.assertEqual(self.model.horizon, 1)
+        self.assertEqual(self.model.lags.tolist(), [1])
+        self.assertTrue(unicode(self.model).startswith(
+            'Modele de propagation de 1 stations amont au pas de 1:00:00'
+        ))
+
+    def test_simulate_01(self):
+        """Simulate."""
+        dte, res = self.model.simulate([self.upstream])
+        self.assertEqual(len(dte), 5)
+        self.assertEqual(
+            dte[-1], numpy.datetime64('2013-01-01T04:00+00', 'ns')
+        )
+        self.assertTrue(numpy.isnan(res[:2]).all())
+        self.assertEqual(res[2:].tolist(), [4, 6, 8])
+        dte, res = self.model.simulate(
+            [self.upstream], begin='2013-01-01T03:00+00'
+        )
+        self.assertEqual(res.tolist(), [6, 8])
+
+    def test_predict_01(self):
+        """Predict."""
+        simul = self.model.predict(
+            [self.upstream], dtprod=datetime.datetime(2013, 1, 1, 3)
+        )
+        self.assertIsInstance(simul, simulation.Simulation)
+        self.assertEqual(simul.entite, self.site)
+        self.assertEqual(simul.grandeur, 'Q')
+        self.assertEqual(simul.dtprod, datetime.datetime(2013, 1, 1, 3))
+        previsions = simul.previsions
+        self.assertEqual(previsions.tolist(), [7, 8])
+        self.assertEqual(
+            previsions.index.get_level_values('prb').tolist(), [10, 50]
+        )
+        self.assertEqual(
+            previsions.index.get_level_values('dte')[0],
+            datetime.datetime(2013, 1, 1, 4)
+        )
+
+    def test_error_01(self):
+        """Errors."""
+        self.assertRaises(
+            ValueError, propagation.LagRoute, datetime.timedelta(hours=1),
+            [0], [1], [1]
+        )
+        self.assertRaises(
+            ValueError, propagation.LagRoute, datetime.timedelta(hours=1),
+            [1, 2], [1], [1]
+        )
+        self.assertRaises(
+            ValueError, self.model.predict, [self.upstream, self.upstream]
+        )
+
+
+#-- class TestFit -------------------------------------------------------------
+class TestFit(unittest.TestCase):
+    """Fit function tests."""
+
+    def test_base_01(self):
+        """Fit two upstream series."""
+        random = numpy.random.RandomState(0)
+        first, second = random.uniform(0, 100, (2, 1000))
+        # lag 2, width 2 and lag 5, width 1
+        downstream = numpy.empty(1000)
+        downstream.fill(numpy.nan)
+        downstream[6:] = 2 + 0.5 * (first[3:-3] + first[4:-2]) / 2 + \
+            0.25 * second[1:-5]
+        model = propagation.fit(
+            [
+                fixtures.serie(
+                    sitehydro.Stationhydro(code='B123456789'), first
+                ),
+                fixtures.serie(
+                    sitehydro.Stationhydro(code='C123456789'), second
+                )
+            ],
+            fixtures.serie(sitehydro.Sitehydro(code='A1234567'), downstream),
+            max_lag=8, widths=[1, 2, 3]
+        )
+        self.assertEqual(model.lags.tolist(), [2, 5])
+        self.assertEqual(model.widths.tolist(), [2, 1])
+        numpy.testing.assert_allclose(model.gains, [0.5, 0.25])
+        self.assertAlmostEqual(model.intercept, 2)
+        self.assertAlmostEqual(model.score, 1)
+        self.assertEqual(sorted(model.errors), [10, 50, 90])
+        self.assertAlmostEqual(model.errors[90], 0)
+        self.assertEqual(model.horizon, 2)
+        self.assertEqual(model.entite.code, 'A1234567')
+
+    def test_error_01(self):
+        """Errors."""
+        upstream = fixtures.serie(
+            sitehydro.Stationhydro(code='B123456789'), [1, 2]
+        )
+        downstream = fixtures.serie(
+            sitehydro.Sitehydro(code='A1234567'), [1, 2]
+        )
+        self.assertRaises(
+            ValueError, propagation.fit, [upstream], downstream, max_lag=0
+        )
+        self.assertRaises(ValueError, propagation.fit, [], downstream)
+        self.assertRaises(
+            ValueError, propagation.fit, [upstream], downstream, max_lag=1
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Test program for statistiques.
+
+To run all tests just type:
+    './test_calc_statistiques.py' or 'python test_calc_statistiques.py'
+
+To run only a class test:
+    python -m unittest test_calc_statistiques.TestClass
+
+To run only a specific test:
+    python -m unittest test_calc_statistiques.TestClass
+    python -m unittest test_calc_statistiques.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import math
+import numpy
+import pandas
+
+from libhydro.core import sitehydro, panel
+from libhydro.calc import statistiques
+
+import fixtures
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestFunctions -------------------------------------------------------
+class TestFunctions(unittest.TestCase):
+    """Functions tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        # 2 days of 2012-08 and 3 days of 2012-09
+        self.first = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [1, 5, 2, 3, 4],
+            start='2012-08-30T00:00+00', step=86400
+        )
+        self.second = fixtures.serie(
+            sitehydro.Stationhydro(code='B123456789'),
+            [10, 20, 30, 40, 50, 60],
+            start='2012-08-30T00:00+00', step=86400
+        )
+
+    def test_duration_curves_01(self):
+        """Duration curves."""
+        curves = statistiques.duration_curves(
+            [self.first, self.second], probabilities=[0, 10, 50, 100]
+        )
+        self.assertEqual(curves.index.name, 'probabilite')
+        self.assertEqual(curves.index.tolist(), [0, 10, 50, 100])
+        self.assertEqual(
+            curves.columns.tolist(), ['A123456789', 'B123456789']
+        )
+        self.assertEqual(curves['A123456789'].tolist(), [5, 4.6, 3, 1])
+        self.assertEqual(curves['B123456789'].tolist(), [60, 55, 35, 10])
+        # the same from a panel
+        frame = statistiques.duration_curves(
+            panel.SeriesPanel([self.first, self.second]),
+            probabilities=[0, 10, 50, 100]
+        )
+        self.assertTrue((frame.values == curves.values).all())
+        # default probabilities and errors
+        curves = statistiques.duration_curves([self.first])
+        self.assertEqual(
+            curves.index.tolist(), list(statistiques.DURATION)
+        )
+        self.assertRaises(
+            ValueError, statistiques.duration_curves, [self.first], [101]
+        )
+
+    def test_annual_maxima_01(self):
+        """Annual maxima."""
+        maxima = statistiques.annual_maxima([self.first, self.second])
+        self.assertEqual(maxima.index.name, 'annee')
+        self.assertEqual(maxima.index.tolist(), [2012])
+        self.assertEqual(maxima.values.tolist(), [[5, 60]])
+        # hydrological years from september
+        maxima = statistiques.annual_maxima(
+            [self.first, self.second], start_month=9
+        )
+        self.assertEqual(maxima.index.tolist(), [2011, 2012])
+        self.assertEqual(maxima.values.tolist(), [[5, 20], [4, 60]])
+        # years with too few observations
+        maxima = statistiques.annual_maxima(
+            [self.first], start_month=9, min_count=3
+        )
+        self.assertTrue(math.isnan(maxima['A123456789'][2011]))
+        self.assertEqual(maxima['A123456789'][2012], 4)
+
+    def test_fit_01(self):
+        """Gumbel fit and return levels."""
+        maxima = pandas.DataFrame(
+            {'A': [1, 2, 3, 4], 'B': [4, 3, numpy.nan, numpy.nan]},
+            columns=['A', 'B']
+        )
+        parameters = statistiques.fit(maxima)
+        self.assertEqual(parameters.index.name, 'entite')
+        self.assertEqual(parameters.index.tolist(), ['A', 'B'])
+        self.assertEqual(
+            parameters.columns.tolist(), ['n', 'loc', 'scale']
+        )
+        self.assertEqual(parameters['n'].tolist(), [4, 2])
+        # l1 = 2.5 and l2 = 5 / 6 for A, 3.5 and 1 / 2 for B
+        scale = 5 / 6 / math.log(2)
+        self.assertAlmostEqual(parameters['scale']['A'], scale)
+        self.assertAlmostEqual(
+            parameters['loc']['A'], 2.5 - statistiques.EULER * scale
+        )
+        self.assertAlmostEqual(
+            parameters['scale']['B'], 1 / 2 / math.log(2)
+        )
+        levels = statistiques.return_levels(parameters, periods=[2, 100])
+        self.assertEqual(levels.index.name, 'periode')
+        self.assertEqual(levels.index.tolist(), [2, 100])
+        self.assertEqual(levels.columns.tolist(), ['A', 'B'])
+        self.assertAlmostEqual(
+            levels['A'][100], parameters['loc']['A'] -
+            scale * math.log(-math.log(1 - 1 / 100))
+        )
+        self.assertRaises(
+            ValueError, statistiques.return_levels, parameters, [1]
+        )
+        self.assertRaises(ValueError, statistiques.fit, maxima, 'normal')
+
+    def test_fit_02(self):
+        """GEV fit."""
+        values = numpy.random.RandomState(0).gumbel(100, 20, (200, 500))
+        parameters = statistiques.fit(pandas.DataFrame(values), law='gev')
+        self.assertEqual(
+            parameters.columns.tolist(), ['n', 'loc', 'scale', 'shape']
+        )
+        # a Gumbel sample has a null shape
+        self.assertAlmostEqual(parameters['loc'].mean(), 100, places=0)
+        self.assertAlmostEqual(parameters['scale'].mean() / 20, 1, places=1)
+        self.assertAlmostEqual(parameters['shape'].mean(), 0, places=1)
+        levels = statistiques.return_levels(parameters, periods=[100])
+        self.assertAlmostEqual(
+            levels.values.mean() / (100 - 20 * math.log(-math.log(0.99))),
+            1, places=1
+        )
+        # too few maxima
+        parameters = statistiques.fit(
+            pandas.DataFrame({'A': [1, 2]}), law='gev'
+        )
+        self.assertTrue(
+            parameters.ix['A', ['loc', 'scale', 'shape']].isnull().all()
+        )
+
+
+#-- class TestReport ----------------------------------------------------------
+class TestReport(unittest.TestCase):
+    """Report class tests."""
+
+    def test_base_01(self):
+        """Cache."""
+        first = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [1, 5, 2, 3, 4],
+            start='2012-08-30T00:00+00', step=86400
+        )
+        second = fixtures.serie(
+            sitehydro.Stationhydro(code='B123456789'),
+            [10, 20, 30, 40, 50, 60],
+            start='2012-08-30T00:00+00', step=86400
+        )
+        report = statistiques.Report(
+            probabilities=[0, 50], periods=[10], law='gumbel', start_month=9
+        )
+        results = report.compute([first, second])
+        self.assertEqual(
+            sorted(results), ['duration', 'levels', 'maxima', 'parameters']
+        )
+        self.assertEqual(report.computed, ['A123456789', 'B123456789'])
+        self.assertEqual(
+            results['duration'].values.tolist(), [[5, 60], [3, 35]]
+        )
+        self.assertEqual(
+            results['maxima'].values.tolist(), [[5, 20], [4, 60]]
+        )
+        self.assertEqual(
+            results['levels'].values.tolist(),
+            statistiques.return_levels(
+                statistiques.fit(results['maxima']), [10]
+            ).values.tolist()
+        )
+        # nothing to compute
+        again = report.compute([first, second])
+        self.assertEqual(report.computed, [])
+        self.assertEqual(
+            again['duration'].values.tolist(),
+            results['duration'].values.tolist()
+        )
+        # a modified serie and a new period
+        second.observations['res'].values[0] = 100
+        results = report.compute([first, second])
+        self.assertEqual(report.computed, ['B123456789'])
+        self.assertEqual(results['maxima']['B123456789'][2011], 100)
+        results = report.compute([first, second], begin='2012-09-01')
+        self.assertEqual(report.computed, ['A123456789', 'B123456789'])
+        self.assertEqual(results['maxima'].index.tolist(), [2012])
+        self.assertEqual(len(report.cache), 4)
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""Test program for surcote.
+
+To run all tests just type:
+    './test_calc_surcote.py' or 'python test_calc_surcote.py'
+
+To run only a class test:
+    python -m unittest test_calc_surcote.TestClass
+
+To run only a specific test:
+    python -m unittest test_calc_surcote.TestClass
+    python -m unittest test_calc_surcote.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import numpy
+
+from libhydro.core import sitehydro, obshydro, simulation
+from libhydro.conv import shom
+from libhydro.calc import surcote
+
+import fixtures
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- config --------------------------------------------------------------------
+SRC = os.path.join('data', 'shom', 'LOCMARIAQUER.hfs')
+
+# the date of the first observations, every 5 minutes
+START = '2013-01-23T00:05Z'
+
+
+#-- class TestResiduals -------------------------------------------------------
+class TestResiduals(unittest.TestCase):
+    """Residuals function tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        # 3.46, 3.51, 3.55 at 00:00, 00:10 and 00:20
+        self.simulation = shom.simulation_from_hfs(SRC)
+
+    def test_base_01(self):
+        """Residuals of a SHOM simulation."""
+        serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [4, 4, 4, 4],
+            grandeur='H', start=START, step=300
+        )
+        residus = surcote.residuals(serie, self.simulation)
+        self.assertIsInstance(residus, obshydro.Serie)
+        self.assertEqual(residus.entite, serie.entite)
+        self.assertEqual(residus.grandeur, 'H')
+        numpy.testing.assert_allclose(
+            residus.observations['res'].values,
+            [4 - 3.485, 4 - 3.51, 4 - 3.53, 4 - 3.55]
+        )
+        self.assertEqual(
+            residus.observations.index.tolist(),
+            serie.observations.index.tolist()
+        )
+
+    def test_base_02(self):
+        """Methods, tolerance and dates out of the previsions."""
+        serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [4, 4],
+            grandeur='H', start=START, step=300
+        )
+        residus = surcote.residuals(serie, self.simulation, method='nearest')
+        numpy.testing.assert_allclose(
+            residus.observations['res'].values, [4 - 3.51, 4 - 3.51]
+        )
+        residus = surcote.residuals(
+            serie, self.simulation, tolerance=datetime.timedelta(minutes=4)
+        )
+        numpy.testing.assert_allclose(
+            residus.observations['res'].values, [4 - 3.51]
+        )
+        # the observations before the previsions have no residual
+        serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [4, 4, 4],
+            grandeur='H', start='2013-01-22T23:55Z', step=300
+        )
+        residus = surcote.residuals(serie, self.simulation)
+        self.assertEqual(len(residus.observations), 2)
+
+    def test_error_01(self):
+        """Errors."""
+        serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [4],
+            grandeur='H', start=START, step=300
+        )
+        self.assertRaises(
+            ValueError, surcote.residuals, serie, self.simulation,
+            method='spline'
+        )
+        prevs = simulation.Simulation(
+            previsions=simulation.Previsions.from_arrays(
+                dte=['2013-01-23T00:00'], res=[1], prb=10
+            ), strict=False
+        )
+        self.assertRaises(ValueError, surcote.Surcote, prevs)
+        serie.grandeur = 'Q'
+        self.assertRaises(
+            ValueError, surcote.residuals, serie, self.simulation
+        )
+
+
+#-- class TestSurcote ---------------------------------------------------------
+class TestSurcote(unittest.TestCase):
+    """Surcote class tests."""
+
+    def test_update_01(self):
+        """Incremental updates."""
+        suivi = surcote.Surcote(shom.simulation_from_hfs(SRC))
+        self.assertIsNone(suivi.serie)
+        self.assertIsNone(suivi.last)
+        self.assertEqual(len(suivi), 0)
+        serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [4, 4],
+            grandeur='H', start=START, step=300
+        )
+        self.assertEqual(len(suivi.update(serie).observations), 2)
+        self.assertEqual(
+            suivi.last, numpy.datetime64('2013-01-23T00:10Z', 'ns')
+        )
+        # the same observations again, nothing new
+        self.assertEqual(len(suivi.update(serie).observations), 0)
+        # new observations, the old ones are not realigned
+        serie = fixtures.serie(
+            sitehydro.Stationhydro(code='A123456789'), [9, 9, 5, 5],
+            grandeur='H', start=START, step=300
+        )
+        residus = suivi.update(serie)
+        numpy.testing.assert_allclose(
+            residus.observations['res'].values, [5 - 3.53, 5 - 3.55]
+        )
+        self.assertEqual(len(suivi), 4)
+        numpy.testing.assert_allclose(
+            suivi.serie.observations['res'].values,
+            [4 - 3.485, 4 - 3.51, 5 - 3.53, 5 - 3.55]
+        )
+        self.assertEqual(suivi.serie.entite.code, serie.entite.code)
+        self.assertTrue(unicode(suivi).startswith('Surcote de 4 residus'))
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
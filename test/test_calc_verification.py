@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Test program for verification.
+
+To run all tests just type:
+    './test_calc_verification.py' or 'python test_calc_verification.py'
+
+To run only a class test:
+    python -m unittest test_calc_verification.TestClass
+
+To run only a specific test:
+    python -m unittest test_calc_verification.TestClass
+    python -m unittest test_calc_verification.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import math
+import numpy
+
+from libhydro.core import (
+    sitehydro, modeleprevision, obshydro, simulation
+)
+from libhydro.calc.verification import Verification
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- functions -----------------------------------------------------------------
+def _simulation(site, modele, dtprod, dte, res, prb=50):
+    """Return a Q simulation."""
+    return simulation.Simulation(
+        entite=site,
+        modeleprevision=modeleprevision.Modeleprevision(code=modele),
+        grandeur='Q',
+        dtprod=numpy.datetime64('2012-10-03T%s+00' % dtprod, 's'),
+        previsions=simulation.Previsions.from_arrays(
+            ['2012-10-03T%s+00' % h for h in dte], res, prb
+        )
+    )
+
+
+#-- class TestVerification ----------------------------------------------------
+class TestVerification(unittest.TestCase):
+    """Verification class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.site = sitehydro.Sitehydro(code='A1234567')
+        # 10, 20... 70 from 00:00 to 06:00
+        self.serie = obshydro.Serie(
+            entite=self.site,
+            grandeur='Q',
+            observations=obshydro.Observations.from_arrays(
+                ['2012-10-03T%02i:00+00' % h for h in range(7)],
+                [10 * (h + 1) for h in range(7)]
+            )
+        )
+        self.simulations = [
+            _simulation(
+                self.site, 'M1', '00:00', ['01:00', '02:00'], [22, 28]
+            ),
+            _simulation(
+                self.site, 'M1', '01:00', ['02:00', '03:00'], [33, 40]
+            )
+        ]
+
+    def test_base_01(self):
+        """Pairs."""
+        verif = Verification(self.simulations, [self.serie])
+        self.assertEqual(len(verif), 4)
+        pairs = verif.pairs()
+        self.assertEqual(
+            pairs.columns.tolist(),
+            ['modele', 'entite', 'dtprod', 'dte', 'echeance', 'obs', 'prv',
+             'crps']
+        )
+        self.assertEqual(pairs['modele'].tolist(), ['M1'] * 4)
+        self.assertEqual(pairs['entite'].tolist(), ['A1234567'] * 4)
+        self.assertEqual(
+            pairs['echeance'].values.tolist(),
+            [3600 * h * 10 ** 9 for h in (1, 2, 1, 2)]
+        )
+        self.assertEqual(pairs['obs'].tolist(), [20, 30, 30, 40])
+        self.assertEqual(pairs['prv'].tolist(), [22, 28, 33, 40])
+        # the crps of a deterministic forecast is the absolute error
+        self.assertEqual(pairs['crps'].tolist(), [2, 2, 3, 0])
+
+    def test_base_02(self):
+        """Scores by lead time."""
+        verif = Verification(self.simulations, [self.serie])
+        scores = verif.scores(threshold=30)
+        self.assertEqual(
+            scores.columns.tolist(),
+            ['n', 'bias', 'rmse', 'nash', 'crps', 'pod', 'far']
+        )
+        self.assertEqual(scores.index.names, ['modele', 'entite', 'echeance'])
+        lead1 = scores.ix[('M1', 'A1234567', datetime.timedelta(hours=1))]
+        self.assertEqual(lead1['n'], 2)
+        self.assertEqual(lead1['bias'], 2.5)
+        self.assertAlmostEqual(lead1['rmse'], math.sqrt(6.5))
+        self.assertAlmostEqual(lead1['nash'], 0.74)
+        self.assertEqual(lead1['crps'], 2.5)
+        self.assertEqual((lead1['pod'], lead1['far']), (1, 0))
+        lead2 = scores.ix[('M1', 'A1234567', datetime.timedelta(hours=2))]
+        self.assertEqual(lead2['bias'], -1)
+        self.assertAlmostEqual(lead2['rmse'], math.sqrt(2))
+        self.assertAlmostEqual(lead2['nash'], 0.92)
+        self.assertEqual((lead2['pod'], lead2['far']), (0.5, 0))
+        # by model only
+        scores = verif.scores(by=['modele'])
+        self.assertEqual(scores.index.tolist(), ['M1'])
+        self.assertEqual(scores['n'].tolist(), [4])
+        self.assertEqual(scores['bias'].tolist(), [0.75])
+        # lead times step
+        verif = Verification(
+            self.simulations, [self.serie], step=datetime.timedelta(hours=3)
+        )
+        self.assertEqual(
+            verif.scores(by=['echeance']).index.tolist(),
+            [datetime.timedelta(0)]
+        )
+
+    def test_base_03(self):
+        """Ensemble crps."""
+        sim = _simulation(
+            self.site, 'M2', '00:00', ['01:00'] * 3, [10, 20, 30],
+            [10, 50, 90]
+        )
+        verif = Verification([sim], [self.serie])
+        self.assertEqual(verif.prv.tolist(), [20])
+        self.assertAlmostEqual(verif.crps[0], 4 / 3)
+
+    def test_base_04(self):
+        """Alignment methods."""
+        sim = _simulation(
+            self.site, 'M2', '00:00', ['00:30', '01:15', '07:00'], [1, 2, 3]
+        )
+        verif = Verification([sim], [self.serie])
+        self.assertEqual(verif.obs[:2].tolist(), [15, 22.5])
+        self.assertTrue(numpy.isnan(verif.obs[2]))
+        verif = Verification([sim], [self.serie], method='nearest')
+        self.assertEqual(verif.obs.tolist(), [20, 20, 70])
+        verif = Verification(
+            [sim], [self.serie], method='nearest',
+            tolerance=datetime.timedelta(minutes=15)
+        )
+        self.assertTrue(numpy.isnan(verif.obs[0]))
+        self.assertEqual(verif.obs[1], 20)
+        self.assertEqual(verif.scores()['n'].tolist(), [0, 1, 0])
+
+    def test_base_05(self):
+        """Ignored simulations."""
+        other = sitehydro.Sitehydro(code='B1234567')
+        sims = [
+            _simulation(other, 'M1', '00:00', ['01:00'], [1]),
+            simulation.Simulation(entite=self.site, grandeur='Q')
+        ]
+        verif = Verification(sims, [self.serie])
+        self.assertEqual(len(verif), 0)
+        self.assertEqual(len(verif.scores()), 0)
+        self.assertEqual(len(verif.pairs()), 0)
+
+    def test_error_01(self):
+        """Arguments errors."""
+        self.assertRaises(
+            ValueError,
+            Verification, self.simulations, [self.serie], method='cubic'
+        )
+        verif = Verification(self.simulations, [self.serie])
+        self.assertRaises(ValueError, verif.scores, by=['grandeur'])
+        self.simulations[0].dtprod = None
+        self.assertRaises(
+            ValueError, Verification, self.simulations, [self.serie]
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
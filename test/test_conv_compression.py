@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Test program for conv._compression.
+
+To run all tests just type:
+    './test_conv_compression.py' or 'python test_conv_compression.py'
+
+To run only a class test:
+    python -m unittest test_conv_compression.TestClass
+
+To run only a specific test:
+    python -m unittest test_conv_compression.TestClass
+    python -m unittest test_conv_compression.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+import io
+import gzip
+import bz2
+import zlib
+import tempfile
+import shutil
+
+import unittest
+
+from libhydro.conv import _compression
+from libhydro.conv import shom
+from libhydro.conv.xml import Message
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+HFS = os.path.join('data', 'shom', 'LOCMARIAQUER.hfs')
+XML = os.path.join('data', 'xml', '1.1', 'obsshydro.xml')
+
+
+#-- functions -----------------------------------------------------------------
+def _gzip(data):
+    """Return data gzip compressed."""
+    buf = io.BytesIO()
+    f = gzip.GzipFile(fileobj=buf, mode='wb')
+    f.write(data)
+    f.close()
+    return buf.getvalue()
+
+
+class _Unseekable(object):
+    """A file object without seek."""
+
+    def __init__(self, data):
+        self._f = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._f.read(size)
+
+
+#-- class TestCompression -----------------------------------------------------
+class TestCompression(unittest.TestCase):
+    """Compression functions tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.tmp_dir = tempfile.mkdtemp(prefix='test_conv_')
+        with io.open(XML, 'rb') as f:
+            self.data = f.read()
+
+    def tearDown(self):
+        """Hook method for deconstructing the test fixture after testing it."""
+        shutil.rmtree(self.tmp_dir)
+
+    def _read(self, src):
+        """Return the content of uncompressed(src)."""
+        with _compression.uncompressed(src) as stream:
+            if stream is src and isinstance(src, basestring):
+                with io.open(src, 'rb') as f:
+                    return f.read()
+            return stream.read()
+
+    def test_detect(self):
+        """Detect and stripext."""
+        self.assertEqual(_compression.detect(_gzip(b'abc')), 'gzip')
+        self.assertEqual(_compression.detect(bz2.compress(b'abc')), 'bz2')
+        self.assertEqual(
+            _compression.detect(b'\xfd7zXZ\x00\x00\x04'), 'xz'
+        )
+        self.assertIsNone(_compression.detect(self.data))
+        self.assertIsNone(_compression.detect(b''))
+        self.assertEqual(_compression.stripext('PORT.hfs.gz'), 'PORT.hfs')
+        self.assertEqual(_compression.stripext('a.xml.BZ2'), 'a.xml')
+        self.assertEqual(_compression.stripext('a.xml'), 'a.xml')
+
+    def test_base_01(self):
+        """File names."""
+        for ext, compress in (
+            ('gz', _gzip), ('bz2', bz2.compress), ('txt', lambda d: d)
+        ):
+            src = os.path.join(self.tmp_dir, 'file.%s' % ext)
+            with io.open(src, 'wb') as f:
+                f.write(compress(self.data))
+            self.assertEqual(self._read(src), self.data)
+        # unchanged sources
+        for src in (XML, 'http://localhost/file.xml', 'missing.xml'):
+            with _compression.uncompressed(src) as stream:
+                self.assertIs(stream, src)
+        # native formats
+        src = os.path.join(self.tmp_dir, 'file.gz')
+        with _compression.uncompressed(src, native=('gzip',)) as stream:
+            self.assertIs(stream, src)
+
+    def test_base_02(self):
+        """File objects."""
+        # small chunks to cross the boundaries
+        chunk, _compression.CHUNK = _compression.CHUNK, 7
+        try:
+            data = self.data
+            for src in (
+                io.BytesIO(_gzip(data)),
+                io.BytesIO(bz2.compress(data)),
+                # concatenated streams
+                io.BytesIO(_gzip(data[:100]) + _gzip(data[100:])),
+                io.BytesIO(
+                    bz2.compress(data[:100]) + bz2.compress(data[100:])
+                ),
+                _Unseekable(_gzip(data)),
+                _Unseekable(data)
+            ):
+                self.assertEqual(self._read(src), data)
+            # an uncompressed and seekable file object is left as is
+            src = io.BytesIO(data)
+            with _compression.uncompressed(src) as stream:
+                self.assertIs(stream, src)
+                self.assertEqual(stream.read(), data)
+        finally:
+            _compression.CHUNK = chunk
+
+    @unittest.skipIf(_compression._lzma is None, 'lzma is not available')
+    def test_base_03(self):
+        """Xz."""
+        src = io.BytesIO(_compression._lzma.compress(self.data))
+        self.assertEqual(self._read(src), self.data)
+
+    def test_error_01(self):
+        """Corrupted data."""
+        src = io.BytesIO(_gzip(self.data)[:20] + b'garbage' * 10)
+        with self.assertRaises(zlib.error):
+            self._read(src)
+
+
+#-- class TestReaders ---------------------------------------------------------
+class TestReaders(unittest.TestCase):
+    """Readers of compressed files tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.tmp_dir = tempfile.mkdtemp(prefix='test_conv_')
+
+    def tearDown(self):
+        """Hook method for deconstructing the test fixture after testing it."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_xml(self):
+        """Xml messages."""
+        expected = Message.from_file(XML)
+        with io.open(XML, 'rb') as f:
+            data = f.read()
+        dst = os.path.join(self.tmp_dir, 'msg.xml.gz')
+        with io.open(dst, 'wb') as f:
+            f.write(_gzip(data))
+        for src in (
+            dst, io.BytesIO(_gzip(data)), io.BytesIO(bz2.compress(data))
+        ):
+            msg = Message.from_file(src, validate=True)
+            self.assertEqual(len(msg.series), len(expected.series))
+            for serie, other in zip(msg.series, expected.series):
+                self.assertTrue(
+                    (serie.observations == other.observations).all().all()
+                )
+
+    def test_shom(self):
+        """HFS files."""
+        expected = shom.serie_from_hfs(HFS)
+        with io.open(HFS, 'rb') as f:
+            data = f.read()
+        for ext, compress in (('gz', _gzip), ('bz2', bz2.compress)):
+            src = os.path.join(self.tmp_dir, 'LOCMARIAQUER.hfs.%s' % ext)
+            with io.open(src, 'wb') as f:
+                f.write(compress(data))
+            serie = shom.serie_from_hfs(src)
+            self.assertEqual(serie.entite.libelle, 'LOCMARIAQUER')
+            self.assertTrue(
+                (serie.observations == expected.observations).all().all()
+            )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Test program for downsample.
+
+To run all tests just type:
+    './test_core_downsample.py' or 'python test_core_downsample.py'
+
+To run only a class test:
+    python -m unittest test_core_downsample.TestClass
+
+To run only a specific test:
+    python -m unittest test_core_downsample.TestClass
+    python -m unittest test_core_downsample.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import numpy
+
+from libhydro.core import downsample
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestFunctions -------------------------------------------------------
+class TestFunctions(unittest.TestCase):
+    """Functions tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        # a noisy sine with a peak, a trough and some NaN
+        size = 10000
+        self.x = numpy.datetime64('2013-01-01T00:00Z', 's') + \
+            numpy.arange(size) * 600
+        self.y = numpy.sin(numpy.arange(size) / 500) + \
+            numpy.random.RandomState(0).uniform(-0.1, 0.1, size)
+        self.y[1234] = 10
+        self.y[8765] = -10
+        self.y[[0, 5000, 5001]] = numpy.nan
+
+    def test_base_01(self):
+        """Methods."""
+        for method in downsample.METHODS:
+            positions = downsample.downsample(self.x, self.y, 100, method)
+            self.assertLessEqual(len(positions), 100)
+            self.assertGreater(len(positions), 90)
+            self.assertTrue((numpy.diff(positions) > 0).all())
+            self.assertEqual((positions[0], positions[-1]), (1, 9999))
+            self.assertIn(1234, positions)
+            self.assertIn(8765, positions)
+            self.assertFalse(numpy.isnan(self.y[positions]).any())
+
+    def test_base_02(self):
+        """Small curves."""
+        x = numpy.arange(5.)
+        for method in downsample.METHODS:
+            self.assertEqual(
+                downsample.downsample(x, x, 5, method).tolist(), range(5)
+            )
+        # lttb keeps the point of each bucket with the largest triangle
+        y = numpy.array([0, 5, 0, 0, 0, 0, -5, 0])
+        self.assertEqual(
+            downsample.lttb(numpy.arange(8.), y, 4).tolist(), [0, 1, 6, 7]
+        )
+        # minmax keeps the minimum and the maximum of each time bucket
+        self.assertEqual(
+            downsample.minmax(numpy.arange(8.), y, 4).tolist(), [0, 1, 6, 7]
+        )
+        y[[1, 6]] = [1, -1]
+        self.assertEqual(
+            downsample.minmax(numpy.arange(8.), y, 4).tolist(), [0, 1, 6, 7]
+        )
+
+    def test_base_03(self):
+        """Small numbers of points."""
+        x = numpy.arange(10.)
+        y = numpy.sin(x)
+        for method in downsample.METHODS:
+            for n_points in range(3, 12):
+                positions = downsample.downsample(x, y, n_points, method)
+                self.assertLessEqual(len(positions), n_points)
+                self.assertEqual((positions[0], positions[-1]), (0, 9))
+                self.assertTrue((numpy.diff(positions) > 0).all())
+        # minmax keeps the extreme farthest from the mean with 3 points
+        self.assertEqual(
+            downsample.minmax(x, y, 3).tolist(), [0, 5, 9]
+        )
+
+    def test_base_04(self):
+        """Pyramid."""
+        pyramid = downsample.Pyramid(self.x, self.y)
+        self.assertEqual(len(pyramid), 3)
+        self.assertEqual(len(pyramid.levels[0]), 9997)
+        for coarse, fine in zip(pyramid.levels[1:], pyramid.levels):
+            self.assertLessEqual(len(coarse), len(fine) // 4)
+            self.assertTrue(numpy.in1d(coarse, fine).all())
+        for level in pyramid.levels:
+            self.assertIn(1234, level)
+            self.assertIn(8765, level)
+        positions = pyramid.downsample(100)
+        self.assertLessEqual(len(positions), 100)
+        self.assertIn(1234, positions)
+        # a zoom is computed from the finest levels
+        begin, end = self.x[1000], self.x[1500]
+        positions = pyramid.downsample(100, 'minmax', begin, end)
+        self.assertEqual((positions[0], positions[-1]), (1000, 1500))
+        self.assertIn(1234, positions)
+
+    def test_error_01(self):
+        """Errors."""
+        self.assertRaises(
+            ValueError, downsample.downsample, self.x, self.y, 100, 'mean'
+        )
+        for method in downsample.METHODS:
+            self.assertRaises(
+                ValueError, downsample.downsample, self.x, self.y, 2, method
+            )
+        self.assertRaises(ValueError, downsample.Pyramid, self.x, self.y, 1)
+        self.assertRaises(
+            ValueError, downsample.Pyramid(self.x, self.y).downsample, 10,
+            'mean'
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -108,6 +108,24 @@ class TestIntervenant(unittest.TestCase):
         it.origine = 'SIRET'
         it.contacts = None
 
+    def test_trusted_01(self):
+        """Trusted constructor test."""
+        contacts = [
+            intervenant.Contact.from_trusted(code=1),
+            intervenant.Contact.from_trusted(code=2)
+        ]
+        it = intervenant.Intervenant.from_trusted(
+            code=12345678901234, origine='SIRET', mnemo='SCHAPI',
+            contacts=contacts
+        )
+        self.assertEqual(
+            (it.code, it.origine, it.nom, it.mnemo, it.contacts),
+            (12345678901234, 'SIRET', None, 'SCHAPI', contacts)
+        )
+        for ct in it.contacts:
+            self.assertEqual(ct.intervenant, it)
+        self.assertFalse(hasattr(it, '__dict__'))
+
     def test_str_01(self):
         """Test __str__ method with None values."""
         i = intervenant.Intervenant()
@@ -223,6 +241,17 @@ class TestContact(unittest.TestCase):
             (code, nom, prenom, civilite, i)
         )
 
+    def test_trusted_01(self):
+        """Trusted constructor test."""
+        c = intervenant.Contact.from_trusted(
+            code=99, nom='Toto', prenom='Robert', civilite=1
+        )
+        self.assertEqual(
+            (c.code, c.nom, c.prenom, c.civilite, c.intervenant),
+            (99, 'Toto', 'Robert', 1, None)
+        )
+        self.assertFalse(hasattr(c, '__dict__'))
+
     def test_str_01(self):
         """Test __str__ method with None values."""
         c = intervenant.Contact()
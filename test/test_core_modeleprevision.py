@@ -91,6 +91,17 @@ class TestModeleprevision(unittest.TestCase):
             (code, libelle, typemodele, description)
         )
 
+    def test_trusted_01(self):
+        """Trusted constructor test."""
+        m = modeleprevision.Modeleprevision.from_trusted(
+            code='SCnMERshom', libelle='SHOM', typemodele=3
+        )
+        self.assertEqual(
+            (m.code, m.libelle, m.typemodele, m.description),
+            ('SCnMERshom', 'SHOM', 3, None)
+        )
+        self.assertFalse(hasattr(m, '__dict__'))
+
     def test_str_01(self):
         """Test __str__ method with None values."""
         m = modeleprevision.Modeleprevision()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Test program for nomenclature.
+
+To run all tests just type:
+    './test_core_nomenclature.py' or 'python test_core_nomenclature.py'
+
+To run only a class test:
+    python -m unittest test_core_nomenclature.TestClass
+
+To run only a specific test:
+    python -m unittest test_core_nomenclature.TestClass
+    python -m unittest test_core_nomenclature.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import numpy
+
+from libhydro.core import nomenclature
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestValidator -------------------------------------------------------
+class TestValidator(unittest.TestCase):
+    """Validator decorator tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+
+        class Obj(object):
+            def __init__(self, strict=True):
+                self._strict = strict
+
+            @property
+            def statut(self):
+                return self._statut
+
+            @statut.setter
+            @nomenclature.validator(510, cast=int)
+            def statut(self, statut):
+                self._statut = statut
+
+            @property
+            def grandeur(self):
+                return self._grandeur
+
+            @grandeur.setter
+            @nomenclature.validator(509, required=False)
+            def grandeur(self, grandeur):
+                self._grandeur = grandeur
+
+            @property
+            def mesure(self):
+                return self._mesure
+
+            @mesure.setter
+            @nomenclature.validator(509, required='strict')
+            def mesure(self, mesure):
+                self._mesure = mesure
+
+        self.cls = Obj
+
+    def test_base_01(self):
+        """Cast and valid values."""
+        obj = self.cls()
+        obj.statut = '16'
+        obj.grandeur = b'Q'
+        self.assertEqual((obj.statut, obj.grandeur), (16, 'Q'))
+        self.assertTrue(isinstance(obj.grandeur, unicode))
+        obj.grandeur = None
+        self.assertIsNone(obj.grandeur)
+
+    def test_fuzzy_mode_01(self):
+        """Fuzzy mode test."""
+        obj = self.cls(strict=False)
+        obj.statut = 3
+        obj.grandeur = 'X'
+        self.assertEqual((obj.statut, obj.grandeur), (3, 'X'))
+        # a value required in strict mode only
+        obj.mesure = None
+        self.assertIsNone(obj.mesure)
+
+    def test_error_01(self):
+        """Errors test."""
+        obj = self.cls()
+        self.assertRaises(TypeError, obj.__setattr__, *('statut', None))
+        self.assertRaises(ValueError, obj.__setattr__, *('statut', 3))
+        self.assertRaises(ValueError, obj.__setattr__, *('statut', 'a'))
+        self.assertRaises(ValueError, obj.__setattr__, *('grandeur', 'X'))
+        try:
+            obj.statut = 5
+        except ValueError as e:
+            self.assertEqual(unicode(e), 'statut incorrect')
+        # fuzzy mode still requires a value
+        self.assertRaises(TypeError, obj.__setattr__, *('mesure', None))
+        obj = self.cls(strict=False)
+        self.assertRaises(TypeError, obj.__setattr__, *('statut', None))
+
+
+#-- class TestArrayValidators -------------------------------------------------
+class TestArrayValidators(unittest.TestCase):
+    """Isvalid and invalid functions tests."""
+
+    def test_base_01(self):
+        """Integer codes."""
+        self.assertEqual(
+            nomenclature.isvalid(507, [0, 4, 12, 3, -1, 300]).tolist(),
+            [True, True, True, False, False, False]
+        )
+        values = numpy.array([16, 0, 17, 20, -4, 4], dtype=numpy.int8)
+        self.assertEqual(
+            nomenclature.invalid(515, values).tolist(), [2, 4]
+        )
+        self.assertEqual(nomenclature.invalid(510, []).tolist(), [])
+
+    def test_base_02(self):
+        """Float codes."""
+        self.assertEqual(
+            nomenclature.invalid(
+                510, [0., 4.5, numpy.nan, 16., -8., 1e9]
+            ).tolist(),
+            [1, 2, 4, 5]
+        )
+
+    def test_base_03(self):
+        """String codes."""
+        self.assertEqual(
+            nomenclature.invalid(509, ['H', 'Q', 'X', 'h']).tolist(),
+            [2, 3]
+        )
+        self.assertEqual(
+            nomenclature.isvalid(530, ['REEL', 'FICTIF']).tolist(),
+            [True, True]
+        )
+
+    def test_base_04(self):
+        """Large arrays."""
+        values = numpy.tile(
+            numpy.array(sorted(nomenclature.NOMENCLATURE[515]), 'int8'),
+            100000
+        )
+        values[[10, 123456]] = 5
+        self.assertEqual(
+            nomenclature.invalid(515, values).tolist(), [10, 123456]
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
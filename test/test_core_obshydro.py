@@ -28,7 +28,7 @@ import unittest
 import datetime
 import numpy
 
-from libhydro.core import (sitehydro, obshydro)
+from libhydro.core import (sitehydro, obshydro, regularindex, _lazy)
 
 
 #-- strings -------------------------------------------------------------------
@@ -174,6 +174,33 @@ class TestObservations(unittest.TestCase):
             [True, False, True]
         )
 
+    def test_base_03(self):
+        """From arrays."""
+        obs = obshydro.Observations(
+            obshydro.Observation('2012-10-03 06:00', 33, mth=4, qal=0, cnt=True),
+            obshydro.Observation('2012-10-03 07:00', 37, cnt=False),
+            obshydro.Observation('2012-10-03 08:00', 42, mth=12, qal=20)
+        )
+        arrays = obshydro.Observations.from_arrays(
+            dte=['2012-10-03 06:00', '2012-10-03 07:00', '2012-10-03 08:00'],
+            res=['33', '37', '42'],
+            mth=[4, 0, 12],
+            qal=['0', '16', '20'],
+            cnt=[True, False, True]
+        )
+        self.assertTrue((arrays == obs).all().all())
+        self.assertTrue((arrays.dtypes == obs.dtypes).all())
+        self.assertTrue((arrays.index == obs.index).all())
+        # default values
+        arrays = obshydro.Observations.from_arrays(
+            dte=['2012-10-03 06:00'], res=[33]
+        )
+        self.assertEqual(
+            arrays.iloc[0].tolist() if hasattr(arrays, 'iloc')
+            else arrays.ix[0].tolist(),
+            [33, 0, 16, True]
+        )
+
     def test_error_01(self):
         """List of observation error."""
         # check that init works when call regurlaly...
@@ -229,6 +256,59 @@ class TestObservationsConcat(unittest.TestCase):
         )
 
 
+#-- class TestObservationsCheck -----------------------------------------------
+class TestObservationsCheck(unittest.TestCase):
+    """Observations.check function tests."""
+
+    def test_base_01(self):
+        """Check base test."""
+        obs = obshydro.Observations(
+            obshydro.Observation('2012-10-03 06:00', 33, mth=4, qal=0),
+            obshydro.Observation('2012-10-03 07:00', 37, mth=12, qal=20)
+        )
+        obshydro.Observations.check(obs)
+        # a DataFrame with only a res column
+        obshydro.Observations.check(obs[['res']])
+
+    def test_base_02(self):
+        """Checked observations are marked."""
+        # built from checked Observation
+        obs = obshydro.Observations(
+            obshydro.Observation('2012-10-03 06:00', 33, mth=4, qal=0)
+        )
+        self.assertTrue(obs._checked)
+        # built without control, then checked
+        obs = obshydro.Observations.from_arrays(
+            dte=['2012-10-03 06:00', '2012-10-03 07:00'], res=[33, 37]
+        )
+        self.assertFalse(hasattr(obs, '_checked'))
+        obshydro.Serie(
+            entite=sitehydro.Sitehydro(code='A0445810'), grandeur='Q',
+            observations=obs
+        )
+        self.assertTrue(obs._checked)
+
+    def test_error_01(self):
+        """Check error test."""
+        obs = obshydro.Observations.from_arrays(
+            dte=['2012-10-03 06:00', '2012-10-03 07:00', '2012-10-03 08:00'],
+            res=[33, 37, 42], qal=[16, 3, 16]
+        )
+        try:
+            obshydro.Observations.check(obs)
+            self.fail('ValueError not raised')
+        except ValueError as e:
+            self.assertTrue(unicode(e).find('qal incorrect in 1 rows') > -1)
+        # the Serie setter does the check in strict mode only
+        self.assertRaises(
+            ValueError,
+            obshydro.Serie,
+            **{'entite': sitehydro.Sitehydro(code='A0445810'),
+               'grandeur': 'Q', 'observations': obs}
+        )
+        obshydro.Serie(observations=obs, strict=False)
+
+
 #-- class TestSerie -----------------------------------------------------------
 class TestSerie(unittest.TestCase):
     """Serie class tests."""
@@ -280,6 +360,166 @@ class TestSerie(unittest.TestCase):
             (s, g, 0, o, True)
         )
 
+    def test_trusted_01(self):
+        """Serie from trusted values."""
+        s = sitehydro.Stationhydro(code='A044581001')
+        o = obshydro.Observations(
+            obshydro.Observation('2012-10-03 06:00', 33)
+        )
+        serie = obshydro.Serie.from_trusted(
+            entite=s, grandeur='Q', statut=4, observations=o
+        )
+        self.assertEqual(
+            (serie.entite, serie.grandeur, serie.statut, serie.observations),
+            (s, 'Q', 4, o)
+        )
+        self.assertTrue(serie._strict)
+        # no checks at all
+        serie = obshydro.Serie.from_trusted(entite=s, grandeur='X')
+        self.assertEqual(serie.grandeur, 'X')
+        self.assertEqual(serie.statut, 0)
+        self.assertIsNone(serie.observations)
+
+    def test_lazy_01(self):
+        """Serie with lazy observations."""
+        s = sitehydro.Stationhydro(code='A044581001')
+        o = obshydro.Observations(
+            obshydro.Observation('2012-10-03 06:00', 33),
+            obshydro.Observation('2012-10-03 08:00', 42)
+        )
+        calls = []
+
+        def decode():
+            calls.append(1)
+            return o
+
+        serie = obshydro.Serie(
+            entite=s, grandeur='Q', observations=_lazy.Lazy(decode)
+        )
+        self.assertEqual(calls, [])
+        self.assertIs(serie.observations, o)
+        self.assertIs(serie.observations, o)
+        self.assertEqual(calls, [1])
+
+    def test_regular_01(self):
+        """Regular serie."""
+        s = sitehydro.Stationhydro(code='A044581001')
+        regular = regularindex.RegularIndex(
+            '2012-10-03T06:00+00', datetime.timedelta(minutes=10), 6, [2, 3]
+        )
+        serie = obshydro.Serie.from_regular(
+            s, 'H', regular, numpy.arange(4.), qal=12
+        )
+        self.assertIs(serie.regular, regular)
+        self.assertEqual(serie.position('2012-10-03T06:50+00'), 3)
+        # a window is regular and not computed
+        window = serie.window('2012-10-03T06:05+00', '2012-10-03T06:40+00')
+        self.assertIsInstance(window._observations, _lazy.Lazy)
+        self.assertEqual(len(window.regular), 2)
+        self.assertIsInstance(serie._observations, _lazy.Lazy)
+        # computed observations
+        self.assertEqual(serie.observations['res'].tolist(), [0, 1, 2, 3])
+        self.assertEqual(serie.observations['qal'].tolist(), [12] * 4)
+        self.assertTrue(
+            (serie.observations.index.values == regular.values).all()
+        )
+        self.assertIs(serie.regular, regular)
+        self.assertEqual(
+            window.observations['res'].tolist(),
+            serie.window(
+                '2012-10-03T06:05+00', '2012-10-03T06:40+00'
+            ).observations['res'].tolist()
+        )
+        self.assertRaises(
+            ValueError,
+            obshydro.Serie.from_regular, s, 'H', regular, [1, 2]
+        )
+
+    def test_regular_02(self):
+        """Regular detection."""
+        s = sitehydro.Stationhydro(code='A044581001')
+        serie = obshydro.Serie(
+            entite=s, grandeur='H', observations=obshydro.Observations(
+                obshydro.Observation('2012-10-03 06:00', 33),
+                obshydro.Observation('2012-10-03 07:00', 42),
+                obshydro.Observation('2012-10-03 08:00', 45)
+            )
+        )
+        self.assertEqual(len(serie.regular), 3)
+        self.assertEqual(serie.regular.step, numpy.timedelta64(1, 'h'))
+        self.assertEqual(
+            serie.window(end='2012-10-03 07:00').observations['res'].tolist(),
+            [33, 42]
+        )
+        # the regular index is computed again for new observations
+        serie.observations = obshydro.Observations(
+            obshydro.Observation('2012-10-03 06:00', 33),
+            obshydro.Observation('2012-10-03 06:07', 42),
+            obshydro.Observation('2012-10-03 06:09', 42)
+        )
+        self.assertIsNone(serie.regular)
+        self.assertEqual(serie.position('2012-10-03 06:07'), 1)
+        self.assertRaises(KeyError, serie.position, '2012-10-03 06:08')
+        self.assertEqual(
+            len(serie.window(begin='2012-10-03 06:01').observations), 2
+        )
+
+    def test_downsample_01(self):
+        """Downsample."""
+        s = sitehydro.Stationhydro(code='A044581001')
+        res = numpy.sin(numpy.arange(1000) / 50)
+        res[600] = 10
+        serie = obshydro.Serie(
+            entite=s, grandeur='H', statut=4,
+            observations=obshydro.Observations.from_arrays(
+                numpy.datetime64('2012-10-03T00:00+00', 's') +
+                numpy.arange(1000) * 60, res, qal=12
+            )
+        )
+        for method in ('lttb', 'minmax'):
+            small = serie.downsample(50, method)
+            self.assertLessEqual(len(small.observations), 50)
+            self.assertEqual(small.statut, 4)
+            self.assertEqual(small.observations['qal'].tolist()[0], 12)
+            self.assertIn(10, small.observations['res'].tolist())
+            self.assertEqual(
+                small.observations.index[-1],
+                serie.observations.index[-1]
+            )
+        # a period
+        small = serie.downsample(
+            50, begin='2012-10-03T10:00+00', end='2012-10-03T11:00+00'
+        )
+        self.assertEqual(len(small.observations), 50)
+        self.assertEqual(
+            small.observations.index[0], datetime.datetime(2012, 10, 3, 10)
+        )
+        self.assertEqual(
+            small.observations.index[-1], datetime.datetime(2012, 10, 3, 11)
+        )
+        self.assertIn(10, small.observations['res'].tolist())
+        # the pyramid is kept with the observations
+        small = serie.downsample(50, pyramid=True)
+        self.assertIn(10, small.observations['res'].tolist())
+        pyramid = serie._pyramid
+        serie.downsample(50, 'minmax', pyramid=True)
+        self.assertIs(serie._pyramid, pyramid)
+        serie.observations = serie.observations.copy()
+        serie.downsample(50, pyramid=True)
+        self.assertIsNot(serie._pyramid, pyramid)
+        self.assertRaises(
+            ValueError, obshydro.Serie(strict=False).downsample, 50
+        )
+
+    def test_lazy_error_01(self):
+        """Lazy observations are checked on first access."""
+        s = sitehydro.Stationhydro(code='A044581001')
+        serie = obshydro.Serie(
+            entite=s, grandeur='Q', observations=_lazy.Lazy(lambda: 12)
+        )
+        with self.assertRaises(TypeError):
+            serie.observations
+
     def test_str_01(self):
         """Test __str__ method with minimum values."""
         # None values
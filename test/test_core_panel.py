@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Test program for panel.
+
+To run all tests just type:
+    './test_core_panel.py' or 'python test_core_panel.py'
+
+To run only a class test:
+    python -m unittest test_core_panel.TestClass
+
+To run only a specific test:
+    python -m unittest test_core_panel.TestClass
+    python -m unittest test_core_panel.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import numpy
+
+from libhydro.core import (sitehydro, obshydro)
+from libhydro.core.panel import SeriesPanel
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestSeriesPanel -----------------------------------------------------
+class TestSeriesPanel(unittest.TestCase):
+    """SeriesPanel class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.s1 = obshydro.Serie(
+            entite=sitehydro.Stationhydro(code='A123456701'),
+            grandeur='H',
+            observations=obshydro.Observations(
+                obshydro.Observation('2012-10-03 07:00', 37, qal=12),
+                obshydro.Observation('2012-10-03 06:00', 33),
+                obshydro.Observation('2012-10-03 08:00', 42, cnt=False)
+            )
+        )
+        self.s2 = obshydro.Serie(
+            entite=sitehydro.Sitehydro(code='B1234567'),
+            grandeur='Q',
+            observations=obshydro.Observations(
+                obshydro.Observation('2012-10-03 06:30', 10, mth=4),
+                obshydro.Observation('2012-10-03 07:00', 11)
+            )
+        )
+
+    def test_base_01(self):
+        """Aligned series."""
+        panel = SeriesPanel([self.s1, self.s2])
+        self.assertEqual(panel.keys, ['A123456701', 'B1234567'])
+        self.assertEqual(len(panel), 4)
+        self.assertEqual(
+            panel.index.tolist(),
+            [
+                numpy.datetime64('2012-10-03 %s' % h, 'ns').tolist()
+                for h in ('06:00', '06:30', '07:00', '08:00')
+            ]
+        )
+        self.assertEqual(panel.res.shape, (4, 2))
+        self.assertEqual(panel.res[:, 0][[0, 2, 3]].tolist(), [33, 37, 42])
+        self.assertTrue(numpy.isnan(panel.res[1, 0]))
+        self.assertEqual(panel.res[1:3, 1].tolist(), [10, 11])
+        self.assertEqual(panel.mth[:, 1].tolist(), [-1, 4, 0, -1])
+        self.assertEqual(panel.qal[:, 0].tolist(), [16, -1, 12, 16])
+        self.assertEqual(
+            panel.cnt[:, 0].tolist(), [True, False, True, False]
+        )
+        self.assertEqual(
+            panel['B1234567'].dropna().tolist(), [10, 11]
+        )
+        df = panel.dataframe('qal')
+        self.assertEqual(df.columns.tolist(), panel.keys)
+        self.assertEqual(df['A123456701'].tolist(), [16, -1, 12, 16])
+        self.assertTrue(unicode(panel).startswith('SeriesPanel de 2'))
+
+    def test_base_02(self):
+        """Windows."""
+        panel = SeriesPanel([self.s1, self.s2], keys=['h', 'q'])
+        window = panel.window('2012-10-03 06:30', '2012-10-03 07:00')
+        self.assertEqual(len(window), 2)
+        self.assertEqual(window.res[:, 1].tolist(), [10, 11])
+        # windows share the panel arrays
+        window.res[0, 1] = 99
+        self.assertEqual(panel.res[1, 1], 99)
+        self.assertEqual(
+            len(panel.window(begin=datetime.datetime(2012, 10, 3, 7))), 2
+        )
+        self.assertEqual(len(panel.window(end='2012-10-03 06:59')), 2)
+        self.assertEqual(len(panel.window('2013-01-01')), 0)
+        self.assertEqual(len(SeriesPanel([])), 0)
+
+    def test_error_01(self):
+        """Errors."""
+        self.assertRaises(TypeError, SeriesPanel, ['serie'])
+        self.assertRaises(ValueError, SeriesPanel, [self.s1, self.s1])
+        self.assertRaises(
+            ValueError, SeriesPanel, [self.s1, self.s2], keys=['h']
+        )
+        self.assertRaises(
+            ValueError,
+            SeriesPanel, [obshydro.Serie(grandeur='H', strict=False)]
+        )
+        panel = SeriesPanel([self.s1])
+        self.assertRaises(KeyError, panel.__getitem__, 'X')
+        self.assertRaises(ValueError, panel.dataframe, 'dte')
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
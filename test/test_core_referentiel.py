@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Test program for referentiel.
+
+To run all tests just type:
+    './test_core_referentiel.py' or 'python test_core_referentiel.py'
+
+To run only a class test:
+    python -m unittest test_core_referentiel.TestClass
+
+To run only a specific test:
+    python -m unittest test_core_referentiel.TestClass
+    python -m unittest test_core_referentiel.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+
+from libhydro.core import (referentiel, sitehydro, obshydro)
+from libhydro.conv.xml import Message
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestReferentiel -----------------------------------------------------
+class TestReferentiel(unittest.TestCase):
+    """Referentiel class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.sites = [
+            sitehydro.Sitehydro(
+                code='A%07i' % i,
+                stations=[
+                    sitehydro.Stationhydro(
+                        code='A%07i%02i' % (i, j),
+                        capteurs=[
+                            sitehydro.Capteur(code='A%07i%02i%02i' % (i, j, k))
+                            for k in (1, 2)
+                        ]
+                    )
+                    for j in (1, 2)
+                ]
+            )
+            for i in (1000, 1001, 2000)
+        ]
+        self.ref = referentiel.Referentiel(self.sites)
+
+    def test_base_01(self):
+        """Empty referentiel."""
+        ref = referentiel.Referentiel()
+        self.assertEqual((ref.siteshydro, len(ref)), ([], 0))
+        self.assertIsNone(ref.get('A0001000'))
+        self.assertEqual(ref.find('A'), [])
+        ref = referentiel.Referentiel(self.sites[0])
+        self.assertEqual(len(ref), 7)
+
+    def test_base_02(self):
+        """Lookups test."""
+        ref = self.ref
+        self.assertEqual(len(ref), 21)
+        site, station = self.sites[1], self.sites[1].stations[1]
+        capteur = station.capteurs[0]
+        self.assertIs(ref['A0001001'], site)
+        self.assertIs(ref['A000100102'], station)
+        self.assertIs(ref.get('A00010010201'), capteur)
+        self.assertIs(ref.get('A000100102', sitehydro.Stationhydro), station)
+        self.assertIsNone(ref.get('A000100102', sitehydro.Capteur))
+        self.assertTrue('A00010010201' in ref)
+        self.assertFalse('A0009999' in ref)
+        self.assertRaises(KeyError, ref.__getitem__, *('A0009999',))
+
+    def test_base_03(self):
+        """Parents test."""
+        ref = self.ref
+        site, station = self.sites[2], self.sites[2].stations[0]
+        capteur = station.capteurs[1]
+        self.assertIs(ref.parent('A000200001'), site)
+        self.assertIs(ref.parent(capteur), station)
+        self.assertIsNone(ref.parent(site))
+        self.assertIsNone(ref.parent('A0009999'))
+        self.assertIs(ref.sitehydro('A00020000102'), site)
+        self.assertIs(ref.sitehydro(station), site)
+        self.assertIs(ref.sitehydro(site), site)
+        self.assertIsNone(ref.sitehydro('A00099990102'))
+
+    def test_base_04(self):
+        """Prefix queries test."""
+        ref = self.ref
+        self.assertEqual(len(ref.find('A')), 21)
+        self.assertEqual(len(ref.find('A0001')), 14)
+        self.assertEqual(
+            [s.code for s in ref.find('A0001', sitehydro.Stationhydro)],
+            ['A000100001', 'A000100002', 'A000100101', 'A000100102']
+        )
+        self.assertEqual(
+            [e.code for e in ref.find('A000200002')],
+            ['A000200002', 'A00020000201', 'A00020000202']
+        )
+        self.assertEqual(ref.find('B'), [])
+
+    def test_base_05(self):
+        """Add and remove test."""
+        ref = self.ref
+        ref.find('A')
+        new = sitehydro.Sitehydro(
+            code='A0001000',
+            stations=sitehydro.Stationhydro(code='A000100009')
+        )
+        ref.add(new)
+        self.assertEqual(len(ref.siteshydro), 3)
+        self.assertIs(ref['A0001000'], new)
+        self.assertIsNone(ref.get('A000100001'))
+        self.assertIs(ref.parent('A000100009'), new)
+        self.assertEqual(len(ref.find('A0001000')), 2)
+        ref.remove('A0001000')
+        self.assertEqual(len(ref), 14)
+        self.assertEqual(ref.find('A0001000'), [])
+
+    def test_base_06(self):
+        """Join test."""
+        ref = self.ref
+        serie = obshydro.Serie(
+            entite=sitehydro.Stationhydro(code='A000100101'),
+            grandeur='H', strict=False
+        )
+        self.assertIs(ref.join(serie), self.sites[1].stations[0])
+        serie.entite = sitehydro.Capteur(code='A00010010101')
+        self.assertIs(ref.join(serie), self.sites[1].stations[0].capteurs[0])
+        serie.entite = sitehydro.Capteur(code='A00010010109')
+        self.assertIsNone(ref.join(serie))
+        serie.entite = None
+        self.assertIsNone(ref.join(serie))
+
+    def test_base_07(self):
+        """Referentiel from a Message."""
+        msg = Message.from_file(
+            os.path.join('data', 'xml', '1.1', 'siteshydro.xml')
+        )
+        ref = referentiel.Referentiel(msg.siteshydro)
+        self.assertEqual(len(ref.siteshydro), len(msg.siteshydro))
+        self.assertEqual(ref.parent('O171251001').code, 'O1712510')
+        self.assertEqual(ref.sitehydro('O17125100102').code, 'O1712510')
+
+    def test_str_01(self):
+        """Test __str__ method."""
+        self.assertTrue(self.ref.__str__().rfind('3 sites') > -1)
+
+    def test_error_01(self):
+        """Sitehydro error."""
+        self.assertRaises(
+            TypeError,
+            referentiel.Referentiel,
+            *([sitehydro.Stationhydro(code='A000100101')],)
+        )
+        self.assertRaises(KeyError, self.ref.remove, *('A0009999',))
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
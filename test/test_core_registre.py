@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Test program for registre.
+
+To run all tests just type:
+    './test_core_registre.py' or 'python test_core_registre.py'
+
+To run only a class test:
+    python -m unittest test_core_registre.TestClass
+
+To run only a specific test:
+    python -m unittest test_core_registre.TestClass
+    python -m unittest test_core_registre.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+
+from libhydro.core import (registre, sitehydro, modeleprevision)
+from libhydro.conv.xml import (_from_xml as from_xml)
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- class TestRegistre --------------------------------------------------------
+class TestRegistre(unittest.TestCase):
+    """Registre class tests."""
+
+    def test_base_01(self):
+        """Empty registre."""
+        r = registre.Registre()
+        self.assertEqual(
+            (len(r), r.maxsize, r.hits, r.misses),
+            (0, registre.MAXSIZE, 0, 0)
+        )
+
+    def test_base_02(self):
+        """Get test."""
+        r = registre.Registre()
+        s1 = r.get(sitehydro.Sitehydro, 'A1234567')
+        s2 = r.get(sitehydro.Sitehydro, 'A1234567')
+        self.assertIs(s1, s2)
+        self.assertEqual(s1.code, 'A1234567')
+        # same code, other type
+        m = r.get(modeleprevision.Modeleprevision, 'A1234567')
+        self.assertIsInstance(m, modeleprevision.Modeleprevision)
+        self.assertEqual((len(r), r.hits, r.misses), (2, 1, 2))
+        self.assertTrue((sitehydro.Sitehydro, 'A1234567') in r)
+        self.assertFalse((sitehydro.Stationhydro, 'A1234567') in r)
+        # constructor args
+        s = r.get(sitehydro.Sitehydro, 'B1234567', typesite='SOURCE')
+        self.assertEqual(s.typesite, 'SOURCE')
+        r.clear()
+        self.assertEqual((len(r), r.hits, r.misses), (0, 0, 0))
+
+    def test_base_03(self):
+        """Add test."""
+        capteur = sitehydro.Capteur(code='A12345670101')
+        station = sitehydro.Stationhydro(code='A123456701', capteurs=capteur)
+        site = sitehydro.Sitehydro(code='A1234567', stations=station)
+        r = registre.Registre()
+        r.add(site)
+        self.assertEqual(len(r), 3)
+        self.assertIs(r.get(sitehydro.Sitehydro, 'A1234567'), site)
+        self.assertIs(r.get(sitehydro.Stationhydro, 'A123456701'), station)
+        self.assertIs(r.get(sitehydro.Capteur, 'A12345670101'), capteur)
+        # replace
+        other = sitehydro.Sitehydro(code='A1234567')
+        r.add(other)
+        self.assertIs(r.get(sitehydro.Sitehydro, 'A1234567'), other)
+
+    def test_lru_01(self):
+        """LRU eviction test."""
+        r = registre.Registre(maxsize=2)
+        s1 = r.get(sitehydro.Sitehydro, 'A0000001')
+        r.get(sitehydro.Sitehydro, 'A0000002')
+        # s1 is now the most recently used
+        self.assertIs(r.get(sitehydro.Sitehydro, 'A0000001'), s1)
+        r.get(sitehydro.Sitehydro, 'A0000003')
+        self.assertEqual(len(r), 2)
+        self.assertTrue((sitehydro.Sitehydro, 'A0000001') in r)
+        self.assertFalse((sitehydro.Sitehydro, 'A0000002') in r)
+        # shrink the cache
+        r.maxsize = 1
+        self.assertEqual(len(r), 1)
+        self.assertTrue((sitehydro.Sitehydro, 'A0000003') in r)
+        # no limit
+        r.maxsize = None
+        for i in range(10):
+            r.get(sitehydro.Sitehydro, 'A000001%i' % i)
+        self.assertEqual(len(r), 11)
+
+    def test_str_01(self):
+        """Test __str__ method."""
+        r = registre.Registre(maxsize=None)
+        self.assertTrue(r.__str__().rfind('Registre') > -1)
+
+    def test_error_01(self):
+        """Maxsize error."""
+        self.assertRaises(ValueError, registre.Registre, *(0,))
+        self.assertRaises(ValueError, registre.Registre, *('a',))
+
+    def test_error_02(self):
+        """Entity error."""
+        r = registre.Registre()
+        self.assertRaises(ValueError, r.get, *(sitehydro.Sitehydro, 'A12'))
+        self.assertEqual(len(r), 0)
+
+
+#-- class TestRegistreFromXml -------------------------------------------------
+class TestRegistreFromXml(unittest.TestCase):
+    """Registre with xml._from_xml tests."""
+
+    def test_base_01(self):
+        """Shared entities test."""
+        r = registre.Registre()
+        src = os.path.join('data', 'xml', '1.1', 'simulations.xml')
+        data1 = from_xml._parse(src, registre=r)
+        data2 = from_xml._parse(src, registre=r)
+        sim = data1['simulations']
+        self.assertIs(sim[0].entite, sim[2].entite)
+        self.assertIsNot(sim[0].entite, sim[1].entite)
+        for i in range(3):
+            self.assertIs(
+                data1['simulations'][i].entite, data2['simulations'][i].entite
+            )
+            self.assertIs(
+                data1['simulations'][i].modeleprevision,
+                data2['simulations'][i].modeleprevision
+            )
+        # without registre
+        data3 = from_xml._parse(src)
+        self.assertIsNot(sim[0].entite, data3['simulations'][0].entite)
+
+    def test_base_02(self):
+        """Referential entities test."""
+        r = registre.Registre()
+        from_xml._parse(
+            os.path.join('data', 'xml', '1.1', 'siteshydro.xml'), registre=r
+        )
+        site = r.get(sitehydro.Sitehydro, 'O1984310')
+        self.assertEqual(len(site.stations), 3)
+        self.assertIs(
+            r.get(sitehydro.Stationhydro, 'O198431001'), site.stations[0]
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
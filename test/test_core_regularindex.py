@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Test program for regularindex.
+
+To run all tests just type:
+    './test_core_regularindex.py' or 'python test_core_regularindex.py'
+
+To run only a class test:
+    python -m unittest test_core_regularindex.TestClass
+
+To run only a specific test:
+    python -m unittest test_core_regularindex.TestClass
+    python -m unittest test_core_regularindex.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import datetime
+import numpy
+
+from libhydro.core.regularindex import RegularIndex
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- functions -----------------------------------------------------------------
+def _dates(*minutes):
+    """Return the datetime64[ns] array of 2013-01-01 00:00 + minutes."""
+    return (
+        numpy.datetime64('2013-01-01T00:00+00', 'ns') +
+        numpy.array(minutes, dtype='timedelta64[m]')
+    ).astype('datetime64[ns]')
+
+
+#-- class TestRegularIndex ----------------------------------------------------
+class TestRegularIndex(unittest.TestCase):
+    """RegularIndex class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.dates = _dates(0, 10, 30, 40, 70)
+        self.index = RegularIndex.from_dates(self.dates, max_missing=0.5)
+
+    def test_base_01(self):
+        """Detection."""
+        index = self.index
+        self.assertEqual(index.start, self.dates[0])
+        self.assertEqual(index.step, numpy.timedelta64(10, 'm'))
+        self.assertEqual((index.count, len(index)), (8, 5))
+        self.assertEqual(index.missing.tolist(), [2, 5, 6])
+        self.assertTrue((index.values == self.dates).all())
+        self.assertTrue((index.to_index().values == self.dates).all())
+        # irregular dates
+        self.assertIsNone(RegularIndex.from_dates(self.dates))
+        self.assertIsNone(RegularIndex.from_dates(_dates(0, 10, 25)))
+        self.assertIsNone(RegularIndex.from_dates(_dates(10, 0)))
+        self.assertIsNone(RegularIndex.from_dates(_dates(0)))
+
+    def test_base_02(self):
+        """Lookups."""
+        index = self.index
+        for i, dte in enumerate(self.dates):
+            self.assertEqual(index.position(dte), i)
+            self.assertEqual(index.date(i), dte)
+        self.assertEqual(index.date(-1), self.dates[-1])
+        for minutes in (-5, 0, 5, 20, 30, 35, 65, 70, 80):
+            dte = _dates(minutes)[0]
+            for side in ('left', 'right'):
+                self.assertEqual(
+                    index.searchsorted(dte, side),
+                    self.dates.searchsorted(dte, side)
+                )
+
+    def test_base_03(self):
+        """Slices."""
+        for start in range(6):
+            for stop in range(start, 6):
+                self.assertTrue(
+                    (
+                        self.index[start:stop].values ==
+                        self.dates[start:stop]
+                    ).all()
+                )
+        self.assertEqual(self.index[1:4].missing.tolist(), [1])
+        self.assertEqual(len(self.index[3:1]), 0)
+
+    def test_base_04(self):
+        """Constructor."""
+        index = RegularIndex(
+            '2013-01-01T00:00+00', datetime.timedelta(minutes=10), 3
+        )
+        self.assertTrue((index.values == _dates(0, 10, 20)).all())
+        self.assertEqual(
+            str(index),
+            'RegularIndex de 3 dates du 2013-01-01 00:00:00 au 2013-01-01 '
+            '00:20:00 au pas de 0:10:00, 0 lacunes'
+        )
+
+    def test_error_01(self):
+        """Errors."""
+        self.assertRaises(KeyError, self.index.position, _dates(20)[0])
+        self.assertRaises(KeyError, self.index.position, _dates(15)[0])
+        self.assertRaises(KeyError, self.index.position, _dates(80)[0])
+        self.assertRaises(IndexError, self.index.date, 5)
+        self.assertRaises(TypeError, self.index.__getitem__, 1)
+        self.assertRaises(
+            ValueError, RegularIndex, self.dates[0], numpy.timedelta64(0), 3
+        )
+        self.assertRaises(
+            ValueError,
+            RegularIndex, self.dates[0], numpy.timedelta64(1, 'm'), 3, [2]
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
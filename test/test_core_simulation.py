@@ -26,6 +26,8 @@ sys.path.append(os.path.join('..', '..'))
 
 import unittest
 import datetime
+import numpy
+import pandas
 
 from libhydro.core import (simulation, modeleprevision, sitehydro)
 
@@ -167,6 +169,64 @@ class TestPrevisions(unittest.TestCase):
             [50, 50, 50]
         )
 
+    def test_base_03(self):
+        """From arrays."""
+        d = [
+            datetime.datetime(2012, 5, 18, 18, 0),
+            datetime.datetime(2012, 5, 18, 18, 0),
+            datetime.datetime(2012, 5, 18, 18, 5)
+        ]
+        r = [33.5, 35, 40]
+        p = simulation.Previsions(
+            simulation.Prevision(d[0], r[0], 50),
+            simulation.Prevision(d[1], r[1], 95),
+            simulation.Prevision(d[2], r[2], 50)
+        )
+        arrays = simulation.Previsions.from_arrays(
+            dte=[
+                '2012-05-18T18:00', '2012-05-18T18:00', '2012-05-18T18:05'
+            ],
+            res=['33.5', '35', '40'],
+            prb=[50, '95', 50]
+        )
+        self.assertEqual(arrays.tolist(), p.tolist())
+        self.assertEqual(arrays.index.tolist(), p.index.tolist())
+        self.assertEqual(arrays.dtype, p.dtype)
+        # default probability
+        arrays = simulation.Previsions.from_arrays(dte=d[2:], res=r[2:])
+        self.assertEqual(arrays.index.tolist(), [(d[2], 50)])
+
+    def test_base_04(self):
+        """Index of unsorted previsions."""
+        d = [
+            datetime.datetime(2012, 5, 18, 18, 10),
+            datetime.datetime(2012, 5, 18, 18, 0),
+            datetime.datetime(2012, 5, 18, 18, 10),
+            datetime.datetime(2012, 5, 18, 18, 5),
+            datetime.datetime(2012, 5, 18, 18, 0)
+        ]
+        r = [1, 2, 3, 4, 5]
+        p = [95, 50, 5, 50, 95]
+        prvs = simulation.Previsions.from_arrays(dte=d, res=r, prb=p)
+        # the rows keep their order, the levels are sorted
+        self.assertEqual(prvs.index.tolist(), zip(d, p))
+        self.assertEqual(prvs.index.names, ['dte', 'prb'])
+        self.assertEqual(
+            prvs.index.levels[0].tolist(), sorted(set(d))
+        )
+        self.assertEqual(prvs.index.levels[1].tolist(), [5, 50, 95])
+        self.assertEqual(prvs.tolist(), r)
+        # the same index as from the tuples
+        index = pandas.MultiIndex.from_tuples(zip(d, p), names=['dte', 'prb'])
+        self.assertTrue(prvs.index.equals(index))
+        for level, other in zip(prvs.index.levels, index.levels):
+            self.assertTrue(level.equals(other))
+        for labels, other in zip(prvs.index.labels, index.labels):
+            self.assertEqual(list(labels), list(other))
+        # selections
+        self.assertEqual(prvs.unstack()[95].dropna().tolist(), [5, 1])
+        self.assertEqual(prvs[d[0]].to_dict(), {95: 1, 5: 3})
+
     def test_error_01(self):
         """Prevision error."""
         prv = simulation.Prevision(
@@ -181,6 +241,79 @@ class TestPrevisions(unittest.TestCase):
         )
 
 
+#-- class TestEnsemble --------------------------------------------------------
+class TestEnsemble(unittest.TestCase):
+    """Ensemble class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        # 2 dates, the second one without the 90% prevision
+        self.previsions = simulation.Previsions.from_arrays(
+            dte=['2012-10-10T10:00+00'] * 3 + ['2012-10-10T11:00+00'] * 2,
+            res=[10, 20, 40, 15, 5],
+            prb=[10, 50, 90, 50, 10]
+        )
+
+    def test_base_01(self):
+        """Pivot."""
+        ensemble = simulation.Ensemble(self.previsions)
+        self.assertEqual(
+            ensemble.dte.astype('datetime64[s]').tolist(),
+            [
+                datetime.datetime(2012, 10, 10, 10),
+                datetime.datetime(2012, 10, 10, 11)
+            ]
+        )
+        self.assertEqual(ensemble.prb.tolist(), [10, 50, 90])
+        self.assertEqual(ensemble.res[0].tolist(), [10, 20, 40])
+        self.assertEqual(ensemble.res[1, :2].tolist(), [5, 15])
+        self.assertTrue(numpy.isnan(ensemble.res[1, 2]))
+        self.assertEqual(
+            str(ensemble), 'Ensemble de 2 dates x 3 probabilites '
+            '(10%, 50%, 90%)'
+        )
+
+    def test_quantile_01(self):
+        """Quantiles."""
+        ensemble = simulation.Ensemble(self.previsions)
+        self.assertEqual(ensemble.quantile(50).tolist(), [20, 15])
+        self.assertEqual(ensemble.quantile(70).values[0], 30)
+        self.assertTrue(numpy.isnan(ensemble.quantile(70).values[1]))
+        self.assertEqual(ensemble.quantile(30).tolist(), [15, 10])
+        self.assertTrue(ensemble.quantile(5).isnull().all())
+        quantiles = ensemble.quantile([10, 50])
+        self.assertEqual(quantiles.columns.tolist(), [10, 50])
+        self.assertEqual(quantiles[10].tolist(), [10, 5])
+        self.assertRaises(ValueError, ensemble.quantile, 101)
+
+    def test_prob_exceed_01(self):
+        """Exceedance probabilities."""
+        ensemble = simulation.Ensemble(self.previsions)
+        self.assertEqual(ensemble.prob_exceed(10).tolist(), [90, 70])
+        self.assertEqual(ensemble.prob_exceed(30).tolist(), [30, 0])
+        self.assertEqual(ensemble.prob_exceed(1).tolist(), [100, 100])
+        self.assertEqual(ensemble.prob_exceed(50).tolist(), [0, 0])
+        # ties
+        ensemble = simulation.Ensemble(
+            simulation.Previsions.from_arrays(
+                dte=['2012-10-10T10:00+00'] * 3, res=[10, 10, 20],
+                prb=[10, 50, 90]
+            )
+        )
+        self.assertEqual(ensemble.prob_exceed(10).tolist(), [50])
+
+    def test_envelope_01(self):
+        """Envelope."""
+        ensemble = simulation.Ensemble(self.previsions)
+        envelope = ensemble.envelope()
+        self.assertEqual(envelope.columns.tolist(), ['min', 'max'])
+        self.assertEqual(envelope['min'].tolist(), [10, 5])
+        self.assertEqual(envelope['max'].tolist(), [40, 15])
+        envelope = ensemble.envelope(30, 50)
+        self.assertEqual(envelope['min'].tolist(), [15, 10])
+        self.assertEqual(envelope['max'].tolist(), [20, 15])
+
+
 #-- class TestSimulation ------------------------------------------------------
 class TestSimulation(unittest.TestCase):
     """Simulation class tests."""
@@ -250,6 +383,73 @@ class TestSimulation(unittest.TestCase):
         sim = simulation.Simulation(dtprod='2012-05-18 18:36+02')
         self.assertEqual(sim.dtprod, datetime.datetime(2012, 5, 18, 16, 36))
 
+    def test_trusted_01(self):
+        """Simulation from trusted values."""
+        s = sitehydro.Sitehydro(code='A1234567')
+        m = modeleprevision.Modeleprevision(code='modele')
+        dtprod = numpy.datetime64('2012-05-18T18:36+00', 's')
+        sim = simulation.Simulation.from_trusted(
+            entite=s, modeleprevision=m, grandeur='Q', statut=16,
+            qualite=75, public=True, commentaire='rien', dtprod=dtprod
+        )
+        self.assertEqual(
+            (
+                sim.entite, sim.modeleprevision, sim.grandeur, sim.statut,
+                sim.qualite, sim.public, sim.commentaire, sim.dtprod,
+                sim.previsions
+            ),
+            (s, m, 'Q', 16, 75, True, 'rien', dtprod, None)
+        )
+        self.assertTrue(sim._strict)
+        sim = simulation.Simulation.from_trusted(
+            entite=s, modeleprevision=m, grandeur='Q'
+        )
+        self.assertEqual((sim.statut, sim.public), (4, False))
+
+    def test_ensemble_01(self):
+        """Ensemble statistics."""
+        sim = simulation.Simulation()
+        self.assertEqual(sim.ensemble, None)
+        self.assertRaises(ValueError, sim.quantile, 50)
+        previsions = simulation.Previsions.from_arrays(
+            dte=['2012-10-10T10:00+00'] * 2, res=[10, 20], prb=[0, 100]
+        )
+        sim.previsions = previsions
+        ensemble = sim.ensemble
+        self.assertTrue(sim.ensemble is ensemble)
+        self.assertEqual(sim.quantile(25).tolist(), [12.5])
+        self.assertEqual(sim.prob_exceed(12).tolist(), [80])
+        self.assertEqual(sim.envelope().values.tolist(), [[10, 20]])
+        # the ensemble is computed again with the new previsions
+        sim.previsions = previsions.copy()
+        self.assertFalse(sim.ensemble is ensemble)
+
+    def test_downsample_01(self):
+        """Downsample."""
+        # 10 dates with a peak at 05:00, 3 probabilities by date
+        dte = ['2012-10-10T%02i:00+00' % h for h in range(10)]
+        res = [1, 2, 1, 2, 1, 9, 1, 2, 1, 2]
+        sim = simulation.Simulation(
+            grandeur='Q', dtprod='2012-10-10T00:00+00',
+            previsions=simulation.Previsions.from_arrays(
+                dte * 3, [r + d for d in (-1, 0, 1) for r in res],
+                [10] * 10 + [50] * 10 + [90] * 10
+            )
+        )
+        small = sim.downsample(4)
+        self.assertEqual(len(small.previsions), 12)
+        self.assertEqual(small.grandeur, 'Q')
+        self.assertEqual(small.dtprod, sim.dtprod)
+        dates = small.ensemble.dte.astype('datetime64[s]').astype(object)
+        self.assertEqual(
+            [d.hour for d in dates.tolist()], [0, 4, 5, 9]
+        )
+        self.assertEqual(small.quantile(50).tolist(), [1, 1, 9, 2])
+        small = sim.downsample(
+            4, 'minmax', begin='2012-10-10T03:00+00', end='2012-10-10T08:00+00'
+        )
+        self.assertEqual(small.quantile(50).tolist(), [2, 1, 9, 1])
+
     def test_str_01(self):
         """Test __str__ method with minimum values."""
         # None values
@@ -119,6 +119,28 @@ class TestSitehydro(unittest.TestCase):
         s.stations = stations
         self.assertEqual(s.stations, stations)
 
+    def test_trusted_01(self):
+        """Trusted constructor test."""
+        code = 'R5330103'
+        stations = [sitehydro.Stationhydro.from_trusted(code='R533010301')]
+        s = sitehydro.Sitehydro.from_trusted(
+            code=code, typesite='SOURCE', libelle='La Seine', stations=stations
+        )
+        self.assertEqual(
+            (s.code, s.typesite, s.libelle, s.stations, s._strict),
+            (code, 'SOURCE', 'La Seine', stations, True)
+        )
+        self.assertIsNot(s.stations, stations)
+        self.assertEqual(sitehydro.Sitehydro.from_trusted(code).stations, [])
+        # the setters still work on a trusted object
+        self.assertRaises(ValueError, s.__setattr__, *('typesite', 'I'))
+
+    def test_slots_01(self):
+        """Slots test."""
+        s = sitehydro.Sitehydro(code='R5330103')
+        self.assertFalse(hasattr(s, '__dict__'))
+        self.assertRaises(AttributeError, s.__setattr__, *('foo', 'bar'))
+
     def test_str_01(self):
         """Test __str__ method with None values."""
         s = sitehydro.Sitehydro(code=0, strict=False)
@@ -281,6 +303,19 @@ class TestStationhydro(unittest.TestCase):
         s.capteurs = capteurs
         self.assertEqual(s.capteurs, capteurs)
 
+    def test_trusted_01(self):
+        """Trusted constructor test."""
+        code = 'R533010301'
+        capteurs = [sitehydro.Capteur.from_trusted(code='R53301030101')]
+        s = sitehydro.Stationhydro.from_trusted(
+            code=code, typestation='DEB', capteurs=capteurs
+        )
+        self.assertEqual(
+            (s.code, s.typestation, s.libelle, s.capteurs),
+            (code, 'DEB', None, capteurs)
+        )
+        self.assertFalse(hasattr(s, '__dict__'))
+
     def test_str_01(self):
         """Test __str__ method with None values."""
         s = sitehydro.Stationhydro(code=0, strict=False)
@@ -399,6 +434,18 @@ class TestCapteur(unittest.TestCase):
             (code, typemesure, libelle)
         )
 
+    def test_trusted_01(self):
+        """Trusted constructor test."""
+        code = 'R53301030101'
+        c = sitehydro.Capteur.from_trusted(
+            code=code, typemesure='Q', libelle='Capteur'
+        )
+        self.assertEqual(
+            (c.code, c.typemesure, c.libelle),
+            (code, 'Q', 'Capteur')
+        )
+        self.assertFalse(hasattr(c, '__dict__'))
+
     def test_str_01(self):
         """Test __str__ method with None values."""
         c = sitehydro.Capteur(code=0, strict=False)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Test program for _lazyimport.
+
+To run all tests just type:
+    './test_lazyimport.py' or 'python test_lazyimport.py'
+
+To run only a class test:
+    python -m unittest test_lazyimport.TestClass
+
+To run only a specific test:
+    python -m unittest test_lazyimport.TestClass
+    python -m unittest test_lazyimport.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import subprocess
+
+import libhydro
+from libhydro import _lazyimport
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+#-- functions -----------------------------------------------------------------
+def _imported(statements):
+    """Return the heavy modules imported by statements in a new process."""
+    code = (
+        'import sys, os\n'
+        'sys.path.append(os.path.join("..", ".."))\n'
+        '{}\n'
+        'print(",".join(m for m in ("numpy", "pandas", "lxml") '
+        'if m in sys.modules))\n'.format(statements)
+    )
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return [m for m in output.decode('ascii').strip().split(',') if m]
+
+
+#-- class TestLazyPackage -----------------------------------------------------
+class TestLazyPackage(unittest.TestCase):
+    """LazyPackage class tests."""
+
+    def test_base_01(self):
+        """Packages are lazy."""
+        for package in (
+            libhydro, libhydro.core, libhydro.conv, libhydro.conv.xml,
+            libhydro.calc
+        ):
+            self.assertTrue(isinstance(package, _lazyimport.LazyPackage))
+        self.assertTrue(
+            libhydro.core.sitehydro is sys.modules['libhydro.core.sitehydro']
+        )
+        self.assertTrue(
+            libhydro.conv.shom is sys.modules['libhydro.conv.shom']
+        )
+        self.assertTrue(
+            libhydro.conv.shom.serie_from_hfs is
+            sys.modules['libhydro.conv.shom.shom'].serie_from_hfs
+        )
+        self.assertTrue(
+            libhydro.conv.xml.Message is
+            sys.modules['libhydro.conv.xml.xml'].Message
+        )
+        self.assertTrue('Message' in dir(libhydro.conv.xml))
+
+    def test_base_02(self):
+        """Heavy dependencies are imported on first use."""
+        self.assertEqual(_imported('import libhydro.conv'), [])
+        self.assertEqual(
+            _imported('from libhydro.core import (sitehydro, registre)'), []
+        )
+        self.assertEqual(
+            _imported('from libhydro.core import obshydro'),
+            ['numpy', 'pandas']
+        )
+        self.assertEqual(
+            _imported('from libhydro.conv.xml import Message'),
+            ['numpy', 'pandas', 'lxml']
+        )
+
+    def test_base_03(self):
+        """The converters do not depend on the import order."""
+        for statements in (
+            'import libhydro.conv.shom.shom\n'
+            'import libhydro.conv.archive.archive',
+            'from libhydro.conv.shom import shom\n'
+            'from libhydro.conv.archive import archive',
+            'import libhydro.conv'
+        ):
+            code = (
+                'import sys, os\n'
+                'sys.path.append(os.path.join("..", ".."))\n'
+                '{}\n'
+                'from libhydro.conv import shom, archive\n'
+                'shom.serie_from_hfs, shom.simulation_from_hfs\n'
+                'archive.serie_to_archive, archive.serie_from_archive\n'
+                'archive.blocks\n'.format(statements)
+            )
+            self.assertEqual(
+                subprocess.call([sys.executable, '-c', code]), 0, statements
+            )
+
+    def test_error_01(self):
+        """Unknown attribute."""
+        self.assertRaises(AttributeError, getattr, libhydro.core, 'unknown')
+        self.assertFalse(hasattr(libhydro.conv, 'unknown'))
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,7 @@ sys.path.append(os.path.join('..', '..'))
 
 import unittest
 import datetime
+import threading
 
 from libhydro.conv.xml import (_from_xml as from_xml)
 
@@ -118,16 +119,37 @@ class TestFromXmlSitesHydros(unittest.TestCase):
         self.assertEqual(capteurs[1].code, 'O17125100101')
         self.assertEqual(capteurs[1].typemesure, 'H')
 
-    def test_error_1(self):
-        """Xml file with namespace error test."""
-        self.assertRaises(
-            ValueError,
-            from_xml._parse,
-            # *([os.path.join('data', 'xml', '1.1', 'siteshydro.xml')])
-            *([os.path.join(
-                'data', 'xml', '1.1', 'siteshydro_with_namespace.xml'
-            )])
+    def test_namespace(self):
+        """Xml file with namespace test."""
+        src = os.path.join(
+            'data', 'xml', '1.1', 'siteshydro_with_namespace.xml'
         )
+        for kargs in ({}, {'validate': True}, {'trusted': True}):
+            data = from_xml._parse(src, **kargs)
+            self.assertEqual(
+                data['scenario'].dtprod,
+                datetime.datetime(2010, 2, 26, 12, 53, 10)
+            )
+            self.assertEqual(len(data['siteshydro']), 1)
+            self.assertEqual(data['siteshydro'][0].code, 'A1984310')
+            self.assertEqual(data['siteshydro'][0].typesite, 'REEL')
+
+
+#-- class TestFromXmlParser --------------------------------------------------
+class TestFromXmlParser(unittest.TestCase):
+    """FromXmlParser class tests."""
+
+    def test_base(self):
+        """One parser by thread."""
+        parser = from_xml._parser()
+        self.assertIs(from_xml._parser(), parser)
+        parsers = []
+        thread = threading.Thread(
+            target=lambda: parsers.append(from_xml._parser())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(parsers[0], parser)
 
 
 #-- class TestFromXmlSitesMeteo ----------------------------------------------
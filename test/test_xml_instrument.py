@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Test program for xml._instrument.
+
+To run all tests just type:
+    './test_xml_instrument.py' or 'python test_xml_instrument.py'
+
+To run only a class test:
+    python -m unittest test_xml_instrument.TestClass
+
+To run only a specific test:
+    python -m unittest test_xml_instrument.TestClass
+    python -m unittest test_xml_instrument.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+import tempfile
+import shutil
+
+import unittest
+
+from libhydro.conv.xml import (Message, Instrument, _instrument)
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+FILES_PATH = os.path.join('data', 'xml', '1.1')
+
+
+#-- class TestInstrument ------------------------------------------------------
+class TestInstrument(unittest.TestCase):
+    """Instrument class tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.file_obs = os.path.join(FILES_PATH, 'obsshydro.xml')
+        self.file_sim = os.path.join(FILES_PATH, 'simulations.xml')
+        self.tmp_dir = tempfile.mkdtemp(prefix='test_xml_')
+        self.tmp_file = os.path.join(self.tmp_dir, 'msg.xml')
+
+    def tearDown(self):
+        """Hook method for deconstructing the test fixture after testing it."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_base_01(self):
+        """Read and write a message of series."""
+        with Instrument() as instrument:
+            self.assertTrue(_instrument.enabled())
+            msg = Message.from_file(self.file_obs)
+            msg.write(self.tmp_file, force=True)
+        self.assertFalse(_instrument.enabled())
+        for stage in (
+            'read.parse', 'read.scenario', 'read.series',
+            'read.observations', 'read.observations.build',
+            'write.build', 'write.observations', 'write.serialize'
+        ):
+            self.assertIn(stage, instrument.times)
+        self.assertEqual(instrument.calls['read.observations'], 3)
+        self.assertEqual(instrument.counts['read.series'], 3)
+        self.assertEqual(
+            instrument.counts['read.observations'],
+            sum(len(serie.observations) for serie in msg.series)
+        )
+        self.assertEqual(
+            instrument.counts['write.observations'],
+            instrument.counts['read.observations']
+        )
+        self.assertEqual(
+            instrument.counts['read.bytes'], os.path.getsize(self.file_obs)
+        )
+        self.assertEqual(
+            instrument.counts['write.bytes'], os.path.getsize(self.tmp_file)
+        )
+        self.assertTrue(instrument.counts['read.elements'] > 0)
+
+    def test_base_02(self):
+        """Callbacks and simulations."""
+        times, counts = [], []
+        with Instrument(
+            ontime=lambda stage, seconds: times.append(stage),
+            oncount=lambda name, n: counts.append((name, n))
+        ) as instrument:
+            msg = Message.from_file(self.file_sim)
+        self.assertIn('read.previsions', times)
+        self.assertIn(('read.simulations', len(msg.simulations)), counts)
+        self.assertEqual(
+            instrument.counts['read.previsions'],
+            sum(len(simul.previsions) for simul in msg.simulations)
+        )
+        self.assertTrue(unicode(instrument).startswith('Instrument'))
+        instrument.reset()
+        self.assertEqual(len(instrument.times), 0)
+
+    def test_base_03(self):
+        """Disabled instrumentation."""
+        instrument = Instrument()
+        Message.from_file(self.file_obs)
+        self.assertEqual(len(instrument.times), 0)
+        self.assertIs(
+            _instrument.stage('read.parse'), _instrument._NULL_STAGE
+        )
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
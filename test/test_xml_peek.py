@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Test program for xml._peek.
+
+To run all tests just type:
+    './test_xml_peek.py' or 'python test_xml_peek.py'
+
+To run only a class test:
+    python -m unittest test_xml_peek.TestClass
+
+To run only a specific test:
+    python -m unittest test_xml_peek.TestClass
+    python -m unittest test_xml_peek.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+
+import unittest
+import io
+import gzip
+import shutil
+import tempfile
+
+from lxml import etree
+
+from libhydro.conv.xml import (Message, peek)
+from libhydro.conv.xml import _peek
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+FILES_PATH = os.path.join('data', 'xml', '1.1')
+
+
+#-- class TestPeek ------------------------------------------------------------
+class TestPeek(unittest.TestCase):
+    """Peek function tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Hook method for deconstructing the test fixture after testing it."""
+        shutil.rmtree(self.tmp)
+        _peek.PEEK = 4 * 1024
+
+    def assertScenarioEqual(self, scenario, other):
+        """Check that the 2 scenarios are equal."""
+        self.assertEqual(
+            (
+                scenario.emetteur.code, scenario.emetteur.intervenant.code,
+                scenario.destinataire.code, scenario.dtprod
+            ),
+            (
+                other.emetteur.code, other.emetteur.intervenant.code,
+                other.destinataire.code, other.dtprod
+            )
+        )
+
+    def test_base_01(self):
+        """Scenario of a file."""
+        for name in ('obsshydro.xml', 'siteshydro_with_namespace.xml'):
+            src = os.path.join(FILES_PATH, name)
+            self.assertScenarioEqual(
+                peek(src), Message.from_file(src).scenario
+            )
+
+    def test_base_02(self):
+        """Counts."""
+        for name in ('obsshydro.xml', 'simulations.xml', 'siteshydro.xml'):
+            src = os.path.join(FILES_PATH, name)
+            message = Message.from_file(src)
+            expected = {
+                'series': len(message.series or []),
+                'simulations': len(message.simulations or [])
+            }
+            for size in (4 * 1024, 7):
+                _peek.PEEK = size
+                scenario, counts = peek(src, count=True)
+                self.assertScenarioEqual(scenario, message.scenario)
+                self.assertEqual(counts, expected)
+
+    def test_base_03(self):
+        """Only the head of the file is read."""
+        src = os.path.join(FILES_PATH, 'siteshydro.xml')
+        _peek.PEEK = 1024
+        with io.open(src, 'rb') as f:
+            self.assertTrue(peek(f) is not None)
+            self.assertEqual(f.tell(), 1024)
+
+    def test_base_04(self):
+        """Compressed file."""
+        src = os.path.join(FILES_PATH, 'simulations.xml')
+        dst = os.path.join(self.tmp, 'simulations.xml.gz')
+        with io.open(src, 'rb') as f, gzip.open(dst, 'wb') as g:
+            g.write(f.read())
+        scenario, counts = peek(dst, count=True)
+        self.assertScenarioEqual(scenario, Message.from_file(src).scenario)
+        self.assertEqual(counts, {'series': 0, 'simulations': 3})
+
+    def test_base_05(self):
+        """Message without scenario."""
+        src = io.BytesIO(
+            b'<hydrometrie><Donnees><Series><Serie/><Serie>'
+            b'</Serie></Series></Donnees></hydrometrie>'
+        )
+        self.assertEqual(
+            peek(src, count=True),
+            (None, {'series': 2, 'simulations': 0})
+        )
+
+    def test_error_01(self):
+        """Malformed message."""
+        src = io.BytesIO(b'<hydrometrie><Scenario></hydrometrie>')
+        self.assertRaises(etree.XMLSyntaxError, peek, src)
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""Test program for xml._stream and Message.from_files.
+
+To run all tests just type:
+    './test_xml_stream.py' or 'python test_xml_stream.py'
+
+To run only a class test:
+    python -m unittest test_xml_stream.TestClass
+
+To run only a specific test:
+    python -m unittest test_xml_stream.TestClass
+    python -m unittest test_xml_stream.TestClass.test_method
+
+"""
+#-- imports -------------------------------------------------------------------
+from __future__ import (
+    unicode_literals as _unicode_literals,
+    absolute_import as _absolute_import,
+    division as _division,
+    print_function as _print_function
+)
+
+import sys
+import os
+sys.path.append(os.path.join('..', '..'))
+from multiprocessing.pool import ThreadPool
+
+import unittest
+
+from lxml import etree
+
+from libhydro.core import (sitehydro, obshydro, simulation, registre)
+from libhydro.conv.xml import (Message, MessageParser)
+
+
+#-- strings -------------------------------------------------------------------
+__author__ = """Philippe Gouin <philippe.gouin@developpement-durable.gouv.fr>"""
+__version__ = """0.1a"""
+__date__ = """2026-10-19"""
+
+#HISTORY
+#V0.1 - 2026-10-19
+#    first shot
+
+
+# -- config -------------------------------------------------------------------
+FILES_PATH = os.path.join('data', 'xml', '1.1')
+
+
+#-- functions -----------------------------------------------------------------
+def _feed(parser, src, size):
+    """Feed parser with src by chunks of size bytes, return the objects."""
+    with open(src, 'rb') as f:
+        data = f.read()
+    objects = []
+    for i in range(0, len(data), size):
+        objects.extend(parser.feed(data[i:i + size]))
+    objects.extend(parser.close())
+    return objects
+
+
+#-- class TestMessageParser ---------------------------------------------------
+class TestMessageParser(unittest.TestCase):
+    """MessageParser class tests."""
+
+    def test_base_01(self):
+        """Series and simulations."""
+        for name in ('obsshydro.xml', 'simulations.xml'):
+            src = os.path.join(FILES_PATH, name)
+            expected = Message.from_file(src)
+            for size in (1, 100, 1000000):
+                parser = MessageParser()
+                objects = _feed(parser, src, size)
+                self.assertEqual(
+                    parser.scenario.dtprod, expected.scenario.dtprod
+                )
+                if expected.series:
+                    self.assertEqual(len(objects), len(expected.series))
+                    for serie, other in zip(objects, expected.series):
+                        self.assertIsInstance(serie, obshydro.Serie)
+                        self.assertEqual(serie.entite.code, other.entite.code)
+                        self.assertTrue(
+                            (serie.observations == other.observations)
+                            .all().all()
+                        )
+                else:
+                    self.assertEqual(len(objects), len(expected.simulations))
+                    for simul, other in zip(objects, expected.simulations):
+                        self.assertIsInstance(simul, simulation.Simulation)
+                        self.assertTrue(
+                            (simul.previsions == other.previsions).all()
+                        )
+
+    def test_base_02(self):
+        """Sites, namespaces and registre."""
+        reg = registre.Registre()
+        parser = MessageParser(registre=reg)
+        objects = _feed(
+            parser, os.path.join(FILES_PATH, 'siteshydro.xml'), 512
+        )
+        self.assertEqual(len(objects), 4)
+        self.assertIsInstance(objects[0], sitehydro.Sitehydro)
+        self.assertIs(reg.get(sitehydro.Sitehydro, 'A1984310'), objects[0])
+        objects = _feed(
+            MessageParser(),
+            os.path.join(FILES_PATH, 'siteshydro_with_namespace.xml'), 512
+        )
+        self.assertEqual([site.code for site in objects], ['A1984310'])
+
+    def test_base_03(self):
+        """Objects are returned as soon as they are complete."""
+        with open(os.path.join(FILES_PATH, 'obsshydro.xml'), 'rb') as f:
+            data = f.read()
+        end = data.find(b'</Serie>') + len(b'</Serie>')
+        parser = MessageParser()
+        self.assertEqual(parser.feed(data[:end - 1]), [])
+        self.assertIsNotNone(parser.scenario)
+        self.assertEqual(len(parser.feed(data[end - 1:end])), 1)
+
+    def test_error_01(self):
+        """Truncated message."""
+        parser = MessageParser()
+        with open(os.path.join(FILES_PATH, 'obsshydro.xml'), 'rb') as f:
+            parser.feed(f.read(2000))
+        self.assertRaises(etree.XMLSyntaxError, parser.close)
+
+
+#-- class TestFromFiles -------------------------------------------------------
+class TestFromFiles(unittest.TestCase):
+    """Message.from_files tests."""
+
+    def setUp(self):
+        """Hook method for setting up the test fixture before exercising it."""
+        self.srcs = [
+            os.path.join(FILES_PATH, name) for name in (
+                'obsshydro.xml', 'simulations.xml', 'siteshydro.xml'
+            )
+        ]
+
+    def test_base_01(self):
+        """With and without executor."""
+        pool = ThreadPool(2)
+        try:
+            for executor in (None, pool):
+                msgs = Message.from_files(
+                    self.srcs, executor=executor, trusted=True
+                )
+                self.assertEqual(
+                    [
+                        (
+                            len(msg.series or []),
+                            len(msg.simulations or []),
+                            len(msg.siteshydro or [])
+                        ) for msg in msgs
+                    ],
+                    [(3, 0, 0), (0, 3, 0), (0, 0, 4)]
+                )
+        finally:
+            pool.close()
+
+    def test_error_01(self):
+        """Registre with an executor."""
+        pool = ThreadPool(1)
+        try:
+            self.assertRaises(
+                ValueError,
+                Message.from_files,
+                self.srcs, executor=pool, registre=registre.Registre()
+            )
+        finally:
+            pool.close()
+
+
+#-- main ----------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
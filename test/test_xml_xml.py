@@ -30,8 +30,9 @@ import unittest
 
 import datetime
 import numpy
+from lxml import etree
 
-from libhydro.core import intervenant
+from libhydro.core import (intervenant, registre, _lazy)
 from libhydro.conv.xml import (Scenario, Message)
 
 
@@ -47,6 +48,7 @@ __date__ = """2013-09-05"""
 
 # -- config -------------------------------------------------------------------
 FILES_PATH = os.path.join('data', 'xml', '1.1')
+_NAMESPACE = 'http://xml.sandre.eaufrance.fr/scenario/hydrometrie/1.1'
 
 
 #-- class TestScenario --------------------------------------------------------
@@ -193,11 +195,107 @@ class TestMessage(unittest.TestCase):
 
     def test_base_05(self):
         """Message from file with namespaces."""
-        self.assertRaises(
-            ValueError,
-            Message.from_file,
-            *((os.path.join(FILES_PATH, 'siteshydro_with_namespace.xml')), )
+        msg = Message.from_file(
+            os.path.join(FILES_PATH, 'siteshydro_with_namespace.xml')
         )
+        self.assertEqual(msg.siteshydro[0].code, 'A1984310')
+        # messages of series and simulations with a prefixed namespace
+        for src in (self.file_obs, self.file_sim):
+            tree = etree.parse(src)
+            for element in tree.iter(etree.Element):
+                element.tag = '{%s}%s' % (_NAMESPACE, element.tag)
+            tree.write(self.tmp_file)
+            expected = Message.from_file(src)
+            for kargs in (
+                {}, {'validate': True}, {'trusted': True}, {'lazy': True}
+            ):
+                msg = Message.from_file(self.tmp_file, **kargs)
+                for serie, other in zip(
+                    msg.series or [], expected.series or []
+                ):
+                    self.assertEqual(serie.entite.code, other.entite.code)
+                    self.assertTrue(
+                        (serie.observations == other.observations).all().all()
+                    )
+                for simul, other in zip(
+                    msg.simulations or [], expected.simulations or []
+                ):
+                    self.assertEqual(
+                        simul.modeleprevision.code,
+                        other.modeleprevision.code
+                    )
+                    self.assertEqual(
+                        simul.previsions.index.tolist(),
+                        other.previsions.index.tolist()
+                    )
+                    self.assertTrue(
+                        (simul.previsions == other.previsions).all()
+                    )
+                self.assertEqual(
+                    len(msg.series or []), len(expected.series or [])
+                )
+                self.assertEqual(
+                    len(msg.simulations or []),
+                    len(expected.simulations or [])
+                )
+
+    def test_base_06(self):
+        """Message from file with a registre."""
+        reg = registre.Registre()
+        msg1 = Message.from_file(self.file_sim, registre=reg)
+        msg2 = Message.from_file(self.file_sim, registre=reg)
+        self.assertIs(msg1.simulations[0].entite, msg2.simulations[2].entite)
+        self.assertEqual(reg.misses, 5)
+
+    def test_base_07(self):
+        """Message from file with lazy decoding."""
+        msg = Message.from_file(self.file_obs)
+        lazy = Message.from_file(self.file_obs, lazy=True)
+        self.assertIsInstance(lazy.series[0]._observations, _lazy.Lazy)
+        for serie, expected in zip(lazy.series, msg.series):
+            self.assertTrue(
+                (serie.observations == expected.observations).all().all()
+            )
+        self.assertNotIsInstance(lazy.series[0]._observations, _lazy.Lazy)
+        msg = Message.from_file(self.file_sim)
+        lazy = Message.from_file(self.file_sim, lazy=True)
+        self.assertIsInstance(lazy.simulations[0]._previsions, _lazy.Lazy)
+        lazy.write(self.tmp_file, force=True)
+        for simulation, expected in zip(lazy.simulations, msg.simulations):
+            self.assertTrue(
+                (simulation.previsions == expected.previsions).all()
+            )
+
+    def test_base_08(self):
+        """Message from file with validation and trusted decoding."""
+        for src in (self.file_sit, self.file_obs, self.file_sim):
+            msg = Message.from_file(src)
+            valid = Message.from_file(src, validate=True)
+            self.assertEqual(
+                len(valid.siteshydro or []), len(msg.siteshydro or [])
+            )
+            trusted = Message.from_file(src, trusted=True)
+            for serie, expected in zip(trusted.series or [], msg.series or []):
+                self.assertEqual(serie.entite.code, expected.entite.code)
+                self.assertEqual(serie.statut, expected.statut)
+                self.assertTrue(
+                    (serie.observations == expected.observations).all().all()
+                )
+            for simulation, expected in zip(
+                trusted.simulations or [], msg.simulations or []
+            ):
+                self.assertEqual(simulation.dtprod, expected.dtprod)
+                self.assertEqual(simulation.public, expected.public)
+                self.assertEqual(
+                    simulation.previsions.index.tolist(),
+                    expected.previsions.index.tolist()
+                )
+                self.assertTrue(
+                    (simulation.previsions == expected.previsions).all()
+                )
+            # a trusted message can be written
+            trusted.write(self.tmp_file, force=True)
+            Message.from_file(self.tmp_file, validate=True)
 
     def test_str_01(self):
         """Test __str__ method with basic values."""
@@ -264,6 +362,62 @@ class TestMessage(unittest.TestCase):
             **{'scenario': scenario, 'simulations': 'simulations'}
         )
 
+    def test_error_05(self):
+        """Invalid message."""
+        with open(self.file_obs, 'rb') as f:
+            content = f.read()
+        with open(self.tmp_file, 'wb') as f:
+            f.write(content.replace(b'<GrdSerie>Q<', b'<GrdSerie>X<', 1))
+        # the bad grandeur is only checked on validation
+        self.assertRaises(
+            ValueError,
+            Message.from_file, self.tmp_file, validate=True
+        )
+        self.assertRaises(
+            ValueError,
+            Message.from_file, self.tmp_file, trusted=True
+        )
+
+    def test_timezone_01(self):
+        """Dates with the Z and negative time zones."""
+        with open(self.file_obs, 'rb') as f:
+            content = f.read()
+        with open(self.tmp_file, 'wb') as f:
+            f.write(content.replace(
+                b'2010-02-26T13:10:00+02:00', b'2010-02-26T09:10:00-02:00', 1
+            ).replace(
+                b'2010-02-26T13:15:00+02<', b'2010-02-26T11:15:00Z<', 1
+            ))
+        expected = Message.from_file(self.file_obs).series[0].observations
+        for trusted in (False, True):
+            msg = Message.from_file(
+                self.tmp_file, validate=True, trusted=trusted
+            )
+            observations = msg.series[0].observations
+            self.assertTrue(
+                (observations.index.values == expected.index.values).all()
+            )
+        with open(self.file_sim, 'rb') as f:
+            content = f.read()
+        with open(self.tmp_file, 'wb') as f:
+            f.write(content.replace(
+                b'<DtProdSimul>2010-02-26T14:45:00<',
+                b'<DtProdSimul>2010-02-26T13:45:00-01:00<', 1
+            ).replace(
+                b'<DtPrev>2010-02-26T14:00:00<',
+                b'<DtPrev>2010-02-26T14:00:00Z<', 1
+            ))
+        expected = Message.from_file(self.file_sim).simulations[0]
+        for trusted in (False, True):
+            simulation = Message.from_file(
+                self.tmp_file, validate=True, trusted=trusted
+            ).simulations[0]
+            self.assertEqual(simulation.dtprod, expected.dtprod)
+            self.assertTrue(
+                (simulation.previsions.index.get_level_values(0).values ==
+                 expected.previsions.index.get_level_values(0).values).all()
+            )
+
     def test_add_01(self):
         """Add elements to message."""
         msg = Message.from_file(self.file_sit)